@@ -0,0 +1,363 @@
+"""
+Duplicate detection for the Entries
+
+The titles are compared through their fingerprint, the sha1 of the normalized
+title, stored on the Entry (Entry.title_fingerprint), an exact duplicate is
+found with a single indexed lookup
+>>> Entry.objects.filter(title_fingerprint=title_fingerprint(title)).exists()
+
+Near duplicates, the titles with small edits, are found by RecentTitles, an
+in memory MinHash LSH index over the titles of a group of publications since
+a number of days, kept up to date incrementally. It is opt-in, see
+ENTRY_NEAR_DUPLICATE_TITLES
+>>> get_recent_titles([2, 3], days=2).similar(title)
+[entry id, ...]
+
+The bodies are compared through the MinHash signature of their word pairs,
+as the titles, the signature is cut in BODY_MINHASH_BANDS bands, two bodies
+sharing a band are candidates, kept when the share of equal signature values,
+an estimate of the jaccard similarity of the word pairs, reaches
+BODY_SIMILARITY. See EntryFingerprint (stored, kept up to date by
+Entry.save()) and BodyIndex (in memory), and benchmark_duplicates for the
+recall
+>>> EntryFingerprint.objects.near(body_signature(body_tokens(entry.body_html)))
+"""
+import hashlib
+import heapq
+import random
+import re
+import struct
+import threading
+import zlib
+from collections import OrderedDict, defaultdict
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+
+from cutils.utils import unicode_to_ascii
+
+NEAR_DUPLICATE_TITLES = getattr(settings, 'ENTRY_NEAR_DUPLICATE_TITLES', False)
+# minimum jaccard similarity of the title shingles of two near duplicates
+TITLE_SIMILARITY = getattr(settings, 'ENTRY_TITLE_SIMILARITY', 0.8)
+
+SHINGLE_SIZE = 4
+MINHASH_PERMUTATIONS = 32
+# 8 bands of 4 rows, pairs above ~0.6 similarity share a bucket
+MINHASH_BANDS = 8
+# number of RecentTitles indexes kept per process
+RECENT_TITLES_INDEXES = 16
+
+BODY_DUPLICATES = getattr(settings, 'ENTRY_BODY_DUPLICATES', True)
+# entries created this many days before an entry are compared to it
+BODY_DUPLICATE_DAYS = getattr(settings, 'ENTRY_BODY_DUPLICATE_DAYS', 7)
+# bodies with fewer words are not fingerprinted
+BODY_MIN_WORDS = getattr(settings, 'ENTRY_BODY_MIN_WORDS', 30)
+# minimum similarity of the signatures of two near duplicate bodies, 10 words
+# changed in a 150 words body leave ~0.7 of the word pairs in common
+BODY_SIMILARITY = getattr(settings, 'ENTRY_BODY_SIMILARITY', 0.6)
+BODY_SHINGLE_WORDS = 2
+# 16 bands of 4 rows, a pair above ~0.5 similarity shares a band, the
+# unrelated bodies almost never do, see benchmark_duplicates
+BODY_MINHASH_BANDS = 16
+BODY_MINHASH_ROWS = 4
+
+NON_WORD_RE = re.compile(r'[^a-z0-9]+')
+TAG_RE = re.compile(r'<[^>]*>')
+
+# multiply-shift hash functions, the products stay within a machine int
+_random = random.Random(1)
+_PERMUTATIONS = [(_random.randint(1, 1 << 30) * 2 + 1, _random.randint(0, 1 << 31))
+                 for i in range(MINHASH_PERMUTATIONS)]
+_BODY_PERMUTATIONS = [(_random.randint(1, 1 << 30) * 2 + 1, _random.randint(0, 1 << 31))
+                      for i in range(BODY_MINHASH_BANDS * BODY_MINHASH_ROWS)]
+
+
+def normalize_title(title):
+    """
+    returns the title in lower case ascii, punctuation removed and whitespace
+    collapsed
+    """
+    title = title or u''
+    if isinstance(title, str):
+        title = title.decode('utf-8', 'ignore')
+    return NON_WORD_RE.sub(' ', unicode_to_ascii(title).lower()).strip()
+
+
+def title_fingerprint(title):
+    """
+    returns the sha1 of the normalized title, '' for an empty title
+    """
+    normalized = normalize_title(title)
+    if not normalized:
+        return ''
+    return hashlib.sha1(normalized).hexdigest()
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """
+    returns the set of the character n-grams of the text
+    """
+    if len(text) <= size:
+        return set([text]) if text else set()
+    return set(text[i:i + size] for i in range(len(text) - size + 1))
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / float(len(a | b))
+
+
+def minhash(shingle_set, permutations=_PERMUTATIONS):
+    """
+    returns the MinHash signature of the set of shingles
+    """
+    hashes = [zlib.crc32(s) & 0xffffffff for s in shingle_set] or [0]
+    return tuple(min(((a * h + b) >> 16) & 0xffffffff for h in hashes) for a, b in permutations)
+
+
+class MinHashLSH(object):
+    """
+    buckets the signatures by band, the keys sharing at least one band with a
+    signature are its candidates
+    """
+    def __init__(self, bands=MINHASH_BANDS):
+        self.bands = bands
+        self.rows = MINHASH_PERMUTATIONS // bands
+        self.buckets = defaultdict(set)
+        self.signatures = {}
+
+    def band_keys(self, signature):
+        return [(i, signature[i * self.rows:(i + 1) * self.rows]) for i in range(self.bands)]
+
+    def add(self, key, signature):
+        self.remove(key)
+        self.signatures[key] = signature
+        for band_key in self.band_keys(signature):
+            self.buckets[band_key].add(key)
+
+    def remove(self, key):
+        signature = self.signatures.pop(key, None)
+        if signature is None:
+            return
+        for band_key in self.band_keys(signature):
+            bucket = self.buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self.buckets[band_key]
+
+    def candidates(self, signature):
+        found = set()
+        for band_key in self.band_keys(signature):
+            found.update(self.buckets.get(band_key, ()))
+        return found
+
+    def __len__(self):
+        return len(self.signatures)
+
+
+class RecentTitles(object):
+    """
+    index of the titles of the Entries of the publications created since
+    midnight `days` ago. Every lookup first reads the Entries updated since
+    the previous one and drops the ones that went out of the window
+    """
+    def __init__(self, publication_ids, days=2, threshold=TITLE_SIMILARITY):
+        self.publication_ids = sorted(publication_ids)
+        self.days = days
+        self.threshold = threshold
+        self.lsh = MinHashLSH()
+        self.shingles = {}
+        self.created = {}
+        # (created_on, entry id), oldest first
+        self.expiry = []
+        self.watermark = None
+        self.lock = threading.Lock()
+
+    def window_start(self, now=None):
+        today = (now or datetime.now()).date()
+        return datetime.combine(today, time.min) - timedelta(days=self.days)
+
+    def add(self, entry_id, title, created_on):
+        shingle_set = shingles(normalize_title(title))
+        self.shingles[entry_id] = shingle_set
+        self.lsh.add(entry_id, minhash(shingle_set))
+        if self.created.get(entry_id) != created_on:
+            self.created[entry_id] = created_on
+            heapq.heappush(self.expiry, (created_on, entry_id))
+
+    def remove(self, entry_id):
+        self.lsh.remove(entry_id)
+        self.shingles.pop(entry_id, None)
+        self.created.pop(entry_id, None)
+
+    def refresh(self, now=None):
+        from content_management.models import Entry
+
+        start = self.window_start(now)
+        rows = Entry.objects.filter(publication__id__in=self.publication_ids, created_on__gte=start)
+        if self.watermark is not None:
+            rows = rows.filter(updated_on__gte=self.watermark)
+        for entry_id, title, created_on, updated_on in rows.values_list(
+                'id', 'title', 'created_on', 'updated_on').order_by():
+            self.add(entry_id, title, created_on)
+            if self.watermark is None or updated_on > self.watermark:
+                self.watermark = updated_on
+
+        while self.expiry and self.expiry[0][0] < start:
+            created_on, entry_id = heapq.heappop(self.expiry)
+            if self.created.get(entry_id) == created_on:
+                self.remove(entry_id)
+
+    def similar(self, title, exclude_id=None, now=None):
+        """
+        returns the ids of the Entries whose title is a near duplicate of the
+        title
+        """
+        shingle_set = shingles(normalize_title(title))
+        if not shingle_set:
+            return []
+        with self.lock:
+            self.refresh(now)
+            return [entry_id for entry_id in self.lsh.candidates(minhash(shingle_set))
+                    if entry_id != exclude_id and
+                    jaccard(shingle_set, self.shingles[entry_id]) >= self.threshold]
+
+
+_recent_titles = OrderedDict()
+_recent_titles_lock = threading.Lock()
+
+
+def get_recent_titles(publication_ids, days=2):
+    """
+    returns the RecentTitles index of the publications, the least recently
+    used indexes are dropped past RECENT_TITLES_INDEXES
+    """
+    key = (tuple(sorted(publication_ids)), days)
+    with _recent_titles_lock:
+        index = _recent_titles.pop(key, None)
+        if index is None:
+            index = RecentTitles(publication_ids, days)
+        _recent_titles[key] = index
+        while len(_recent_titles) > RECENT_TITLES_INDEXES:
+            _recent_titles.popitem(last=False)
+    return index
+
+
+def body_tokens(html):
+    """
+    returns the words of the html, tags removed, in lower case ascii
+    """
+    html = html or u''
+    if isinstance(html, str):
+        html = html.decode('utf-8', 'ignore')
+    return NON_WORD_RE.sub(' ', unicode_to_ascii(TAG_RE.sub(' ', html)).lower()).split()
+
+
+def body_shingles(tokens, size=BODY_SHINGLE_WORDS):
+    """
+    returns the set of the word n-grams of the tokens
+    """
+    return set(' '.join(tokens[i:i + size]) for i in range(max(len(tokens) - size + 1, 1)))
+
+
+def body_signature(tokens, min_words=BODY_MIN_WORDS):
+    """
+    returns the MinHash signature of the word pairs of the tokens, None when
+    there are fewer than min_words tokens
+    """
+    if len(tokens) < max(min_words, 1):
+        return None
+    return minhash(body_shingles(tokens), _BODY_PERMUTATIONS)
+
+
+def signature_similarity(a, b):
+    """
+    returns the share of equal values of the signatures, an estimate of the
+    jaccard similarity of the shingles
+    """
+    return sum(1 for x, y in zip(a, b) if x == y) / float(len(a))
+
+
+def band_keys(signature):
+    """
+    returns the keys of the bands of the signature, as stored in
+    EntryFingerprint.band0-15
+    """
+    rows = BODY_MINHASH_ROWS
+    return [zlib.crc32(pack_signature(signature[i * rows:(i + 1) * rows]))
+            for i in range(BODY_MINHASH_BANDS)]
+
+
+def pack_signature(signature):
+    return struct.pack('<%dI' % len(signature), *signature)
+
+
+def unpack_signature(data):
+    data = str(data)
+    return struct.unpack('<%dI' % (len(data) // 4), data)
+
+
+class BodyIndex(object):
+    """
+    in memory index of the body signatures, keyed as in EntryFingerprint, the
+    signatures are kept packed, a window of 100k entries takes ~220MB
+    """
+    def __init__(self, threshold=BODY_SIMILARITY):
+        self.threshold = threshold
+        # band << 32 | band key -> key, or list of keys when several share it
+        self.buckets = {}
+        self.signatures = {}
+
+    def bucket_keys(self, signature):
+        return [i << 32 | band_key & 0xffffffff for i, band_key in enumerate(band_keys(signature))]
+
+    def add(self, key, signature):
+        self.remove(key)
+        self.signatures[key] = pack_signature(signature)
+        for band_key in self.bucket_keys(signature):
+            keys = self.buckets.get(band_key)
+            if keys is None:
+                self.buckets[band_key] = key
+            elif isinstance(keys, list):
+                keys.append(key)
+            else:
+                self.buckets[band_key] = [keys, key]
+
+    def remove(self, key):
+        packed = self.signatures.pop(key, None)
+        if packed is None:
+            return
+        for band_key in self.bucket_keys(unpack_signature(packed)):
+            keys = self.buckets.get(band_key)
+            if isinstance(keys, list):
+                keys.remove(key)
+                if len(keys) == 1:
+                    self.buckets[band_key] = keys[0]
+            elif keys == key:
+                del self.buckets[band_key]
+
+    def candidates(self, signature):
+        found = set()
+        for band_key in self.bucket_keys(signature):
+            keys = self.buckets.get(band_key)
+            if isinstance(keys, list):
+                found.update(keys)
+            elif keys is not None:
+                found.add(keys)
+        return found
+
+    def near(self, signature):
+        """
+        returns the {key: similarity} of the bodies similar to the signature
+        """
+        found = {}
+        for key in self.candidates(signature):
+            similarity = signature_similarity(signature, unpack_signature(self.signatures[key]))
+            if similarity >= self.threshold:
+                found[key] = similarity
+        return found
+
+    def __len__(self):
+        return len(self.signatures)
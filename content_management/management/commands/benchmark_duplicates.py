@@ -0,0 +1,114 @@
+import gc
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Measures the recall and the time of EntryFingerprint.objects.near(), the lookup run by ' \
+           'Entry.save(), on the fingerprinted entries: the bodies of a sample of them are edited, ' \
+           'a number of words replaced, fingerprinted again and looked up. Run fingerprint_entry_bodies first, ' \
+           'or --generate a synthetic corpus.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queries', type=int, default=1000,
+                            help='number of fingerprinted entries edited and looked up per edit count')
+        parser.add_argument('--edits', default='0,1,5,10,15,20',
+                            help='comma separated numbers of words replaced in the bodies')
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--generate', type=int, default=0,
+                            help='first create and fingerprint GENERATE entries with synthetic bodies, '
+                                 'in the publication given by --publication')
+        parser.add_argument('--publication', type=int, help='id of the publication of the generated entries')
+        parser.add_argument('--words', type=int, default=150, help='number of words per generated body')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='number of entries generated per query')
+
+    def generate(self, count, publication, words, batch_size, rnd):
+        """
+        creates the entries and their fingerprints, the bodies are drawn from
+        a 20000 words vocabulary, the first words much more often than the
+        last ones as in real text
+        """
+        from datetime import datetime
+
+        from django.db import transaction
+
+        from content_management.duplicates import body_signature, body_tokens
+        from content_management.models import Entry, EntryFingerprint
+
+        vocabulary = ['word%d' % i for i in range(20000)]
+        run = '%x' % rnd.getrandbits(32)
+        now = datetime.now()
+        start = time.time()
+        for first in range(0, count, batch_size):
+            entries = []
+            for i in range(first, min(first + batch_size, count)):
+                body = ' '.join(vocabulary[int(len(vocabulary) * rnd.random() ** 3)] for j in range(words))
+                entries.append(Entry(title='benchmark %s %d' % (run, i), slug='benchmark-%s-%d' % (run, i),
+                                     body_html='<p>%s</p>' % body, pub_date=now, publication_id=publication))
+            with transaction.atomic():
+                Entry.objects.bulk_create(entries)
+                rows = Entry.objects.filter(slug__in=[entry.slug for entry in entries]). \
+                    values_list('id', 'created_on', 'body_html')
+                EntryFingerprint.objects.bulk_create([
+                    EntryFingerprint.objects.make(entry_id, created_on, body_signature(body_tokens(body_html)))
+                    for entry_id, created_on, body_html in rows])
+        self.stdout.write('%d entries generated in %.1fs' % (count, time.time() - start))
+
+    def handle(self, *args, **options):
+        from datetime import timedelta
+
+        from content_management.duplicates import BODY_DUPLICATE_DAYS, body_signature, body_tokens
+        from content_management.models import Entry, EntryFingerprint
+
+        rnd = random.Random(options['seed'])
+        if options['generate']:
+            if not options['publication']:
+                raise CommandError('--generate needs --publication')
+            self.generate(options['generate'], options['publication'], options['words'],
+                          options['batch_size'], rnd)
+        ids = list(EntryFingerprint.objects.values_list('entry', flat=True))
+        count = len(ids)
+        if not count:
+            self.stderr.write('no fingerprinted entries, run fingerprint_entry_bodies first')
+            return
+        sample = rnd.sample(ids, min(options['queries'], count))
+        entries = list(Entry.objects.filter(id__in=sample).values_list('id', 'created_on', 'body_html'))
+        bodies = [(entry_id, created_on, body_tokens(body_html)) for entry_id, created_on, body_html in entries]
+        # the replacement words are drawn from the sampled bodies
+        vocabulary = [token for entry_id, created_on, tokens in bodies for token in tokens]
+        self.stdout.write('%d fingerprinted entries, %d sampled' % (count, len(bodies)))
+
+        gc.collect()
+        start = time.time()
+        for entry_id, created_on, tokens in bodies:
+            body_signature(tokens)
+        self.stdout.write('fingerprints: %.2fms per entry, %d words per body on average' % (
+            (time.time() - start) / len(bodies) * 1000,
+            sum(len(tokens) for entry_id, created_on, tokens in bodies) / len(bodies)))
+
+        window = timedelta(days=BODY_DUPLICATE_DAYS)
+        for edits in [int(n) for n in options['edits'].split(',')]:
+            timings = []
+            found = others = 0
+            for entry_id, created_on, tokens in bodies:
+                tokens = list(tokens)
+                for position in rnd.sample(range(len(tokens)), min(edits, len(tokens))):
+                    tokens[position] = rnd.choice(vocabulary)
+                signature = body_signature(tokens)
+                # looked up as a copy saved right after the entry
+                start = time.time()
+                near = EntryFingerprint.objects.near(signature, since=created_on - window,
+                                                     before=created_on + timedelta(seconds=1))
+                timings.append(time.time() - start)
+                if entry_id in near:
+                    found += 1
+                others += len(near) - (entry_id in near)
+            timings.sort()
+            self.stdout.write('%2d words replaced: recall %.1f%% (%d / %d), other entries matched %.2f '
+                              'per lookup, lookups mean %.2fms p99 %.2fms' % (
+                                  edits, found * 100.0 / len(bodies), found, len(bodies),
+                                  others / float(len(bodies)), sum(timings) / len(timings) * 1000,
+                                  timings[int(len(timings) * 0.99)] * 1000))
@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = ('Stores the body fingerprint of the entries saved before EntryFingerprint existed, '
+            'optionally flags the near duplicates found among them.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int,
+                            help='only the entries created in the last DAYS days')
+        parser.add_argument('--flag', action='store_true',
+                            help='set status_reason Duplicate on the entries with a near duplicate '
+                                 'created before them')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='number of entries read and written per query')
+
+    def handle(self, *args, **options):
+        from collections import deque
+        from datetime import datetime, timedelta
+
+        from django.db import transaction
+
+        from content_management.duplicates import BODY_DUPLICATE_DAYS, BodyIndex, body_signature, body_tokens
+        from content_management.models import Entry, EntryFingerprint
+
+        entries = Entry.objects.order_by('created_on', 'id')
+        if options['days']:
+            entries = entries.filter(created_on__gte=datetime.now() - timedelta(days=options['days']))
+        window = timedelta(days=BODY_DUPLICATE_DAYS)
+        # the entries of the last BODY_DUPLICATE_DAYS days, in creation order
+        index = BodyIndex()
+        indexed = deque()
+
+        stored = flagged = 0
+        last = None
+        while True:
+            batch = entries
+            if last is not None:
+                batch = batch.filter(created_on__gte=last[0]).exclude(created_on=last[0], id__lte=last[1])
+            rows = list(batch.values_list('id', 'created_on', 'body_html', 'status_reason')
+                        [:options['batch_size']])
+            if not rows:
+                break
+            last = rows[-1][1], rows[-1][0]
+
+            fingerprints = []
+            duplicates = []
+            for entry_id, created_on, body_html, status_reason in rows:
+                fingerprint = body_signature(body_tokens(body_html))
+                if fingerprint is None:
+                    continue
+                if options['flag']:
+                    while indexed and indexed[0][0] < created_on - window:
+                        index.remove(indexed.popleft()[1])
+                    if status_reason == 0 and index.near(fingerprint):
+                        duplicates.append(entry_id)
+                    index.add(entry_id, fingerprint)
+                    indexed.append((created_on, entry_id))
+                fingerprints.append(EntryFingerprint.objects.make(entry_id, created_on, fingerprint))
+
+            with transaction.atomic():
+                EntryFingerprint.objects.filter(entry__in=[row[0] for row in rows]).delete()
+                EntryFingerprint.objects.bulk_create(fingerprints)
+                if duplicates:
+                    Entry.objects.filter(id__in=duplicates, status_reason=0).update(status_reason=3)
+            stored += len(fingerprints)
+            flagged += len(duplicates)
+
+        self.stdout.write('%d fingerprints stored' % stored)
+        if options['flag']:
+            self.stdout.write('%d entries flagged as duplicates' % flagged)
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Fills Entry.title_fingerprint for the entries saved before it existed, or for all with --all.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='recompute the fingerprint of every entry')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='number of entries written per transaction')
+
+    def handle(self, *args, **options):
+        from django.db import transaction
+
+        from content_management.duplicates import title_fingerprint
+        from content_management.models import Entry
+
+        entries = Entry.objects.order_by('id')
+        if not options['all']:
+            entries = entries.filter(title_fingerprint='')
+
+        updated = 0
+        last_id = 0
+        while True:
+            rows = list(entries.filter(id__gt=last_id).values_list('id', 'title', 'title_fingerprint')
+                        [:options['batch_size']])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            with transaction.atomic():
+                for entry_id, title, old_fingerprint in rows:
+                    fingerprint = title_fingerprint(title)
+                    if fingerprint != old_fingerprint:
+                        Entry.objects.filter(id=entry_id).update(title_fingerprint=fingerprint)
+                        updated += 1
+        self.stdout.write('%d entries fingerprinted' % updated)
@@ -1,10 +1,10 @@
-import re
 import sys
 from datetime import datetime, timedelta
 
 # core django imports
 from django.conf import settings
 from django.db import models
+from django.db.models import signals
 from django.template.defaultfilters import slugify
 from django.template.defaultfilters import  striptags
 from django.contrib.auth.models import User
@@ -12,7 +12,12 @@ from django.contrib.auth.models import User
 from accounts.models import Account
 from publications.models import Publication, RichFeed
 from cutils.utils import (
-    pre_process_data, truncate, unicode_to_ascii
+    VersionedCache, compile_words, pre_process_data, truncate, unicode_to_ascii
+)
+from cutils.tree import IndustryTree
+from content_management.duplicates import (
+    BODY_DUPLICATES, BODY_DUPLICATE_DAYS, BODY_SIMILARITY, band_keys, body_signature, body_tokens,
+    pack_signature, signature_similarity, title_fingerprint, unpack_signature
 )
 
 
@@ -51,6 +56,18 @@ class MergedWord(models.Model):
 
         super(MergedWord, self).save(*args, **kwargs)
 
+
+def build_merged_words_regex():
+    return compile_words(MergedWord.objects.values_list('name', flat=True))
+
+
+# single regex over all the merged words, rebuilt when a MergedWord changes
+merged_words_regex = VersionedCache(
+    'content_management.merged_words_regex', build_merged_words_regex)
+
+MERGED_WORD_MARKUP = "<span style='border-bottom: medium double #0101DF'>%s</span>"
+
+
 class Industry(models.Model):
     """
     class to manage the Industry relationships
@@ -73,15 +90,10 @@ class Industry(models.Model):
         """
         count the number of parents
         """
-        if not self.parent:
-            return 0
-        return 1 + self.parent.level()
+        return industry_tree.get().level(self)
 
     def full_name(self):
-        if self.parent_id:
-            return '%s%s%s' %(self.parent, self.get_separator(), self.name)
-        else:
-            return self.name
+        return industry_tree.get().full_name(self)
 
     def get_separator(self):
         return ' :: '
@@ -90,9 +102,21 @@ class Industry(models.Model):
         """
         returns True if this entity does not have a child
         """
-        if self.child_set.all():
-            return False
-        return True
+        return industry_tree.get().is_leaf(self.pk)
+
+    def get_ancestors(self):
+        """
+        returns the parent industries, root first
+        """
+        ids = industry_tree.get().ancestors(self.pk)
+        ancestors = Industry.objects.in_bulk(ids)
+        return [ancestors[i] for i in ids if i in ancestors]
+
+
+# the industries are loaded once, full_name / level / is_leaf are read from the tree
+industry_tree = VersionedCache('content_management.industry_tree', lambda: IndustryTree.build(Industry))
+
+
 class Category(models.Model):
     text = models.CharField(max_length=75)
     slug = models.CharField(max_length=75)
@@ -181,6 +205,16 @@ class Entry(models.Model):
     rich_feed = models.ForeignKey(RichFeed, blank=True, null=True)
     comments = models.TextField(blank=True, null=True)
 
+    """
+    sha1 of the normalized title, see content_management.duplicates,
+    fingerprint_entry_titles fills it for the existing entries
+
+    ALTER TABLE cms_entry_master ADD COLUMN "title_fingerprint" varchar(40) NOT NULL DEFAULT '';
+    CREATE INDEX cms_entry_master_title_fingerprint ON cms_entry_master ("title_fingerprint");
+    """
+    title_fingerprint = models.CharField(max_length=40, blank=True, default='', db_index=True,
+                                         editable=False)
+
     class Meta:
         db_table = 'cms_entry_master'
         ordering = ('-pub_date',)
@@ -305,6 +339,7 @@ class Entry(models.Model):
         self.title = pre_process_data(
             self.title, remove_tags='all', clean_html=False
         )
+        self.title_fingerprint = title_fingerprint(self.title)
 
         # invoke get_body, to strip out basic tags
         self.body_html = pre_process_data(self.body_html)
@@ -313,22 +348,18 @@ class Entry(models.Model):
         #         "Lippo", self.title) or re.search("Lippo", self.body_html)):
         #     self.status = -1
 
-        # lets get the list of merged list to be checked in body_html
-        mergedWordsList = MergedWord.objects.values_list('name', flat=True)
-        if self.body_html:
-            for word in mergedWordsList:
-                p = re.compile(r'\b' + word + r'\b', re.IGNORECASE)
-                foundWord = p.search(self.body_html)
-                if foundWord:
-                    self.body_html = re.sub(
-                        "%s" % foundWord.group(),
-                        "<span style='border-bottom: medium double #0101DF'>%s</span>" % foundWord.group(),
-                        self.body_html
-                    )
-                    self.status = 1
-                    self.status_reason = 4
-                elif self.status_reason == 4:
-                    self.status_reason = 0
+        # highlight the merged words found in body_html, all the words are
+        # searched in a single pass
+        merged_words = merged_words_regex.get()
+        if self.body_html and merged_words:
+            self.body_html, found = merged_words.subn(
+                lambda m: MERGED_WORD_MARKUP % m.group(), self.body_html
+            )
+            if found:
+                self.status = 1
+                self.status_reason = 4
+            elif self.status_reason == 4:
+                self.status_reason = 0
 
         # truncate sub heading, keywords to 255 chars
         if self.sub_headline:
@@ -347,11 +378,48 @@ class Entry(models.Model):
         if self.date_line:
             self.date_line = pre_process_data(self.date_line)
 
+        fingerprint = None
+        if BODY_DUPLICATES:
+            fingerprint = self.check_duplicate_body()
+
         super(Entry, self).save()
 
+        if fingerprint is not None:
+            EntryFingerprint.objects.store(self, fingerprint)
+
         # update the Qs and TransmissionQItems each time you save an entry
 
 
+    def check_duplicate_body(self):
+        """
+        flags the entry as a Duplicate when an entry created in the previous
+        BODY_DUPLICATE_DAYS days has a near duplicate body, returns the
+        fingerprint to store, None when there is nothing to store
+        """
+        fingerprint = body_signature(body_tokens(self.body_html))
+        if fingerprint is None:
+            # too short to be compared
+            if self.id:
+                EntryFingerprint.objects.filter(entry=self.id).delete()
+            if self.status_reason == 3:
+                self.status_reason = 0
+            return None
+        if self.id:
+            stored = EntryFingerprint.objects.filter(entry=self.id).values_list('signature', flat=True)
+            if stored and unpack_signature(stored[0]) == fingerprint:
+                return None
+
+        before = self.created_on or datetime.now()
+        duplicates = EntryFingerprint.objects.near(
+            fingerprint, since=before - timedelta(days=BODY_DUPLICATE_DAYS), before=before,
+            exclude_id=self.id)
+        if duplicates and self.status_reason == 0:
+            self.status = min(self.status, 1)
+            self.status_reason = 3
+        elif not duplicates and self.status_reason == 3:
+            self.status_reason = 0
+        return fingerprint
+
     def get_nitf_body(self):
         """
         return cleaned nitf standard body as per yahoo
@@ -393,4 +461,128 @@ class Entry(models.Model):
     def disclaimer(self):
         """returns the disclaimer associated with the Publication"""
         if self.publication.disclaimer:
-            return 'DISCLAIMER: %s' % self.publication.disclaimer
\ No newline at end of file
+            return 'DISCLAIMER: %s' % self.publication.disclaimer
+
+
+class EntryFingerprintManager(models.Manager):
+    def near(self, signature, since=None, before=None, exclude_id=None, threshold=BODY_SIMILARITY):
+        """
+        returns the {entry id: similarity} of the entries whose body signature
+        is at least threshold similar, the candidates share at least one band
+        """
+        candidates = models.Q()
+        for i, key in enumerate(band_keys(signature)):
+            candidates |= models.Q(**{'band%d' % i: key})
+        qs = self.filter(candidates)
+        if since is not None:
+            qs = qs.filter(created_on__gte=since)
+        if before is not None:
+            qs = qs.filter(created_on__lte=before)
+        if exclude_id:
+            qs = qs.exclude(entry=exclude_id)
+        found = {}
+        for entry_id, value in qs.values_list('entry', 'signature'):
+            similarity = signature_similarity(signature, unpack_signature(value))
+            if similarity >= threshold:
+                found[entry_id] = similarity
+        return found
+
+    def make(self, entry_id, created_on, signature):
+        """
+        returns the unsaved EntryFingerprint of the signature, for bulk_create()
+        """
+        fingerprint = self.model(entry_id=entry_id, signature=pack_signature(signature), created_on=created_on)
+        for i, key in enumerate(band_keys(signature)):
+            setattr(fingerprint, 'band%d' % i, key)
+        return fingerprint
+
+    def store(self, entry, signature):
+        defaults = {'signature': pack_signature(signature), 'created_on': entry.created_on}
+        for i, key in enumerate(band_keys(signature)):
+            defaults['band%d' % i] = key
+        self.update_or_create(entry_id=entry.id, defaults=defaults)
+
+
+class EntryFingerprint(models.Model):
+    """
+    MinHash signature of the body of an Entry, see content_management.duplicates,
+    the bands are the keys of the parts of the signature, see BODY_MINHASH_BANDS.
+    Written by Entry.save(), fingerprint_entry_bodies fills it for the existing
+    entries.
+
+    CREATE TABLE "content_management_entryfingerprint" (
+    "entry_id" integer NOT NULL PRIMARY KEY REFERENCES "cms_entry_master" ("id") DEFERRABLE INITIALLY DEFERRED,
+    "signature" bytea NOT NULL,
+    "band0" integer NOT NULL,
+    "band1" integer NOT NULL,
+    "band2" integer NOT NULL,
+    "band3" integer NOT NULL,
+    "band4" integer NOT NULL,
+    "band5" integer NOT NULL,
+    "band6" integer NOT NULL,
+    "band7" integer NOT NULL,
+    "band8" integer NOT NULL,
+    "band9" integer NOT NULL,
+    "band10" integer NOT NULL,
+    "band11" integer NOT NULL,
+    "band12" integer NOT NULL,
+    "band13" integer NOT NULL,
+    "band14" integer NOT NULL,
+    "band15" integer NOT NULL,
+    "created_on" timestamp with time zone NOT NULL
+    );
+    CREATE INDEX "content_management_entryfingerprint_band0_created_on" ON "content_management_entryfingerprint" ("band0", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band1_created_on" ON "content_management_entryfingerprint" ("band1", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band2_created_on" ON "content_management_entryfingerprint" ("band2", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band3_created_on" ON "content_management_entryfingerprint" ("band3", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band4_created_on" ON "content_management_entryfingerprint" ("band4", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band5_created_on" ON "content_management_entryfingerprint" ("band5", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band6_created_on" ON "content_management_entryfingerprint" ("band6", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band7_created_on" ON "content_management_entryfingerprint" ("band7", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band8_created_on" ON "content_management_entryfingerprint" ("band8", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band9_created_on" ON "content_management_entryfingerprint" ("band9", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band10_created_on" ON "content_management_entryfingerprint" ("band10", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band11_created_on" ON "content_management_entryfingerprint" ("band11", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band12_created_on" ON "content_management_entryfingerprint" ("band12", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band13_created_on" ON "content_management_entryfingerprint" ("band13", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band14_created_on" ON "content_management_entryfingerprint" ("band14", "created_on");
+    CREATE INDEX "content_management_entryfingerprint_band15_created_on" ON "content_management_entryfingerprint" ("band15", "created_on");
+    """
+    entry = models.OneToOneField(Entry, primary_key=True, related_name='fingerprint')
+    signature = models.BinaryField()
+    band0 = models.IntegerField()
+    band1 = models.IntegerField()
+    band2 = models.IntegerField()
+    band3 = models.IntegerField()
+    band4 = models.IntegerField()
+    band5 = models.IntegerField()
+    band6 = models.IntegerField()
+    band7 = models.IntegerField()
+    band8 = models.IntegerField()
+    band9 = models.IntegerField()
+    band10 = models.IntegerField()
+    band11 = models.IntegerField()
+    band12 = models.IntegerField()
+    band13 = models.IntegerField()
+    band14 = models.IntegerField()
+    band15 = models.IntegerField()
+    created_on = models.DateTimeField()
+
+    objects = EntryFingerprintManager()
+
+    class Meta:
+        index_together = (
+            ('band0', 'created_on'), ('band1', 'created_on'), ('band2', 'created_on'), ('band3', 'created_on'),
+            ('band4', 'created_on'), ('band5', 'created_on'), ('band6', 'created_on'), ('band7', 'created_on'),
+            ('band8', 'created_on'), ('band9', 'created_on'), ('band10', 'created_on'), ('band11', 'created_on'),
+            ('band12', 'created_on'), ('band13', 'created_on'), ('band14', 'created_on'), ('band15', 'created_on'),
+        )
+
+    def __unicode__(self):
+        return u'%s: %08x' % (self.entry_id, self.band0 & 0xffffffff)
+
+
+signals.post_save.connect(merged_words_regex.invalidate, sender=MergedWord)
+signals.post_delete.connect(merged_words_regex.invalidate, sender=MergedWord)
+signals.post_save.connect(industry_tree.invalidate, sender=Industry)
+signals.post_delete.connect(industry_tree.invalidate, sender=Industry)
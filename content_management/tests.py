@@ -1,6 +1,52 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import random
+from datetime import datetime
+
 from django.test import TestCase
 
-# Create your tests here.
+
+class DuplicateBodyTest(TestCase):
+    def setUp(self):
+        from accounts.models import Account
+        from publications.models import Publication
+
+        account = Account.objects.create(title='account', slug='account', type='P')
+        self.publication = Publication.objects.create(title='publication', slug='publication', account=account)
+        rnd = random.Random(1)
+        self.words = ['word%d' % rnd.randint(0, 5000) for i in range(150)]
+
+    def create(self, title, words):
+        from content_management.models import Entry
+
+        return Entry.objects.create(title=title, slug=title, body_html='<p>%s</p>' % ' '.join(words),
+                                    pub_date=datetime.now(), publication=self.publication)
+
+    def status_reasons(self, *entries):
+        from content_management.models import Entry
+
+        return [Entry.objects.get(pk=entry.pk).status_reason for entry in entries]
+
+    def test_edited_copy(self):
+        from content_management.models import EntryFingerprint
+
+        original = self.create('original', self.words)
+        edited = list(self.words)
+        edited[20:23] = ['edited', 'wire', 'copy']
+        copy = self.create('copy', edited)
+        self.assertEqual(self.status_reasons(original, copy), [0, 3])
+        self.assertEqual(EntryFingerprint.objects.count(), 2)
+
+        # the body of the copy diverges, it is no longer a duplicate
+        copy.body_html = '<p>%s</p>' % ' '.join('other%d' % i for i in range(150))
+        copy.save()
+        self.assertEqual(self.status_reasons(original, copy), [0, 0])
+
+    def test_short_bodies(self):
+        from content_management.models import EntryFingerprint
+
+        first = self.create('first', self.words[:10])
+        second = self.create('second', self.words[:10])
+        self.assertEqual(self.status_reasons(first, second), [0, 0])
+        self.assertEqual(EntryFingerprint.objects.count(), 0)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Removes the least recently used files of the media store until it is below its size limit.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--root', help='root of the store, MEDIA_STORE_ROOT by default')
+        parser.add_argument('--max-bytes', type=int,
+                            help='size limit of the store, MEDIA_STORE_MAX_BYTES by default')
+
+    def handle(self, *args, **options):
+        from cutils.mediastore import MEDIA_STORE_ROOT, MediaStore
+
+        root = options['root'] or MEDIA_STORE_ROOT
+        if not root:
+            raise CommandError('MEDIA_STORE_ROOT is not set, use --root')
+
+        removed, freed = MediaStore(root).evict(options['max_bytes'])
+        self.stdout.write('%d files removed, %d bytes freed' % (removed, freed))
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from cutils.utils import pre_process_data
+
+
+class Command(BaseCommand):
+    help = 'Compares the single parse html cleanup with the legacy one on the latest Entry bodies, ' \
+           'reports the mismatches and the time taken by both.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=1000,
+                            help='number of entries to check, latest first')
+        parser.add_argument('--show', type=int, default=5,
+                            help='number of mismatching entries to print')
+
+    def handle(self, *args, **options):
+        from content_management.models import Entry
+
+        bodies = list(Entry.objects.exclude(body_html='').order_by('-id').values_list(
+            'id', 'body_html')[:options['limit']])
+
+        timings = {}
+        outputs = {}
+        for single_parse in (False, True):
+            start = time.time()
+            outputs[single_parse] = [pre_process_data(body, single_parse=single_parse)
+                                     for entry_id, body in bodies]
+            timings[single_parse] = time.time() - start
+
+        mismatches = [entry_id for (entry_id, body), legacy, single in
+                      zip(bodies, outputs[False], outputs[True]) if legacy != single]
+        for entry_id in mismatches[:options['show']]:
+            self.stdout.write('mismatch: entry %s' % entry_id)
+
+        self.stdout.write('%d entries, %d mismatches' % (len(bodies), len(mismatches)))
+        self.stdout.write('legacy: %.2fs, single parse: %.2fs' % (timings[False], timings[True]))
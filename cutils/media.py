@@ -4,17 +4,25 @@ define modules to handle media related activities
 import urlparse, os
 import logging
 import logging.config
-from urllib import urlretrieve
+import threading
+from Queue import Queue
 
+import requests
 from BeautifulSoup import BeautifulSoup as bsoup
 
+from django.conf import settings
 from django.utils.encoding import smart_unicode
 
+from cutils.mediastore import get_media_store, url_digest
 from cutils.utils import ContifyValidationError
 
 
 logger = logging.getLogger(__name__)
 
+# number of images downloaded at the same time
+MEDIA_DOWNLOAD_WORKERS = getattr(settings, 'MEDIA_DOWNLOAD_WORKERS', 8)
+MEDIA_DOWNLOAD_TIMEOUT = getattr(settings, 'MEDIA_DOWNLOAD_TIMEOUT', 30)
+MEDIA_CHUNK_SIZE = 64 * 1024
 
 MEDIA_MIME_TYPE = {
     ".bm" :	"image/bmp",
@@ -39,6 +47,214 @@ MEDIA_MIME_TYPE = {
 }
 
 
+def get_img_media_tags(image, producer, prefix=None):
+    """
+    returns the (src, filename, media tags) of the img tag, the file name
+    is the base name of the src with the hash of the src appended, so that
+    two images with the same base name never get the same file, whatever
+    the batch they are localized in
+    @param image img tag, soup element
+    @raise ContifyValidationError if the src is missing or is not an image
+    """
+    if not image.has_key("src"):
+        # error - src has to be there!!
+        raise ContifyValidationError("Image src missing, img tag: %s" % (image))
+    src = image["src"]
+
+    name, ext = os.path.splitext(src.split("/")[-1])
+    filename = "%s_%s%s" % (name, url_digest(src)[:8], ext)
+    if prefix:
+        filename = prefix + "_" + filename
+
+    alt = "" # default to blank
+    if image.has_key("alt"):
+        alt = image["alt"]
+
+    align = 'align:right' # default to right
+    if image.has_key("align"):
+        align = image["align"]
+
+    # ignore height and width for now
+    return src, filename, get_media_tags(filename, producer, alt, align)
+
+
+class MediaLocalizer(object):
+    """
+    replaces the img tags of a batch of html documents with media tags, the
+    images are downloaded to download_to. Every document is parsed once, the
+    images of the whole batch are collected and downloaded once per file by
+    `workers` threads sharing a session, with a timeout, then the tags are
+    rewritten in the parsed documents.
+
+    With a MediaStore (by default the one at MEDIA_STORE_ROOT, if set) the
+    images are downloaded once per url into the store and linked into
+    download_to, the images already stored are neither downloaded nor
+    written again, see cutils.mediastore
+
+    >>> localizer = MediaLocalizer(download_to='/data/media/ft')
+    >>> bodies = localizer.localize([(entry.body_html, producer, prefix) for entry in entries])
+    """
+    def __init__(self, download_to=None, workers=MEDIA_DOWNLOAD_WORKERS, timeout=MEDIA_DOWNLOAD_TIMEOUT,
+                 store=None):
+        self.download_to = download_to
+        self.workers = workers
+        self.timeout = timeout
+        self.store = store if store is not None else get_media_store()
+
+    def parse(self, data_html, producer, prefix=None):
+        """
+        returns the soup of the document and the list of (img tag, src,
+        filename, media tags) of its images, the media tags are '' for the
+        invalid images
+        """
+        soup = bsoup(data_html)
+        images = []
+        for image in soup.findAll("img"):
+            try:
+                src, filename, new_img_tag = get_img_media_tags(image, producer, prefix)
+            except ContifyValidationError, e:
+                # move on to the next image, catch the exception - log it and move on
+                logger.error(e)
+                src, filename, new_img_tag = '', '', ''
+            images.append((image, src, filename, new_img_tag))
+        return soup, images
+
+    def fetch(self, session, src, path=None):
+        """
+        downloads the image into the store, or to path through a temporary
+        file so that a failed download never leaves a partial file behind,
+        returns the path written, None if the download failed. An image
+        already in the store is read with a conditional GET, it is not
+        downloaded again if it was not modified
+        """
+        tmp_path = None
+        try:
+            headers = {}
+            entry = self.store.entry(src) if path is None else None
+            if entry is not None:
+                if entry[1]:
+                    headers['If-None-Match'] = entry[1]
+                if entry[2]:
+                    headers['If-Modified-Since'] = entry[2]
+            response = session.get(src, timeout=self.timeout, stream=True, headers=headers)
+            if response.status_code == 304 and headers:
+                response.close()
+                self.store.revalidated(src)
+                logger.debug("not modified %s" % (src))
+                return entry[0]
+            response.raise_for_status()
+            chunks = response.iter_content(MEDIA_CHUNK_SIZE)
+            if path is None:
+                path = self.store.put(src, chunks, response.headers.get('ETag'),
+                                      response.headers.get('Last-Modified'))
+            else:
+                tmp_path = '%s.%d.part' % (path, threading.current_thread().ident)
+                with open(tmp_path, 'wb') as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+                os.rename(tmp_path, path)
+            logger.debug("downloaded %s" % (src))
+            return path
+        except (requests.RequestException, IOError, OSError), e:
+            logger.error("Unable to download file from url: %s. Error %s" % (src, e))
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+    def download(self, downloads):
+        """
+        downloads the [(src, path)] images, path None to download into the
+        store, returns the {(src, path): path written} of the downloads done
+        """
+        if not downloads:
+            return {}
+        jobs = Queue()
+        for job in downloads:
+            jobs.put(job)
+        done = {}
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(self.workers, 10))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        def worker():
+            while True:
+                job = jobs.get()
+                if job is None:
+                    break
+                src, path = job
+                written = self.fetch(session, src, path)
+                if written:
+                    done[job] = written
+
+        threads = [threading.Thread(target=worker) for i in range(min(self.workers, len(downloads)))]
+        try:
+            for t in threads:
+                t.daemon = True
+                t.start()
+                jobs.put(None)
+            for t in threads:
+                t.join()
+        finally:
+            session.close()
+        return done
+
+    def link(self, downloads):
+        """
+        links the stored images at their paths, the images missing from the
+        store, or downloaded more than url_ttl seconds ago, are downloaded once
+        per src
+        @param downloads {path: src}
+        """
+        stored = {}
+        for src in set(downloads.values()):
+            stored[src] = self.store.lookup(src)
+        fetched = self.download([(src, None) for src in stored if stored[src] is None])
+        for (src, store_path), written in fetched.items():
+            stored[src] = written
+        for path, src in downloads.items():
+            if stored[src]:
+                try:
+                    self.store.materialize(stored[src], path)
+                except OSError, e:
+                    logger.error("Unable to link %s to %s. Error %s" % (src, path, e))
+
+    def localize(self, documents):
+        """
+        returns the documents with the img tags replaced by media tags
+        @param documents list of (data_html, producer, prefix)
+        """
+        parsed = [self.parse(data_html, producer, prefix) for data_html, producer, prefix in documents]
+
+        if self.download_to:
+            if not os.path.isdir(self.download_to):
+                os.makedirs(self.download_to, mode=0755)
+            # an image used several times in the batch is downloaded once
+            downloads = {}
+            for soup, images in parsed:
+                for image, src, filename, new_img_tag in images:
+                    path = os.path.join(self.download_to, filename)
+                    if not new_img_tag or path in downloads:
+                        continue
+                    # without a store an existing file, of the same src, is taken as is
+                    if self.store is not None or not os.path.isfile(path):
+                        downloads[path] = src
+            if self.store is not None:
+                self.link(downloads)
+            else:
+                self.download([(src, dest) for dest, src in downloads.items()])
+
+        results = []
+        for soup, images in parsed:
+            # replace the current img tag with the new_img_tag
+            for image, src, filename, new_img_tag in images:
+                image.replaceWith(new_img_tag)
+            # remove all unwanted href pointing to images in the body
+            results.append(smart_unicode(remove_img_href(soup).renderContents()))
+        return results
+
+
 def img_to_media(data_html, producer, prefix=None, download_to=None):
     """
     TODO:
@@ -47,8 +263,8 @@ def img_to_media(data_html, producer, prefix=None, download_to=None):
     * Image Caption - if image within divs is not being considered
     
     scans the data for img tags and replaces them with nsml standard media tags
-    if the img does not exist at the src, it will be removed
-    files will be downloaded if the location is specified
+    files will be downloaded if the location is specified, see MediaLocalizer
+    to localize the images of many documents at once
     <img src="filename.jpg" alt="#alt_text#" align="#alignment#" width="#w#" height="#h#"/>
     <media media-type="image" style="align:#alignment#">
         <media-reference mime-type="image/jpeg" source="filename.jpg" alternate-text="#alt-text#" height="#h#" width="#w#"></media-reference>
@@ -60,68 +276,12 @@ def img_to_media(data_html, producer, prefix=None, download_to=None):
         </media-producer>
     </media>    
     @param data_html data in html format
-    @param source source of the image, should be the publication or the account
-    @param check_exists if True, will check if file exists and update the tags, else remove the instance
+    @param producer source of the image, should be the publication or the account
+    @param prefix prefix of the downloaded file names, optional
     @param download_to location where the files needs to be downloaded, optional
     @return data with img tags replace by media tags
     """
-    soup = bsoup(data_html)
-    src_list = []
-    # remove a href to images!!
-    for image in soup.findAll("img"):
-        new_img_tag = ''
-        src = ''
-        try:
-            # extract the elements from img tag
-            if image.has_key("src"):
-                src = image["src"]
-                
-                filename = src.split("/")[-1]
-                if prefix:
-                    filename = prefix + "_" + filename
-                
-                alt = "" # default to blank
-                if image.has_key("alt"):
-                    alt = image["alt"]
-        
-                align='align:right' # default to right
-                if image.has_key("align"):
-                    align = image["align"]
-                
-                if image.has_key("width") and image.has_key("height"):
-                    width = image["width"]
-                    height = image["height"]
-                    
-                    new_img_tag = get_media_tags(filename, producer, alt, height=height, width=width, align=align)
-                else:
-                    new_img_tag = get_media_tags(filename, producer, alt, align)
-            
-                # ignore height and width for now
-                new_img_tag = get_media_tags(filename, producer, alt, align)
-            else:
-                # error - src has to be there!!
-                raise ContifyValidationError("Image src missing, img tag: %s" %(image))
-        except ContifyValidationError, e:
-            # move on to the next image, catch the exception - log it and move on
-            logger.error(e)
-        finally:
-            # download the image to a local location
-            # replace the current img tag with the new_img_tag
-            if download_to:
-                if not os.path.isdir(download_to):
-                    os.makedirs(download_to, mode=0755)
-                
-                if new_img_tag and not os.path.isfile(os.path.join(download_to, filename)):
-                    try:
-                        urlretrieve(src, os.path.join(download_to, filename))
-                        logger.debug("downloaded %s" %(src))
-                    except IOError, e:
-                        logger.error("Unable to download file from url: %s. Error %s" %(src, e))
-            
-            image.replaceWith(new_img_tag)
-
-    # remove all unwanted href pointing to images in the body
-    return smart_unicode(remove_img_href(soup).renderContents())
+    return MediaLocalizer(download_to).localize([(data_html, producer, prefix)])[0]
 
 def get_media_tags(filename, producer, alt="", align="align:right", height=None, width=None, caption=''):
     """
@@ -184,7 +344,6 @@ def remove_img_href(data_soup):
     @param data_soup expects a soup element
     @return soup element without hrefs pointing to images
     """
-    from django.template.defaultfilters import removetags
     for a in data_soup.findAll("a"):
         
         # check the url / href of the a tag
@@ -195,8 +354,8 @@ def remove_img_href(data_soup):
             try:
                 type, mime = get_media_mime_type(filename)
                 if type == "image":
-                    clean_a = removetags(a, "a")
-                    a.replaceWith(clean_a)                
+                    # keep the contents of the link, removetags is gone from django
+                    a.replaceWith(smart_unicode(a.renderContents()))
             except ContifyValidationError, e:
                 logger.warn("non image, ignore. Error %s" %(e))
         else:
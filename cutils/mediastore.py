@@ -0,0 +1,254 @@
+"""
+Content addressed store for the downloaded media
+
+Every file is stored once under the sha1 of its body, whatever the number of
+urls serving it, and the urls already downloaded are indexed:
+    <root>/objects/<sha1[:2]>/<sha1>     the files
+    <root>/urls/<sha1(url)[:2]>/<sha1(url)>  the sha1 of the file at the url,
+                                             its ETag and Last-Modified
+
+A url entry is trusted for MEDIA_STORE_URL_TTL seconds after the download,
+the image at the url may have been replaced since. Past that lookup() misses
+and the url is read again with a conditional GET, a 304 answer refreshes the
+entry without downloading the file, see entry() and revalidated().
+
+The files are materialized where they are needed, in the per buyer
+directories, as hard links (or symlinks, see MEDIA_STORE_LINK), a file
+already linked is left as it is, so an image transmitted again costs
+neither a download nor a write. The hard links outlive the eviction of the
+store, the symlinks do not.
+
+The store is kept under MEDIA_STORE_MAX_BYTES by evict(), the least recently
+used files first, see the evict_media_store command
+>>> store = MediaStore('/data/media/store')
+>>> path = store.lookup(url) or store.put(url, response.iter_content(65536),
+...                                       response.headers.get('ETag'), response.headers.get('Last-Modified'))
+>>> store.materialize(path, '/data/media/ft/logo.png')
+"""
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# the store is not used when MEDIA_STORE_ROOT is not set
+MEDIA_STORE_ROOT = getattr(settings, 'MEDIA_STORE_ROOT', None)
+MEDIA_STORE_MAX_BYTES = getattr(settings, 'MEDIA_STORE_MAX_BYTES', 2 * 1024 ** 3)
+# 'hardlink' or 'symlink', the hard links fall back to copies across devices
+MEDIA_STORE_LINK = getattr(settings, 'MEDIA_STORE_LINK', 'hardlink')
+# seconds a url entry is used before the url is read again
+MEDIA_STORE_URL_TTL = getattr(settings, 'MEDIA_STORE_URL_TTL', 7 * 24 * 60 * 60)
+# seconds between two updates of the last use of a file
+MEDIA_STORE_TOUCH_INTERVAL = 24 * 60 * 60
+
+
+def url_digest(url):
+    if isinstance(url, unicode):
+        url = url.encode('utf-8')
+    return hashlib.sha1(url).hexdigest()
+
+
+class MediaStore(object):
+    def __init__(self, root, max_bytes=MEDIA_STORE_MAX_BYTES, link=MEDIA_STORE_LINK,
+                 url_ttl=MEDIA_STORE_URL_TTL):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.link = link
+        self.url_ttl = url_ttl
+
+    def object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    def url_path(self, url):
+        digest = url_digest(url)
+        return os.path.join(self.root, 'urls', digest[:2], digest)
+
+    def _makedirs(self, directory):
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory, 0755)
+            except OSError, e:
+                # created by another worker in the meantime
+                if e.errno != errno.EEXIST:
+                    raise
+
+    def _write(self, path, chunks):
+        """
+        writes the chunks to a temporary file next to path, returns the
+        temporary path and the sha1 of the data, the caller renames it
+        """
+        self._makedirs(os.path.dirname(path))
+        tmp_path = '%s.%d.%d.part' % (path, os.getpid(), threading.current_thread().ident)
+        sha1 = hashlib.sha1()
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in chunks:
+                    sha1.update(chunk)
+                    f.write(chunk)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return tmp_path, sha1.hexdigest()
+
+    def entry(self, url):
+        """
+        returns the (path of the stored file, etag, last_modified, fetched
+        on) of the url whatever its age, None if the url was not downloaded
+        or its file was evicted
+        """
+        url_path = self.url_path(url)
+        try:
+            with open(url_path) as f:
+                lines = f.read().split('\n')
+            fetched_on = os.stat(url_path).st_mtime
+        except (IOError, OSError):
+            return None
+        digest = lines[0].strip()
+        etag, last_modified = (lines[1:] + ['', ''])[:2]
+        path = self.object_path(digest)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return None
+        if mtime < time.time() - MEDIA_STORE_TOUCH_INTERVAL:
+            # the last use is what evict() goes by
+            os.utime(path, None)
+        return path, etag, last_modified, fetched_on
+
+    def lookup(self, url):
+        """
+        returns the path of the stored file of the url, None if the url was
+        not downloaded, its file was evicted or it was downloaded more than
+        url_ttl seconds ago
+        """
+        entry = self.entry(url)
+        if entry is None or entry[3] < time.time() - self.url_ttl:
+            return None
+        return entry[0]
+
+    def revalidated(self, url):
+        """
+        the server reported the stored file of the url as not modified, the
+        entry is used for url_ttl seconds more
+        """
+        os.utime(self.url_path(url), None)
+
+    def put(self, url, chunks, etag=None, last_modified=None):
+        """
+        stores the data of the url, the chunks are written once, a file
+        already stored under another url is not kept twice, returns the path
+        of the stored file. The etag and last_modified of the response are
+        kept for the revalidation of the url
+        """
+        incoming, digest = self._write(os.path.join(self.root, 'incoming', url_digest(url)), chunks)
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            os.remove(incoming)
+            os.utime(path, None)
+        else:
+            self._makedirs(os.path.dirname(path))
+            os.rename(incoming, path)
+        url_path = self.url_path(url)
+        entry = '\n'.join([digest, etag or '', last_modified or ''])
+        os.rename(self._write(url_path, [entry])[0], url_path)
+        return path
+
+    def materialize(self, path, dest):
+        """
+        links the stored file at dest, returns False if dest already is the
+        stored file
+        """
+        if os.path.lexists(dest):
+            try:
+                if os.path.samefile(path, dest):
+                    return False
+            except OSError:
+                # dangling symlink
+                pass
+        tmp_dest = '%s.%d.%d.part' % (dest, os.getpid(), threading.current_thread().ident)
+        if self.link == 'symlink':
+            os.symlink(os.path.abspath(path), tmp_dest)
+        else:
+            try:
+                os.link(path, tmp_dest)
+            except OSError, e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copyfile(path, tmp_dest)
+        os.rename(tmp_dest, dest)
+        return True
+
+    def objects(self):
+        """
+        yields the (path, size, last use) of the stored files
+        """
+        for directory, dirnames, filenames in os.walk(os.path.join(self.root, 'objects')):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def evict(self, max_bytes=None):
+        """
+        removes the least recently used files until the store is below
+        max_bytes, and the url entries of the removed files, returns the
+        (number of files, bytes) removed. The downloads interrupted more than
+        MEDIA_STORE_TOUCH_INTERVAL ago are cleared as well
+        """
+        stale = time.time() - MEDIA_STORE_TOUCH_INTERVAL
+        for directory, dirnames, filenames in os.walk(os.path.join(self.root, 'incoming')):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    if os.stat(path).st_mtime < stale:
+                        os.remove(path)
+                except OSError:
+                    continue
+
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        objects = sorted(self.objects(), key=lambda o: o[2])
+        total = sum(size for path, size, mtime in objects)
+        removed = set()
+        freed = 0
+        for path, size, mtime in objects:
+            if total - freed <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError, e:
+                logger.error("unable to evict %s: %s" % (path, e))
+                continue
+            removed.add(os.path.basename(path))
+            freed += size
+
+        if removed:
+            for directory, dirnames, filenames in os.walk(os.path.join(self.root, 'urls')):
+                for filename in filenames:
+                    path = os.path.join(directory, filename)
+                    try:
+                        with open(path) as f:
+                            if f.readline().strip() in removed:
+                                os.remove(path)
+                    except (IOError, OSError):
+                        continue
+        return len(removed), freed
+
+
+def get_media_store():
+    """
+    returns the MediaStore at MEDIA_STORE_ROOT, None if it is not set
+    """
+    if MEDIA_STORE_ROOT:
+        return MediaStore(MEDIA_STORE_ROOT)
+    return None
@@ -0,0 +1,83 @@
+"""
+Helpers for the tests
+
+StubServer is a local HTTP stand-in for the remote services (Calais, the
+classifier, the crawled sites, the image hosts, the upload locations), served
+by threads so that the concurrent clients are tested as they run
+>>> import requests
+>>> server = StubServer({'/a.jpg': (200, 'data'), '/missing.jpg': (404, '')})
+>>> requests.get(server.url + 'a.jpg').content
+'data'
+>>> server.requests
+[('GET', '/a.jpg', '')]
+>>> server.shutdown()
+"""
+import BaseHTTPServer
+import SocketServer
+import threading
+
+
+class StubHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    def respond(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else ''
+        with self.server.lock:
+            self.server.requests.append((method, self.path, body))
+        response = self.server.response(method, self.path, body, self.headers)
+        status, content = response[:2]
+        headers = response[2] if len(response) > 2 else {}
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        if method != 'HEAD':
+            self.wfile.write(content)
+
+    def do_GET(self):
+        self.respond('GET')
+
+    def do_HEAD(self):
+        self.respond('HEAD')
+
+    def do_POST(self):
+        self.respond('POST')
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    answers the requests from `responses`, a response is a (status, body) or
+    a (status, body, headers) tuple:
+    - a dict, the response of every path, 404 for the others
+    - a list, the responses in order, the last one is repeated
+    - a function of the (method, path, body, headers) of the request
+    the requests received are kept in `requests`, (method, path, body)
+    """
+    daemon_threads = True
+
+    def __init__(self, responses):
+        BaseHTTPServer.HTTPServer.__init__(self, ('127.0.0.1', 0), StubHandler)
+        self.responses = responses
+        self.requests = []
+        self.lock = threading.Lock()
+        self.url = 'http://127.0.0.1:%d/' % self.server_port
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def response(self, method, path, body, headers):
+        if callable(self.responses):
+            return self.responses(method, path, body, headers)
+        if isinstance(self.responses, dict):
+            return self.responses.get(path, (404, ''))
+        with self.lock:
+            if len(self.responses) > 1:
+                return self.responses.pop(0)
+            return self.responses[0]
+
+    def shutdown(self):
+        BaseHTTPServer.HTTPServer.shutdown(self)
+        self.server_close()
@@ -1,6 +1,171 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+import time
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from cutils.testing import StubServer
+
+
+class MediaLocalizerTest(SimpleTestCase):
+    def setUp(self):
+        from cutils import mediastore
+
+        # the images are downloaded straight to download_to, without store
+        self.store_root = mediastore.MEDIA_STORE_ROOT
+        mediastore.MEDIA_STORE_ROOT = None
+        self.server = StubServer({
+            '/a.jpg': (200, b'first'),
+            '/b/a.jpg': (200, b'second'),
+            '/missing.jpg': (404, b''),
+        })
+        self.download_to = tempfile.mkdtemp()
+
+    def tearDown(self):
+        from cutils import mediastore
+
+        mediastore.MEDIA_STORE_ROOT = self.store_root
+        self.server.shutdown()
+        shutil.rmtree(self.download_to)
+
+    def localize(self, documents):
+        from cutils.media import MediaLocalizer
+
+        localizer = MediaLocalizer(download_to=self.download_to, workers=4, timeout=5)
+        return localizer.localize([(html % {'url': self.server.url}, 'producer', None) for html in documents])
+
+    def files(self):
+        files = {}
+        for name in os.listdir(self.download_to):
+            with open(os.path.join(self.download_to, name), 'rb') as f:
+                files[name] = f.read()
+        return files
+
+    def filename(self, path):
+        from cutils.mediastore import url_digest
+
+        name, ext = os.path.splitext(path.split('/')[-1])
+        return '%s_%s%s' % (name, url_digest(self.server.url + path)[:8], ext)
+
+    def test_batch(self):
+        bodies = self.localize([
+            '<p>one <img src="%(url)sa.jpg" alt="one" /></p>',
+            '<p>two <img src="%(url)sa.jpg" /><img src="%(url)sb/a.jpg" /></p>',
+            '<p>no src <img alt="none" /></p>',
+            '<p>not found <img src="%(url)smissing.jpg" /></p>',
+        ])
+        for body in bodies:
+            self.assertNotIn('<img', body)
+        # an image used twice is downloaded once, the two a.jpg get their own files
+        self.assertEqual(sorted(path for method, path, body in self.server.requests),
+                         ['/a.jpg', '/b/a.jpg', '/missing.jpg'])
+        self.assertEqual(self.files(), {self.filename('a.jpg'): b'first', self.filename('b/a.jpg'): b'second'})
+        self.assertIn(self.filename('a.jpg'), bodies[0])
+        self.assertIn(self.filename('b/a.jpg'), bodies[1])
+        # the image without src is dropped, the missing one still gets its tag
+        self.assertEqual(bodies[2], '<p>no src </p>')
+        self.assertIn(self.filename('missing.jpg'), bodies[3])
+
+    def test_batches(self):
+        first = self.localize(['<img src="%(url)sa.jpg" />'])[0]
+        second = self.localize(['<img src="%(url)sb/a.jpg" />'])[0]
+        # the image of the first batch is not replaced by the one of the second
+        self.assertEqual(self.files(), {self.filename('a.jpg'): b'first', self.filename('b/a.jpg'): b'second'})
+        self.assertIn(self.filename('a.jpg'), first)
+        self.assertIn(self.filename('b/a.jpg'), second)
+
+    def test_existing_files_are_kept(self):
+        with open(os.path.join(self.download_to, self.filename('a.jpg')), 'wb') as f:
+            f.write(b'old')
+        self.localize(['<img src="%(url)sa.jpg" />'])
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(self.files(), {self.filename('a.jpg'): b'old'})
+
+    def test_failed_download_leaves_no_file(self):
+        # the downloaded file can not be renamed over a directory
+        os.mkdir(os.path.join(self.download_to, self.filename('a.jpg')))
+        self.localize(['<img src="%(url)sa.jpg" />', '<img src="%(url)sb/a.jpg" />'])
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(sorted(os.listdir(self.download_to)),
+                         sorted([self.filename('a.jpg'), self.filename('b/a.jpg')]))
+        self.assertTrue(os.path.isdir(os.path.join(self.download_to, self.filename('a.jpg'))))
+
+
+class MediaStoreTest(SimpleTestCase):
+    def setUp(self):
+        from cutils.mediastore import MediaStore
+
+        self.image = (b'first', '"v1"')
+        self.conditions = []
+        self.server = StubServer(self.respond)
+        self.url = self.server.url + 'logo.png'
+        self.root = tempfile.mkdtemp()
+        self.store = MediaStore(os.path.join(self.root, 'store'), url_ttl=60)
+        self.download_to = os.path.join(self.root, 'media')
+
+    def tearDown(self):
+        self.server.shutdown()
+        shutil.rmtree(self.root)
+
+    def respond(self, method, path, body, headers):
+        data, etag = self.image
+        if path.startswith('/other/'):
+            data, etag = b'other', '"other"'
+        self.conditions.append(headers.get('If-None-Match'))
+        if headers.get('If-None-Match') == etag:
+            return 304, b'', {'ETag': etag}
+        return 200, data, {'ETag': etag}
+
+    def localize(self, url=None):
+        from cutils.media import MediaLocalizer
+        from cutils.mediastore import url_digest
+
+        url = url or self.url
+        MediaLocalizer(download_to=self.download_to, timeout=5, store=self.store).localize(
+            [('<img src="%s" />' % url, 'producer', None)])
+        with open(os.path.join(self.download_to, 'logo_%s.png' % url_digest(url)[:8]), 'rb') as f:
+            return f.read()
+
+    def expire(self):
+        expired = time.time() - 120
+        os.utime(self.store.url_path(self.url), (expired, expired))
+
+    def test_revalidation(self):
+        self.assertEqual(self.localize(), b'first')
+        self.assertEqual(self.store.entry(self.url)[1], '"v1"')
+        # the url is not read again before url_ttl
+        self.assertEqual(self.localize(), b'first')
+        self.assertEqual(len(self.server.requests), 1)
+
+        # then it is read with a conditional GET, the file is kept
+        self.expire()
+        self.assertIsNone(self.store.lookup(self.url))
+        self.assertEqual(self.localize(), b'first')
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertIsNotNone(self.store.lookup(self.url))
+
+        # the image at the url was replaced
+        self.image = (b'second', '"v2"')
+        self.expire()
+        self.assertEqual(self.localize(), b'second')
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(self.store.entry(self.url)[1], '"v2"')
+        self.assertEqual(self.conditions, [None, '"v1"', '"v1"'])
+
+    def test_batches(self):
+        # an image with the same base name, in another batch, gets its own file
+        self.assertEqual(self.localize(), b'first')
+        self.assertEqual(self.localize(self.server.url + 'other/logo.png'), b'other')
+        self.assertEqual(self.localize(), b'first')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_evict(self):
+        path = self.store.put(self.url, [b'data'], '"v1"', 'Mon, 12 Oct 2026 10:00:00 GMT')
+        self.assertEqual(self.store.entry(self.url)[:3], (path, '"v1"', 'Mon, 12 Oct 2026 10:00:00 GMT'))
+        self.assertEqual(self.store.evict(max_bytes=0), (1, 4))
+        self.assertIsNone(self.store.entry(self.url))
+        self.assertFalse(os.path.exists(self.store.url_path(self.url)))
@@ -0,0 +1,94 @@
+"""
+In memory tree of the Industry like models, ie models with a name and a parent
+
+The whole tree is loaded with one query and the full name, the level and the
+ancestors of every node are computed once, wrap it in a VersionedCache to keep
+it between requests
+
+>>> industry_tree = VersionedCache('content_management.industry_tree',
+...                                lambda: IndustryTree.build(Industry))
+>>> industry_tree.get().full_name(industry)
+"""
+
+
+class IndustryTree(object):
+    """
+    built from (id, parent id, name) rows
+    """
+
+    def __init__(self, rows, separator=' :: '):
+        self.separator = separator
+        self.names = {}
+        self.parents = {}
+        self.children = {}
+        for id, parent_id, name in rows:
+            self.names[id] = name
+            self.parents[id] = parent_id
+            if parent_id is not None:
+                self.children.setdefault(parent_id, []).append(id)
+
+        # id -> tuple of the ancestor ids, root first
+        self.paths = {}
+        for id in self.names:
+            self._path(id)
+        self.full_names = dict((id, separator.join([self.names[i] for i in path] + [self.names[id]]))
+                               for id, path in self.paths.items())
+
+    @classmethod
+    def build(cls, model, separator=' :: '):
+        return cls(model._default_manager.values_list('id', 'parent_id', 'name'), separator)
+
+    def _path(self, id):
+        chain = []
+        while id is not None and id not in self.paths and id not in chain:
+            chain.append(id)
+            id = self.parents.get(id)
+            if id not in self.names:
+                # dangling parent
+                id = None
+
+        # a cycle is cut where it closes
+        path = self.paths[id] + (id,) if id in self.paths else ()
+        for i in reversed(chain):
+            self.paths[i] = path
+            path = path + (i,)
+
+    def __contains__(self, id):
+        return id in self.names
+
+    def ancestors(self, id):
+        """
+        returns the ids of the ancestors of the node, root first
+        """
+        return self.paths.get(id, ())
+
+    def children_of(self, id):
+        return self.children.get(id, [])
+
+    def is_leaf(self, id):
+        return id not in self.children
+
+    def full_name(self, obj):
+        """
+        returns the name of the object prefixed by the names of its ancestors,
+        the object name and parent are used as they are, ie the unsaved changes
+        are taken into account
+        """
+        if not obj.parent_id:
+            return obj.name
+        if obj.parent_id in self.full_names:
+            parent_name = self.full_names[obj.parent_id]
+        else:
+            # not in the tree yet
+            parent_name = obj.parent.full_name()
+        return u'%s%s%s' % (parent_name, self.separator, obj.name)
+
+    def level(self, obj):
+        """
+        returns the number of ancestors of the object
+        """
+        if not obj.parent_id:
+            return 0
+        if obj.parent_id in self.paths:
+            return len(self.paths[obj.parent_id]) + 1
+        return obj.parent.level() + 1
@@ -10,6 +10,7 @@ import datetime
 import htmlentitydefs
 import re
 import sys
+import time
 import unicodedata
 import urlparse
 from enum import IntEnum, unique
@@ -17,8 +18,9 @@ from selenium import webdriver
 import requests
 from requests.adapters import HTTPAdapter
 
-from BeautifulSoup import BeautifulSoup, Tag, Comment
+from BeautifulSoup import BeautifulSoup, Tag, Comment, NavigableString
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.html import strip_tags
 from django.utils.encoding import smart_unicode, DjangoUnicodeDecodeError
 from django import template
@@ -174,14 +176,19 @@ def clean_data(data):
     return m.sub(' ', data)
 
 
-def clean_all_html(data_html):
+def clean_all_html(data_html, single_parse=False):
     """
     Performs common html clean-up operations
     * removes empty html tags - table and p
     * removes the html comments
     * removes any style information from p and br tags
     * fixes the ampersands
+    @param single_parse if True, the html is parsed once and cleaned by the
+    CLEAN_HTML_VISITORS, see clean_html_tree
     """
+    if single_parse:
+        return clean_html_tree(data_html)
+
     # clean the p style elements, get rid of html comments
     # if there are empty p tags, get rid of them
     data_html = clean_html_style(data_html, 'p')
@@ -291,6 +298,115 @@ def clean_html_style(data, element, remove_comments=True, remove_empty=True):
     return smart_unicode(soup.renderContents())
 
 
+# characters removed by str.strip(), the legacy chain strips the rendered
+# utf-8 contents, non ascii spaces are left in place
+ASCII_WHITESPACE = ' \t\n\r\x0b\x0c'
+
+
+def _strip_contents(tag):
+    """
+    strips the leading and trailing whitespace of the tag contents, in place
+    """
+    for index, strip in ((0, unicode.lstrip), (-1, unicode.rstrip)):
+        while tag.contents and type(tag.contents[index]) is NavigableString:
+            text = tag.contents[index]
+            stripped = strip(text, ASCII_WHITESPACE)
+            if stripped:
+                if stripped != text:
+                    text.replaceWith(NavigableString(stripped))
+                break
+            text.extract()
+
+
+def remove_comments_visitor(soup):
+    [comment.extract() for comment in soup.findAll(text=lambda text: isinstance(text, Comment))]
+
+
+def remove_sup_script_visitor(soup):
+    [i.extract() for i in soup.findAll(re.compile('sup|script'))]
+
+
+def _is_flattened(element):
+    # Tag.__getattr__ falls back to find(), look in __dict__ only
+    return bool([p for p in element.findParents() if 'flattened' in p.__dict__])
+
+
+def clean_style_visitor(element, remove_empty=True):
+    """
+    returns a visitor doing what clean_html_style does for the element on the
+    same tree: drops the attributes, strips the contents and removes the empty
+    elements. clean_html_style turns the contents of the element into text,
+    the elements within an element flattened by an earlier visitor are left
+    untouched, so are they here
+    """
+    def visitor(soup):
+        for i in soup.findAll(element):
+            if _is_flattened(i):
+                continue
+            i.attrs = []
+            if 'attrMap' in i.__dict__:
+                del i.attrMap
+            _strip_contents(i)
+            if not i.contents and remove_empty:
+                i.extract()
+            else:
+                i.flattened = True
+    return visitor
+
+
+def _merge_text(tag, preserve=False):
+    if 'flattened' in tag.__dict__:
+        return
+    preserve = preserve or tag.name in BeautifulSoup.PRESERVE_WHITESPACE_TAGS
+    for child in list(tag.contents):
+        if isinstance(child, Tag):
+            _merge_text(child, preserve)
+        elif type(child) is NavigableString and child.parent is not None:
+            merged = child
+            while type(child.nextSibling) is NavigableString:
+                merged += child.nextSibling
+                child.nextSibling.extract()
+            if not preserve and not merged.translate(BeautifulSoup.STRIP_ASCII_SPACES):
+                merged = '\n' if '\n' in merged else ' '
+            if merged != child:
+                child.replaceWith(NavigableString(merged))
+
+
+def merge_text_visitor(soup):
+    """
+    merges the text nodes left next to each other by the removed elements and
+    collapses the whitespace only ones as BeautifulSoup does when parsing,
+    clean_all_html gets this from parsing the html again after each step
+    """
+    _merge_text(soup)
+
+
+# same steps, in the same order, as clean_all_html
+CLEAN_HTML_VISITORS = (
+    remove_comments_visitor,
+    remove_sup_script_visitor,
+    clean_style_visitor('p'),
+    merge_text_visitor,
+    clean_style_visitor('table'),
+    merge_text_visitor,
+)
+
+
+def clean_html_tree(data_html, visitors=CLEAN_HTML_VISITORS):
+    """
+    single parse version of clean_all_html, the html is parsed once, every
+    visitor updates the tree in place and the tree is rendered once.
+    clean_all_html renders the contents of the p and table tags as escaped
+    text, this keeps the markup, both are the same once unescaped, as done by
+    pre_process_data. Use the verify_html_cleanup command to compare both on
+    the saved entries
+    """
+    soup = BeautifulSoup(data_html)
+    for visitor in visitors:
+        visitor(soup)
+    return smart_unicode(soup.renderContents())
+
+
 def escape_text(data_html):
     """
     Converts > and < in the html to &gt; and &lt; respectively
@@ -486,7 +602,8 @@ def href_to_text(string_data):
 def pre_process_data(
     data_html, remove_cntrlM=True, remove_tags=settings.STRIP_TAGS,
     remove_images=False, insert_linebreaks=False, clean_html=True,
-    ascii_friendly=False, tidy=False):
+    ascii_friendly=False, tidy=False,
+    single_parse=getattr(settings, 'HTML_SINGLE_PARSE', False)):
     """
     basic processing to be done on the data before it is saved to the database
     this will be primarily used by aggregators and save method in Entry
@@ -499,6 +616,8 @@ def pre_process_data(
     @param insert_linebreaks if True, converts linebreaks to <p> tags
     @param clean_html if True, does basic html cleanup
     @param ascii_friendly if True, replaces non-ascii unciode characters with ascii
+    @param single_parse if True, the html cleanup parses the data only once,
+    defaults to settings.HTML_SINGLE_PARSE
     @return clean unescaped data, ready to be saved to the database
     """
     # import inside to avoid circular import error
@@ -552,7 +671,7 @@ def pre_process_data(
     
     # clean the html
     if clean_html:
-        data_html = clean_all_html(data_html)
+        data_html = clean_all_html(data_html, single_parse=single_parse)
     
     # we want everything in unicode, unescape HTML
     data_html = unescape(data_html)
@@ -707,6 +826,115 @@ def lazy_cached(func):
     return inner
 
 
+def _trie_pattern(node):
+    """
+    returns the regex for the trie node, a key of None marks the end of a word
+    """
+    optional = None in node
+    branches = [re.escape(c) + _trie_pattern(node[c]) for c in sorted(k for k in node if k is not None)]
+    if not branches:
+        return ''
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    pattern = '(?:%s)' % '|'.join(branches)
+    if optional:
+        pattern += '?'
+    return pattern
+
+
+def compile_words(words, flags=re.IGNORECASE):
+    """
+    compiles the words into a single regex matching any of them as a whole
+    word, the alternation is built from a trie of the words so that a single
+    scan of the text finds all of them, the longest word wins on a common
+    prefix. returns None when there are no words
+    """
+    trie = {}
+    for word in words:
+        word = word.strip()
+        if flags & re.IGNORECASE:
+            word = word.lower()
+        if not word:
+            continue
+        node = trie
+        for c in word:
+            node = node.setdefault(c, {})
+        node[None] = True
+    if not trie:
+        return None
+    return re.compile(r'\b%s\b' % _trie_pattern(trie), flags)
+
+
+# seconds a VersionedCache object is kept whatever its version, bounds the
+# staleness when the cache backend is not shared between the processes
+VERSIONED_CACHE_MAX_AGE = getattr(settings, 'VERSIONED_CACHE_MAX_AGE', 300)
+# seconds between two reads of the version from the cache
+VERSIONED_CACHE_CHECK_INTERVAL = getattr(settings, 'VERSIONED_CACHE_CHECK_INTERVAL', 2)
+
+
+class VersionedCache(object):
+    """
+    Keeps an object built by `builder` in process memory, the object is
+    rebuilt when the version stored in the django cache under `key` changes.
+    invalidate() bumps the version and accepts the signal arguments, connect
+    it to the post_save / post_delete signals of the models the object is
+    built from.
+
+    The version only reaches the other processes through a cache backend they
+    share (see CACHES in the settings), it is read at most every
+    check_interval seconds. The object is rebuilt after max_age seconds
+    whatever the version, so with a per process backend a change made
+    elsewhere is picked up within max_age
+
+    >>> tag_rule_index = VersionedCache('queues.tag_rule_index', build_tag_rule_index)
+    >>> post_save.connect(tag_rule_index.invalidate, sender=TagRule)
+    >>> tag_rule_index.get().match(tags)
+    """
+    def __init__(self, key, builder, max_age=VERSIONED_CACHE_MAX_AGE,
+                 check_interval=VERSIONED_CACHE_CHECK_INTERVAL):
+        self.key = key
+        self.builder = builder
+        self.max_age = max_age
+        self.check_interval = check_interval
+        self._version = None
+        self._value = None
+        self._built_on = 0
+        self._checked_on = 0
+
+    def _new_version(self):
+        # time based, a flushed cache must never hand out a version
+        # that an older build is still holding
+        return int(time.time() * 1000)
+
+    def get_version(self):
+        version = cache.get(self.key)
+        if version is None:
+            cache.add(self.key, self._new_version(), None)
+            version = cache.get(self.key)
+        return version
+
+    def get(self):
+        now = time.time()
+        if self._value is not None and now - self._built_on < self.max_age and \
+                now - self._checked_on < self.check_interval:
+            return self._value
+        version = self.get_version()
+        self._checked_on = now
+        if self._value is None or version != self._version or now - self._built_on >= self.max_age:
+            self._value = self.builder()
+            self._version = version
+            self._built_on = now
+        return self._value
+
+    def invalidate(self, *args, **kwargs):
+        self._value = None
+        try:
+            cache.incr(self.key)
+        except ValueError:
+            # key missing from the cache
+            cache.set(self.key, self._new_version(), None)
+
+
 REQUEST_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/40.0.2214.45 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -15,6 +15,9 @@ from penseive.exceptions import NotImplementedError
 
 logger = logging.getLogger(__name__)
 
+# number of rows inserted per statement when saving the entities of an object
+ENTITY_BATCH_SIZE = 500
+
 
 class Penseive(object):
     """
@@ -105,6 +108,97 @@ class Penseive(object):
         """
         raise NotImplementedError('Missing module:: check_penseive_quote_exists')
 
+    def _get_or_create_in_bulk(self, model, keys, lookup, key, build):
+        """
+        returns a {key: object} dict for the keys, lookup(keys) returns the
+        queryset of the existing objects, key(obj) the key of an object and
+        build(key) a new unsaved object, the missing objects are created with
+        a single bulk_create
+        """
+        found = {}
+        for obj in lookup(keys):
+            found.setdefault(key(obj), obj)
+        missing = [k for k in keys if k not in found]
+        if missing:
+            model.objects.bulk_create([build(k) for k in missing], batch_size=ENTITY_BATCH_SIZE)
+            # bulk_create does not return the ids on every database, fetch them
+            for obj in lookup(missing):
+                found.setdefault(key(obj), obj)
+        return found
+
+    def save_entities(self, pitem):
+        """
+        stores self.entities against the penseive item, all the types and
+        entities are fetched with one query each, the missing ones are
+        created in bulk and the new EntityItems are inserted with a single
+        statement. The object is queued for indexing once
+
+        Does the same as get_or_create on the type, the entity and the
+        EntityItem of every entity, the EntityItem active flag is computed
+        as Entity.save() and EntityItem.save() would have
+        """
+        if not self.entities:
+            return
+
+        type_defaults = self.entities[0]['type']['defaults']
+        types = self._get_or_create_in_bulk(
+            EntityType,
+            list(set((item['type']['name'], item['type']['source']) for item in self.entities)),
+            lambda keys: EntityType.objects.filter(
+                name__in=[name for name, source in keys], source__in=set(source for name, source in keys)),
+            lambda type: (type.name, type.source),
+            lambda key: EntityType(name=key[0], source=key[1], **type_defaults),
+        )
+
+        # only the defaults that are Entity fields are kept
+        entity_fields = set(f.name for f in Entity._meta.fields)
+        entity_defaults = dict((k, v) for k, v in self.entities[0]['entity']['defaults'].items()
+                               if k in entity_fields)
+
+        type_of = dict((type.id, type) for type in types.values())
+
+        def build_entity(key):
+            entity = Entity(name=key[0], type=type_of[key[1]], **entity_defaults)
+            # as Entity.save() does, a new entity is inactive if its type is
+            entity.active = entity.get_active_status()
+            return entity
+
+        entities = self._get_or_create_in_bulk(
+            Entity,
+            list(set((item['entity']['name'], types[(item['type']['name'], item['type']['source'])].id)
+                     for item in self.entities)),
+            lambda keys: Entity.objects.filter(
+                name__in=[name for name, type_id in keys], type__in=set(type_id for name, type_id in keys)),
+            lambda entity: (entity.name, entity.type_id),
+            build_entity,
+        )
+        # the new entities have no parent, their path is their own id
+        Entity.objects.filter(id__in=[e.id for e in entities.values() if not e.path]).update_root_paths()
+
+        existing = set(EntityItem.objects.filter(penseive_item=pitem).values_list('entity', 'relevance'))
+        entity_items = []
+        for item in self.entities:
+            type = types[(item['type']['name'], item['type']['source'])]
+            entity = entities[(item['entity']['name'], type.id)]
+            if (entity.id, item['relevance']) in existing:
+                continue
+            existing.add((entity.id, item['relevance']))
+
+            # Note: the item active flag should be based on type's and entity's active flag
+            # and on the relevance threshold of the type, see EntityItem.save()
+            # this can be manually changed by the user later using admin screen
+            active = type.active and entity.active and \
+                item['relevance'] >= type.relevance_threshold
+            entity_items.append(EntityItem(
+                penseive_item=pitem, entity=entity, type=type,
+                relevance=item['relevance'], active=active))
+
+        if entity_items:
+            EntityItem.objects.bulk_create(entity_items, batch_size=ENTITY_BATCH_SIZE)
+            # bulk_create does not send post_save, queue the object once
+            from penseive.signals import update_indexing_queue
+            update_indexing_queue([pitem.object_id])
+
     def update_penseive(self):
         # check if entities for the given object already exist in the penseive
         pitem, created = PenseiveItem.objects.get_or_create(
@@ -119,31 +213,8 @@ class Penseive(object):
                 self.extract_entities()
                 
             # create new relationship with entities
-            for item in self.entities:
-                type, ct = EntityType.objects.get_or_create(**item['type'])
-                
-                # add type to entity dict
-                item['entity']['type'] = type
-                entity, ec = Entity.objects.get_or_create(**item['entity'])
-                
-                # Note: the item active flag should be based on type's and entity's active flag
-                # first time when type or entity is created, it will always be active
-                # user can change the default setting via admin screen
-                # for subsequent additions:
-                # if a type is inactive, item will be inactive
-                # if a type is active but entity is inactive - mark the item as inactive
-                # this can be manually changed by the user later using admin screen                
-                item_active_flag = True
-                if not type.active or (type.active and not entity.active):
-                    item_active_flag = False
-                # Note: this cannot be done at entity_item.save() as the user
-                # has full permissions to make any entity item active / inactive
-                    
-                entity_item = EntityItem.objects.get_or_create(
-                    penseive_item=pitem, entity=entity, relevance=item['relevance'],
-                    defaults={'active': item_active_flag }
-                )
-        
+            self.save_entities(pitem)
+
         if not created and self.check_penseive_quote_exists(pitem):
             logger.debug('Calais quotes exist for penseive item: %s, nothing to do' % pitem)
         else:
@@ -0,0 +1,99 @@
+"""
+Drains the Calais queue, see penseive.models.CalaisQueueItem
+
+The due items are claimed (Pending -> Running) and tagged by a bounded pool of
+threads, at most CALAIS_WORKERS requests are sent to Calais at the same time.
+A failed item goes back to Pending with an exponential backoff, it is marked as
+Failed after CALAIS_MAX_ATTEMPTS attempts. An item left Running by a worker that
+died is claimed again after CALAIS_LEASE seconds, see CalaisQueueManager.due().
+"""
+import datetime
+import logging
+import threading
+from Queue import Queue
+
+from django.conf import settings
+from django.db import connection
+
+from penseive.models import CalaisQueueItem
+from penseive.sites import site
+
+logger = logging.getLogger(__name__)
+
+CALAIS_WORKERS = getattr(settings, 'CALAIS_WORKERS', 4)
+CALAIS_MAX_ATTEMPTS = getattr(settings, 'CALAIS_MAX_ATTEMPTS', 5)
+# seconds waited before the first retry, doubled on every retry
+CALAIS_BACKOFF = getattr(settings, 'CALAIS_BACKOFF', 30)
+CALAIS_MAX_BACKOFF = getattr(settings, 'CALAIS_MAX_BACKOFF', 6 * 60 * 60)
+
+
+def tag_item(item):
+    obj = item.content_object
+    if obj is None:
+        # deleted since it was queued
+        return
+    site.get_penseive(obj.__class__).update_opencalais([obj])
+
+
+def process_item(item, max_attempts=CALAIS_MAX_ATTEMPTS, backoff=CALAIS_BACKOFF):
+    """
+    tags the claimed item, returns its new status
+    """
+    # an item queued again while running is left pending
+    running = CalaisQueueItem.objects.filter(pk=item.pk, status='R')
+    try:
+        tag_item(item)
+    except Exception, e:
+        attempts = item.attempts + 1
+        delay = min(backoff * 2 ** (attempts - 1), CALAIS_MAX_BACKOFF)
+        status = 'F' if attempts >= max_attempts else 'P'
+        running.update(status=status, attempts=attempts, last_error=unicode(e),
+                       next_attempt_on=datetime.datetime.now() + datetime.timedelta(seconds=delay))
+        logger.warning('Calais tagging failed for %s, attempt %d: %s' % (item, attempts, e))
+        return status
+    running.update(status='D', last_error='')
+    return 'D'
+
+
+def worker(items, results, max_attempts, backoff):
+    try:
+        while True:
+            item = items.get()
+            if item is None:
+                break
+            try:
+                results.append(process_item(item, max_attempts, backoff))
+            except Exception, e:
+                logger.error('Unable to process %s: %s' % (item, e))
+    finally:
+        # every thread has its own connection
+        connection.close()
+
+
+def process_queue(batch_size=100, workers=CALAIS_WORKERS, max_attempts=CALAIS_MAX_ATTEMPTS,
+                  backoff=CALAIS_BACKOFF):
+    """
+    tags up to batch_size due items, returns a {status: count} dict
+    """
+    items = Queue()
+    results = []
+    threads = [threading.Thread(target=worker, args=(items, results, max_attempts, backoff))
+               for i in range(workers)]
+    for t in threads:
+        t.daemon = True
+        t.start()
+
+    try:
+        for item in CalaisQueueItem.objects.due()[:batch_size]:
+            if CalaisQueueItem.objects.claim(item):
+                items.put(item)
+    finally:
+        for t in threads:
+            items.put(None)
+        for t in threads:
+            t.join()
+
+    counts = {}
+    for status in results:
+        counts[status] = counts.get(status, 0) + 1
+    return counts
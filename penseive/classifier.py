@@ -2,18 +2,174 @@
 Text Classifier - Wrapper around the Custom Classifier app built by Cohan
 """
 
-import urllib
-import urllib2
+import hashlib
 import logging
+import re
+import threading
 from operator import itemgetter
+from Queue import Queue
 
+import requests
 from BeautifulSoup import BeautifulStoneSoup
+from django.conf import settings
+from django.core.cache import cache
 
 from cutils.utils import unicode_to_ascii
 
-empty_soup = BeautifulStoneSoup("")
+logger = logging.getLogger(__name__)
 
-CLASSIFIER_URL = "http://classifier.contify.com:8085/contify/cl101"
+CLASSIFIER_URL = getattr(settings, 'CLASSIFIER_URL', "http://classifier.contify.com:8085/contify/cl101")
+CLASSIFIER_TIMEOUT = getattr(settings, 'CLASSIFIER_TIMEOUT', 30)
+# number of texts sent to the classifier at the same time by classify_many()
+CLASSIFIER_WORKERS = getattr(settings, 'CLASSIFIER_WORKERS', 4)
+# seconds the classifications are cached for, keyed by the hash of the text
+CLASSIFIER_CACHE_TIMEOUT = getattr(settings, 'CLASSIFIER_CACHE_TIMEOUT', 7 * 24 * 60 * 60)
+
+
+def empty_classification():
+    """
+    returns the classification of a text that could not be classified, a new
+    dict every time, the callers may change it
+    """
+    return {'results': [], 'best_result': '', 'high_recall_results': []}
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    returns the session shared by the threads, its pool keeps a connection
+    per worker open to the classifier
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(CLASSIFIER_WORKERS, 10))
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+
+def normalize(text):
+    """
+    returns the text as sent to the classifier, whitespace collapsed
+    """
+    return re.sub(r'\s+', ' ', unicode_to_ascii(text or u'')).strip()
+
+
+def cache_key(data):
+    return 'penseive.classifier.%s' % hashlib.sha1(data).hexdigest()
+
+
+def parse_classifications(raw):
+    """
+    parses the classifier response once, returns a dict of the results
+    sorted by probability, the best result and the high recall results
+    """
+    soup = BeautifulStoneSoup(raw)
+    classification = empty_classification()
+
+    results = []
+    for s in soup.findAll('result'):
+        c = s.category.renderContents()
+        # if probability is not available it is set to null
+        # ValueError will be thrown during conversion to float
+        # set null to 0.0
+        try:
+            p = float(s.probability.renderContents())
+        except ValueError:
+            p = 0.0
+        results.append({'category': c, 'probability': p})
+    classification['results'] = sorted(results, key=itemgetter('probability'), reverse=True)
+
+    if soup.bestresult is not None and soup.bestresult.category is not None:
+        classification['best_result'] = soup.bestresult.category.renderContents()
+
+    r = soup.high_recall_results
+    if r is not None and r.category is not None:
+        classification['high_recall_results'] = [
+            {'category': category.renderContents()} for category in r.findAll('category')]
+    return classification
+
+
+def fetch_classification(data, timeout=CLASSIFIER_TIMEOUT):
+    """
+    sends the normalized text to the classifier, returns the parsed
+    classification, None when the classifier is not responding or its
+    response can not be parsed
+    """
+    try:
+        response = get_session().post(CLASSIFIER_URL, data={'DATA': data}, timeout=timeout)
+        response.raise_for_status()
+    except requests.RequestException, e:
+        logger.error("classifier app url %s not responding: %s" % (CLASSIFIER_URL, e))
+        return None
+    try:
+        return parse_classifications(response.content)
+    except Exception, e:
+        logger.error("unable to parse the classifier response: %s" % e)
+        return None
+
+
+def classify(text, timeout=CLASSIFIER_TIMEOUT):
+    """
+    returns the classification of the text, from the cache if the same text
+    was classified before
+    """
+    return classify_many([text], workers=1, timeout=timeout)[0]
+
+
+def classify_many(texts, workers=CLASSIFIER_WORKERS, timeout=CLASSIFIER_TIMEOUT):
+    """
+    returns the classifications of the texts, in their order. The cached
+    ones are read with one get_many(), the others are sent to the classifier
+    by `workers` threads, a text appearing twice is sent once
+    """
+    data = [normalize(text) for text in texts]
+    keys = dict((d, cache_key(d)) for d in data)
+    cached = cache.get_many(keys.values())
+    classifications = dict((d, cached[key]) for d, key in keys.items() if key in cached)
+
+    missing = [d for d in set(data) if d not in classifications]
+    fetched = {}
+    if len(missing) <= 1 or workers <= 1:
+        for d in missing:
+            fetched[d] = fetch_classification(d, timeout)
+    else:
+        jobs = Queue()
+        for d in missing:
+            jobs.put(d)
+
+        def worker():
+            while True:
+                d = jobs.get()
+                if d is None:
+                    break
+                # a failure must not end the thread, its texts would be missing
+                try:
+                    fetched[d] = fetch_classification(d, timeout)
+                except Exception, e:
+                    logger.error("unable to classify the text: %s" % e)
+                    fetched[d] = None
+
+        threads = [threading.Thread(target=worker) for i in range(min(workers, len(missing)))]
+        for t in threads:
+            t.daemon = True
+            t.start()
+            jobs.put(None)
+        for t in threads:
+            t.join()
+
+    # the failures are not cached, they are retried on the next call
+    cache.set_many(dict((keys[d], c) for d, c in fetched.items() if c is not None),
+                   CLASSIFIER_CACHE_TIMEOUT)
+    for d, c in fetched.items():
+        classifications[d] = c if c is not None else empty_classification()
+
+    return [classifications[d] for d in data]
 
 
 class Classifier():
@@ -67,66 +223,32 @@ class Classifier():
 
     """
     
-    def __init__(self, text):
-        
-        self.raw_results = ''
-        self.xml_soup = self._fetch_classifications(text)
-        self.results = self.get_results()
-        self.best_result = self.get_best_result()
-        self.high_recall_results = self.get_high_recall_results()
-        
-    def _fetch_classifications(self, text):
+    def __init__(self, text, classification=None):
+        if classification is None:
+            classification = classify(text)
+        self.results = classification['results']
+        self.best_result = classification['best_result']
+        self.high_recall_results = classification['high_recall_results']
+
+    @classmethod
+    def classify_many(cls, texts, workers=CLASSIFIER_WORKERS):
         """
-        Fetch the results from the Classifier and store it a dictionary obj
+        returns a Classifier per text, the texts are classified concurrently
         """
-        values = {'DATA': unicode_to_ascii(text)}
-        data = urllib.urlencode(values)
-        try:
-            req = urllib2.Request(CLASSIFIER_URL, data)
-            response = urllib2.urlopen(req)
-            self.raw_results = response.read()
-        except urllib2.URLError, e:
-            logging.error("classifier app url %s not responding" %CLASSIFIER_URL)
-            return BeautifulStoneSoup("")
-        # get the data in soup format!
-        return BeautifulStoneSoup(self.raw_results)
-    
+        return [cls(text, classification) for text, classification in
+                zip(texts, classify_many(texts, workers))]
+
     def get_best_result(self):
-        if self.xml_soup != empty_soup:
-            return self.xml_soup.bestresult.category.renderContents()
-        return ""
-    
+        return self.best_result
+
     def get_results(self):
-        results = []
-        if self.xml_soup != empty_soup:
-            for s in self.xml_soup.findAll('result'):
-                c = s.category.renderContents()
-                
-                # if probability is not available it is set to null
-                # ValueError will be thrown during conversion to float
-                # set null to 0.0
-                try:
-                    p = float(s.probability.renderContents())
-                except ValueError:
-                    p = 0.0
-                
-                results.append({'category':c, 'probability': p})
-                
-            return sorted(results, key=itemgetter('probability'), reverse=True)
-        return []
-            
+        return self.results
+
     def get_high_recall_results(self):
-        high_recall_results = []
-        if self.xml_soup != empty_soup:
-            r = self.xml_soup.high_recall_results
-            if r.category is not None:
-                for category in r.findAll('category'):
-                    high_recall_results.append({'category' : category.renderContents() })
-                return high_recall_results
-        return []
-            
+        return self.high_recall_results
+
     def print_summary(self):
         print u'Best Result: %s' % self.best_result
-        
+
         for i in self.results:
             print u'%s (%.10f)' % (i['category'], i['probability'])
@@ -26,6 +26,9 @@ class PenseiveEntities(object):
         signals.post_delete.disconnect(self.remove_object, sender=model)
         
     def update_opencalais(self, objects):
+        """
+        tags the objects with Calais right away, used by the calais_worker
+        """
         from penseive.opencalais import OpenCalais
         for object in objects:
             o = OpenCalais(object, dict(self.calais_content_fields))
@@ -33,10 +36,12 @@ class PenseiveEntities(object):
     
     def update_object(self, instance, **kwargs):
         """
-        Update the entity information for a single object.
+        Queue the object to have its entity information updated, the
+        calais_worker command tags the queued objects
         """
         if self.calais_content_fields:
-            self.update_opencalais([instance])
+            from penseive.models import CalaisQueueItem
+            CalaisQueueItem.objects.enqueue(instance)
 
     def remove_object(self, instance, **kwargs):
         """
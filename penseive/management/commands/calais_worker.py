@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Tags the objects waiting in the Calais queue, with --loop keeps polling the queue.'
+
+    def add_arguments(self, parser):
+        from penseive.calais_queue import CALAIS_WORKERS
+
+        parser.add_argument('--workers', type=int, default=CALAIS_WORKERS,
+                            help='number of objects tagged at the same time')
+        parser.add_argument('--batch', type=int, default=100,
+                            help='number of queued objects claimed per round')
+        parser.add_argument('--loop', action='store_true',
+                            help='keep polling the queue')
+        parser.add_argument('--sleep', type=int, default=10,
+                            help='seconds to wait when the queue is empty, with --loop')
+
+    def handle(self, *args, **options):
+        from penseive.calais_queue import process_queue
+
+        while True:
+            counts = process_queue(batch_size=options['batch'], workers=options['workers'])
+            if counts:
+                self.stdout.write('done: %d, retry: %d, failed: %d' % (
+                    counts.get('D', 0), counts.get('P', 0), counts.get('F', 0)))
+            if not options['loop']:
+                break
+            if not counts:
+                time.sleep(options['sleep'])
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the materialized path of every Entity from the parent ids, use it to backfill ' \
+           'the paths or to repair them after updates done outside Entity.save().'
+
+    def handle(self, *args, **options):
+        from penseive.models import Entity
+
+        updated = Entity.objects.rebuild_paths()
+        self.stdout.write('%d entities updated' % updated)
@@ -1,11 +1,22 @@
+import datetime
+import json
+import logging
 from operator import itemgetter
 from itertools import groupby
 
-from django.db import models
+from django.conf import settings
+from django.db import models, IntegrityError, transaction
+from django.db.models import Case, CharField, F, Q, Value, When, signals
+from django.db.models.functions import Cast, Concat, Substr
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.urlresolvers import reverse
 
+from cutils.tree import IndustryTree
+from cutils.utils import VersionedCache
+
+logger = logging.getLogger(__name__)
+
 # Create your models here.
 
 ENTITY_SOURCE = (
@@ -20,6 +31,15 @@ ENTITY_STATUS = (
     ('I', 'Inactive'),
 )
 
+CALAIS_QUEUE_STATUS = (
+    ('P', 'Pending'),
+    ('R', 'Running'),
+    ('D', 'Done'),
+    ('F', 'Failed'),
+)
+# seconds after which a Running item, left by a worker that died, is claimed again
+CALAIS_LEASE = getattr(settings, 'CALAIS_LEASE', 30 * 60)
+
 
 class Industry(models.Model):
     """
@@ -41,15 +61,10 @@ class Industry(models.Model):
         """
         count the number of parents for this entity
         """
-        if not self.parent:
-            return 0
-        return 1 + self.parent.level()
+        return industry_tree.get().level(self)
 
     def full_name(self):
-        if self.parent_id:
-            return '%s%s%s' % (self.parent, self.get_separator(), self.name)
-        else:
-            return self.name
+        return industry_tree.get().full_name(self)
 
     def get_separator(self):
         return ' :: '
@@ -58,9 +73,19 @@ class Industry(models.Model):
         """
         returns True if this entity does not have a child
         """
-        if self.child_set.all():
-            return False
-        return True
+        return industry_tree.get().is_leaf(self.pk)
+
+    def get_ancestors(self):
+        """
+        returns the parent industries, root first
+        """
+        ids = industry_tree.get().ancestors(self.pk)
+        ancestors = Industry.objects.in_bulk(ids)
+        return [ancestors[i] for i in ids if i in ancestors]
+
+
+# the industries are loaded once, full_name / level / is_leaf are read from the tree
+industry_tree = VersionedCache('penseive.industry_tree', lambda: IndustryTree.build(Industry))
 
 
 class EntityType(models.Model):
@@ -84,6 +109,53 @@ class EntityType(models.Model):
         return reverse('penseive.views.entities', args=[self.name])
 
 
+# number of entities updated per UPDATE statement when the paths are rebuilt
+ENTITY_PATH_BATCH_SIZE = 500
+
+
+class EntityQuerySet(models.QuerySet):
+    def update_root_paths(self):
+        """
+        sets the path of the entities without a parent, for the entities created
+        by bulk_create(), returns the number of entities updated
+        """
+        return self.filter(parent__isnull=True).update(
+            path=Concat(Value('/'), Cast('id', CharField(max_length=20)), Value('/')))
+
+    def rebuild_paths(self):
+        """
+        recomputes the path of every entity from the parent ids, the changed
+        paths are written in batches, returns the number of entities updated
+        """
+        parents = {}
+        paths = {}
+        for id, parent_id, path in self.model.objects.values_list('id', 'parent_id', 'path'):
+            parents[id] = parent_id
+            paths[id] = path
+
+        def compute(id):
+            chain = []
+            while id is not None and id not in chain:
+                chain.append(id)
+                id = parents.get(id)
+            if id is not None:
+                logger.error('Entity %s has a cyclic parent hierarchy' % id)
+            return '/%s/' % '/'.join(str(i) for i in reversed(chain))
+
+        changed = {}
+        for id in self.values_list('id', flat=True):
+            path = compute(id)
+            if path != paths[id]:
+                changed[id] = path
+
+        ids = sorted(changed)
+        for start in range(0, len(ids), ENTITY_PATH_BATCH_SIZE):
+            batch = ids[start:start + ENTITY_PATH_BATCH_SIZE]
+            self.model.objects.filter(id__in=batch).update(
+                path=Case(*[When(id=id, then=Value(changed[id])) for id in batch], output_field=CharField()))
+        return len(ids)
+
+
 class Entity(models.Model):
     """
     class to store the Entity information retrieved from Calais, Alchemy etc
@@ -133,6 +205,19 @@ class Entity(models.Model):
     """
     status = models.CharField(max_length=1, choices=ENTITY_STATUS, default='P', null=True, blank=True, db_index=True)
 
+    objects = EntityQuerySet.as_manager()
+
+    """
+    materialized path of the parent hierarchy, ids of the ancestors and of the
+    entity itself eg /369177/369176/411767/, maintained by save()
+    run ./manage.py rebuild_entity_paths after adding the column
+
+    ALTER TABLE penseive_entity ADD COLUMN "path" varchar(1000) NOT NULL DEFAULT '';
+    CREATE INDEX "penseive_entity_path" ON "penseive_entity" ("path");
+    CREATE INDEX "penseive_entity_path_like" ON "penseive_entity" ("path" varchar_pattern_ops);
+    """
+    path = models.CharField(max_length=1000, default='', blank=True, editable=False, db_index=True)
+
     class Meta:
         verbose_name = 'entity'
         verbose_name_plural = 'entities'
@@ -243,10 +328,57 @@ class Entity(models.Model):
         Note the example above shows ids, they will be replaced by the actual
         Entity object
         """
-        result = []
-        for i in self.get_child_entities():
-            result.append((i, i.get_all_child_entities()))
-        return result
+        children = {}
+        for i in self.get_descendants().order_by('id'):
+            children.setdefault(i.parent_id, []).append(i)
+
+        def build(parent_id):
+            return [(i, build(i.id)) for i in children.get(parent_id, [])]
+        return build(self.id)
+
+    def get_ancestor_ids(self):
+        """
+        returns the ids of the parent hierarchy, root first
+        """
+        return [int(i) for i in self.path.split('/') if i][:-1]
+
+    def get_ancestors(self):
+        """
+        returns the parent entities across all hierarchies
+        """
+        return Entity.objects.filter(id__in=self.get_ancestor_ids())
+
+    def get_descendants(self):
+        """
+        returns the child entities across all hierarchies, ordered by path ie
+        every entity is followed by its own child entities
+        """
+        if not self.path:
+            return Entity.objects.none()
+        return Entity.objects.filter(path__startswith=self.path).exclude(id=self.id).order_by('path')
+
+    def update_path(self):
+        """
+        sets the path from the parent path, moves the child entities along when
+        the path changes
+        """
+        # the parent instance may hold a stale path, read it from the db
+        parent_path = Entity.objects.filter(id=self.parent_id).values_list('path', flat=True).first() \
+            if self.parent_id else '/'
+        path = '%s%d/' % (parent_path, self.id)
+        if path == self.path:
+            return
+        if self.path and path.startswith(self.path):
+            logger.error('Entity %s can not be a child of its own child entity %s' % (self.id, self.parent_id))
+            return
+
+        old_path = self.path
+        with transaction.atomic():
+            Entity.objects.filter(id=self.id).update(path=path)
+            if old_path:
+                Entity.objects.filter(path__startswith=old_path).exclude(id=self.id).update(
+                    path=Concat(Value(path), Substr('path', len(old_path) + 1)))
+        self.path = path
 
     def get_sameas_child_entities(self):
         """
@@ -339,6 +471,7 @@ class Entity(models.Model):
                     sender=self, entity=self, active=self.active)
 
             super(Entity, self).save()
+            self.update_path()
         else:
             # raise exceptions
             pass
@@ -419,14 +552,13 @@ class PenseiveItem(models.Model):
             # then we fetch UNIVERISITY and ORGANIZATION and make sure it gets indexed
             # along with IITD
 
-            result = []
-            while qs.count() > 0:
-                result.extend(qs)
-                p = list(qs.exclude(parent__isnull=True).values_list('parent', flat=True))
-                if p:
-                    qs = Entity.objects.filter(id__in=p)
-                else:
-                    qs = Entity.objects.none()
+            result = list(qs.select_related('type', 'parent__type', 'same_as__type'))
+            ancestor_ids = set()
+            for i in result:
+                ancestor_ids.update(i.get_ancestor_ids())
+            if ancestor_ids:
+                result.extend(Entity.objects.filter(id__in=ancestor_ids).select_related(
+                    'type', 'parent__type', 'same_as__type'))
 
             r = []
             for i in list(set(result)):
@@ -530,3 +662,121 @@ class QuoteItem(models.Model):
     def __unicode__(self):
         return u'%s' % (self.quote_text)
 
+
+class CalaisQueueManager(models.Manager):
+    def enqueue(self, obj):
+        """
+        queue the object to be tagged by Calais, an object already in the
+        queue is set back to pending
+        """
+        content_type = ContentType.objects.get_for_model(obj)
+        values = {'status': 'P', 'attempts': 0, 'next_attempt_on': datetime.datetime.now(), 'last_error': ''}
+        if self.filter(content_type=content_type, object_id=obj.pk).update(**values):
+            return
+        try:
+            with transaction.atomic():
+                self.create(content_type=content_type, object_id=obj.pk, **values)
+        except IntegrityError:
+            # queued by someone else in the meantime
+            pass
+
+    def due(self, lease=CALAIS_LEASE):
+        """
+        the pending items due and the running items not updated for lease
+        seconds, whose worker died
+        """
+        now = datetime.datetime.now()
+        return self.filter(
+            Q(status='P', next_attempt_on__lte=now) |
+            Q(status='R', updated_on__lt=now - datetime.timedelta(seconds=lease))
+        ).order_by('next_attempt_on')
+
+    def claim(self, item):
+        """
+        returns True if the due item could be marked as running by this
+        worker, a running item claimed again counts as an attempt
+        """
+        values = {'status': 'R', 'updated_on': datetime.datetime.now()}
+        if item.status == 'R':
+            values['attempts'] = F('attempts') + 1
+        # the item is claimed by a single worker, the one that still sees it
+        # as it was read
+        claimed = self.filter(pk=item.pk, status=item.status, updated_on=item.updated_on).update(**values) == 1
+        if claimed and item.status == 'R':
+            item.attempts += 1
+        return claimed
+
+
+class CalaisQueueItem(models.Model):
+    """
+    objects waiting to be tagged by Calais, saved objects are queued here
+    instead of being tagged in post_save, the calais_worker command drains
+    the queue, failures are retried with an exponential backoff and the
+    items of the workers that died are claimed again after CALAIS_LEASE
+
+    CREATE TABLE "penseive_calaisqueueitem" (
+    "id" serial NOT NULL PRIMARY KEY,
+    "content_type_id" integer NOT NULL REFERENCES "django_content_type" ("id") DEFERRABLE INITIALLY DEFERRED,
+    "object_id" integer CHECK ("object_id" >= 0) NOT NULL,
+    "status" varchar(1) NOT NULL,
+    "attempts" integer NOT NULL,
+    "next_attempt_on" timestamp with time zone NOT NULL,
+    "last_error" text NOT NULL,
+    "created_on" timestamp with time zone NOT NULL,
+    "updated_on" timestamp with time zone NOT NULL,
+    UNIQUE ("content_type_id", "object_id")
+    );
+    CREATE INDEX "penseive_calaisqueueitem_status_next_attempt_on" ON "penseive_calaisqueueitem" ("status", "next_attempt_on");
+    """
+    content_type = models.ForeignKey(ContentType)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey('content_type', 'object_id')
+    status = models.CharField(max_length=1, choices=CALAIS_QUEUE_STATUS, default='P')
+    attempts = models.IntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=datetime.datetime.now)
+    last_error = models.TextField(blank=True)
+
+    created_on = models.DateTimeField(auto_now_add=True)
+    updated_on = models.DateTimeField(auto_now=True)
+
+    objects = CalaisQueueManager()
+
+    class Meta:
+        unique_together = (('content_type', 'object_id',),)
+        index_together = (('status', 'next_attempt_on'),)
+
+    def __unicode__(self):
+        return u'%s %s: %s' % (self.content_type, self.object_id, self.get_status_display())
+
+
+class CalaisResponse(models.Model):
+    """
+    Calais responses by the sha1 of the content analyzed, content that has
+    already been analyzed is never sent to Calais again
+
+    CREATE TABLE "penseive_calaisresponse" (
+    "id" serial NOT NULL PRIMARY KEY,
+    "content_hash" varchar(40) NOT NULL UNIQUE,
+    "language" varchar(100) NOT NULL,
+    "response" text NOT NULL,
+    "created_on" timestamp with time zone NOT NULL
+    );
+    """
+    content_hash = models.CharField(max_length=40, unique=True)
+    language = models.CharField(max_length=100)
+    response = models.TextField()
+
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    def __unicode__(self):
+        return u'%s' % (self.content_hash)
+
+    def get_response(self):
+        return json.loads(self.response)
+
+    def set_response(self, response):
+        self.response = json.dumps(response)
+
+
+signals.post_save.connect(industry_tree.invalidate, sender=Industry)
+signals.post_delete.connect(industry_tree.invalidate, sender=Industry)
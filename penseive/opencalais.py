@@ -2,18 +2,20 @@
 Integrate Open Calais with the Peseive
 Uses calais.py to fetch the tags and extract meanigful information from it
 """
+import hashlib
 import logging
-import time
 
 from django.conf import settings
+from django.db import IntegrityError, transaction
 from django.db.models.fields import FieldDoesNotExist
+from django.utils.encoding import smart_str
 from django.utils.safestring import mark_safe
 
 from calais import Calais
 from cutils.utils import escape_text, unicode_to_ascii, pre_process_data
 from penseive import base
 from penseive.exceptions import OpenCalaisTagFetchError
-from penseive.models import Entity, EntityType
+from penseive.models import CalaisResponse, Entity, EntityType
 
 logger = logging.getLogger(__name__)
 
@@ -116,6 +118,36 @@ class OpenCalais(base.Penseive):
             # not sure why ... 
             content_type = 'TEXT/HTML'
         
+        # content analyzed before is not sent to Calais again
+        content_hash = hashlib.sha1(smart_str(u'%s\n%s' % (content_type, content))).hexdigest()
+        try:
+            cached = CalaisResponse.objects.get(content_hash=content_hash)
+            language, response = cached.language, cached.get_response()
+            logger.debug('Calais response found in cache for %s' % self.content_object)
+        except CalaisResponse.DoesNotExist:
+            language, response = self._analyze(content, content_type)
+            cached = CalaisResponse(content_hash=content_hash, language=language)
+            cached.set_response(response)
+            try:
+                with transaction.atomic():
+                    cached.save()
+            except IntegrityError:
+                # cached by another worker in the meantime
+                pass
+
+        # do a quick sanity check:
+        if not language == 'English':
+            raise OpenCalaisTagFetchError(
+                'We only support English language, found: %s' % language)
+
+        # all looks good
+        logger.debug('Calais successfully analyzed: %s' % self.content_object)
+        self.results = response
+
+    def _analyze(self, content, content_type):
+        """
+        sends the content to Calais, returns the language and the simplified response
+        """
         # lets get to business - fetch the tags
         try:
             results = self.calais.analyze(
@@ -132,16 +164,7 @@ class OpenCalais(base.Penseive):
             raise OpenCalaisTagFetchError(
                 'Unknown Calais error, unable to analyze: %s. Error: %s' % (
                     self.content_object, e))
-        
-        # do a quick sanity check:
-        if not results.doc['meta']['language'] == 'English':
-            raise OpenCalaisTagFetchError(
-                'We only support English language, found: %s' \
-                    % results.doc['meta']['language'])
-        
-        # all looks good
-        logger.debug('Calais successfully analyzed: %s' % self.content_object)
-        self.results = results.simplified_response
+        return results.doc['meta']['language'], results.simplified_response
 
     def check_penseive_exists(self, pitem):
         """returns True if calais entities exist for the penseive item p"""
@@ -206,13 +229,9 @@ class OpenCalais(base.Penseive):
         tags and topics fetched to the list
         """
         # check if the results have been populated
+        # errors are raised, the Calais queue retries them later
         if not self.results:
-            try:
-                self.analyze()
-            except OpenCalaisTagFetchError, e:
-                # try once again ...
-                time.sleep(30)
-                self.analyze()
+            self.analyze()
                     
         self.entities = []
 
@@ -244,13 +263,9 @@ class OpenCalais(base.Penseive):
         """
         
         # check if the results have been populated
+        # errors are raised, the Calais queue retries them later
         if not self.results:
-            try:
-                self.analyze()
-            except OpenCalaisTagFetchError, e:
-                # try once again ...
-                time.sleep(30)
-                self.analyze()
+            self.analyze()
         
         self.quotes = []
         
@@ -4,8 +4,15 @@ unittest). These will both pass when you run "manage.py test".
 
 Replace these with more appropriate tests for your application.
 """
+import datetime
+import json
+import urllib2
+import urlparse
+
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from cutils.testing import StubServer
 
-from django.test import TestCase
 
 class SimpleTest(TestCase):
     def test_basic_addition(self):
@@ -21,3 +28,223 @@ Another way to test that 1 + 1 is equal to 2.
 True
 """}
 
+
+CALAIS_OK = (200, json.dumps({'doc': {'meta': {'language': 'English'}}, 'simple': {}}))
+CALAIS_ERROR = (500, '')
+
+
+class StubCalaisResponse(object):
+    def __init__(self, raw):
+        self.doc = raw['doc']
+        self.simplified_response = raw['simple']
+
+
+class StubCalais(object):
+    """
+    the Calais client, posting to the stub server
+    """
+    url = None
+
+    def __init__(self, api_key, submitter):
+        self.processing_directives = {}
+
+    def analyze(self, content, content_type=None, external_id=None):
+        return StubCalaisResponse(json.loads(urllib2.urlopen(self.url, content).read()))
+
+
+@override_settings(CALAIS_API_KEY='key', CALAIS_SUBMITTER='test')
+class CalaisQueueTest(TransactionTestCase):
+    """
+    the worker threads use their own connections, the rows must be committed
+    """
+    def setUp(self):
+        from content_management.models import Entry
+        from penseive import opencalais
+        from penseive.entities import PenseiveEntities
+        from penseive.sites import site
+
+        class EntryEntities(PenseiveEntities):
+            calais_content_fields = [('TITLE', 'title'), ('BODY', 'body_html'), ('PUBDATE', 'pub_date')]
+
+            def update_opencalais(self, objects):
+                # only the Calais round trip, the entities are not extracted
+                for obj in objects:
+                    opencalais.OpenCalais(obj, dict(self.calais_content_fields)).analyze()
+
+        self.server = StubServer([CALAIS_OK])
+        StubCalais.url = self.server.url
+        self.calais = opencalais.Calais
+        opencalais.Calais = StubCalais
+        site.register(Entry, EntryEntities)
+        self.entries = self.create_entries(4)
+
+    def tearDown(self):
+        from content_management.models import Entry
+        from penseive import opencalais
+        from penseive.sites import site
+
+        site._teardown(Entry, site.get_penseive(Entry))
+        site.unregister(Entry)
+        opencalais.Calais = self.calais
+        self.server.shutdown()
+
+    def create_entries(self, count):
+        from accounts.models import Account
+        from content_management.models import Entry
+        from publications.models import Publication
+
+        account = Account.objects.create(title='account', slug='account', type='P')
+        publication = Publication.objects.create(title='publication', slug='publication', account=account)
+        return [Entry.objects.create(title='title %d' % i, slug='title-%d' % i, body_html='body %d' % i,
+                                     pub_date=datetime.datetime.now(), publication=publication)
+                for i in range(count)]
+
+    def statuses(self):
+        from penseive.models import CalaisQueueItem
+        return sorted(CalaisQueueItem.objects.values_list('status', flat=True))
+
+    def test_saved_objects_are_queued_once(self):
+        from penseive.models import CalaisQueueItem
+
+        self.entries[0].save()
+        self.assertEqual(CalaisQueueItem.objects.count(), 4)
+        self.assertEqual(self.server.requests, [])
+
+    def test_failures_are_retried(self):
+        from penseive.calais_queue import process_queue
+        from penseive.models import CalaisResponse
+
+        self.server.responses = [CALAIS_ERROR, CALAIS_OK]
+        self.assertEqual(process_queue(workers=1, backoff=0), {'D': 3, 'P': 1})
+        self.assertEqual(process_queue(workers=2, backoff=0), {'D': 1})
+        self.assertEqual(self.statuses(), ['D'] * 4)
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(CalaisResponse.objects.count(), 4)
+
+        # the responses are cached by content, nothing is sent again
+        for entry in self.entries:
+            entry.save()
+        self.assertEqual(process_queue(workers=2), {'D': 4})
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_failed_after_max_attempts(self):
+        from penseive.calais_queue import process_queue
+        from penseive.models import CalaisQueueItem
+
+        self.server.responses = [CALAIS_ERROR]
+        self.assertEqual(process_queue(workers=2, max_attempts=2, backoff=0), {'P': 4})
+        self.assertEqual(process_queue(workers=2, max_attempts=2, backoff=0), {'F': 4})
+        self.assertEqual(process_queue(workers=2, max_attempts=2, backoff=0), {})
+        self.assertEqual(list(CalaisQueueItem.objects.values_list('attempts', flat=True).distinct()), [2])
+
+    def test_backoff(self):
+        from penseive.calais_queue import process_queue
+
+        self.server.responses = [CALAIS_ERROR]
+        self.assertEqual(process_queue(workers=2, backoff=60), {'P': 4})
+        self.assertEqual(process_queue(workers=2, backoff=60), {})
+
+    def test_running_items_of_dead_workers_are_reclaimed(self):
+        from penseive.calais_queue import process_queue
+        from penseive.models import CalaisQueueItem, CALAIS_LEASE
+
+        stale = datetime.datetime.now() - datetime.timedelta(seconds=CALAIS_LEASE + 60)
+        items = CalaisQueueItem.objects.order_by('id')
+        CalaisQueueItem.objects.filter(pk=items[0].pk).update(status='R', updated_on=stale)
+        CalaisQueueItem.objects.filter(pk=items[1].pk).update(status='R')
+        self.assertEqual(process_queue(workers=2), {'D': 3})
+        self.assertEqual(self.statuses(), ['D', 'D', 'D', 'R'])
+        self.assertEqual(CalaisQueueItem.objects.get(pk=items[0].pk).attempts, 1)
+
+    def test_claim(self):
+        from penseive.models import CalaisQueueItem
+
+        item = CalaisQueueItem.objects.due()[0]
+        other = CalaisQueueItem.objects.get(pk=item.pk)
+        self.assertTrue(CalaisQueueItem.objects.claim(item))
+        self.assertFalse(CalaisQueueItem.objects.claim(other))
+        self.assertNotIn(item, CalaisQueueItem.objects.due())
+
+
+CLASSIFIER_RESPONSE = """<response><results>
+<result><category>%s</category><probability>0.5</probability></result>
+<result><category>Media</category><probability>null</probability></result>
+<result><category>Telecom</category><probability>0.9</probability></result>
+</results><bestResult><category>Telecom</category></bestResult>
+<high_recall_results><category>Telecom</category><category>%s</category></high_recall_results></response>"""
+
+
+def classifier_response(method, path, body, headers):
+    """
+    the classification of the text sent, 'fail' gets an error, 'bad' a
+    result without probability
+    """
+    text = urlparse.parse_qs(body)['DATA'][0]
+    if text == 'fail':
+        return 500, ''
+    if text == 'bad':
+        return 200, '<response><results><result><category>x</category></result></results></response>'
+    return 200, CLASSIFIER_RESPONSE % (text, text)
+
+
+class ClassifierTest(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from penseive import classifier
+
+        cache.clear()
+        self.server = StubServer(classifier_response)
+        self.url = classifier.CLASSIFIER_URL
+        classifier.CLASSIFIER_URL = self.server.url
+
+    def tearDown(self):
+        from penseive import classifier
+
+        classifier.CLASSIFIER_URL = self.url
+        self.server.shutdown()
+
+    def test_classify(self):
+        from penseive.classifier import Classifier
+
+        c = Classifier(u'Energy \n  news')
+        self.assertEqual(self.server.requests, [('POST', '/', 'DATA=Energy+news')])
+        self.assertEqual(c.best_result, 'Telecom')
+        self.assertEqual(c.results, [{'category': 'Telecom', 'probability': 0.9},
+                                     {'category': 'Energy news', 'probability': 0.5},
+                                     {'category': 'Media', 'probability': 0.0}])
+        self.assertEqual(c.high_recall_results, [{'category': 'Telecom'}, {'category': 'Energy news'}])
+
+    def test_classify_many(self):
+        from penseive.classifier import Classifier
+
+        texts = [u'text %d' % (i % 5) for i in range(10)]
+        classifiers = Classifier.classify_many(texts, workers=4)
+        self.assertEqual([c.high_recall_results[1]['category'] for c in classifiers], texts)
+        # a text appearing twice is sent once, the classifications are cached
+        self.assertEqual(len(self.server.requests), 5)
+        Classifier.classify_many(texts + [u'text 5'], workers=4)
+        self.assertEqual(len(self.server.requests), 6)
+
+    def test_failures(self):
+        from penseive.classifier import classify_many
+
+        texts = [u'fail', u'bad', u'good', u'better']
+        classifications = classify_many(texts, workers=4)
+        self.assertEqual([c['best_result'] for c in classifications], ['', '', 'Telecom', 'Telecom'])
+        self.assertEqual(classifications[0], {'results': [], 'best_result': '', 'high_recall_results': []})
+        # the empty classifications are not shared
+        classifications[0]['results'].append('changed')
+        self.assertEqual(classifications[1]['results'], [])
+        self.assertEqual(classify_many([u'bad'], workers=1)[0]['results'], [])
+
+        # the failures are not cached, they are sent again
+        self.assertEqual(len(self.server.requests), 5)
+        classify_many(texts, workers=4)
+        self.assertEqual(len(self.server.requests), 7)
+
+    def test_not_responding(self):
+        from penseive import classifier
+
+        classifier.CLASSIFIER_URL = 'http://127.0.0.1:1/'
+        self.assertEqual(classifier.Classifier(u'text').best_result, '')
+        self.assertEqual(self.server.requests, [])
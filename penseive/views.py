@@ -14,7 +14,6 @@ from django.views.generic.list_detail import object_list
 
 from cms.models import Entry
 from cutils.tagcloud import tagcloud
-from cutils.utils import flatten
 from penseive import site
 from penseive.models import PenseiveItem, Entity, EntityType, EntityItem
 from search.query import SearchQuerySet
@@ -181,7 +180,7 @@ def entity_list(request, type, name):
 
     # display all child entities on the sidebar
     # child_entities = Entity.objects.filter(active=True, parent=entity)
-    child_entities = list(flatten(entity.get_all_child_entities()))
+    child_entities = list(entity.get_descendants())
 
     return object_list(
         request,
@@ -67,7 +67,10 @@ class TransmissionQAdmin(admin.ModelAdmin):
         selected = request.POST.getlist(admin.ACTION_CHECKBOX_NAME)
         objects = queryset.filter(pk__in=selected)
         for obj in objects:
-            obj.refresh()
+            counts = obj.refresh()
+            modeladmin.message_user(
+                request, "%s refreshed: %d item(s) added, %d scheduled, %d already in the queue"
+                % (obj, counts['inserted'], counts['scheduled'], counts['skipped']))
 
     def transmit(self, request, queryset):
         selected = request.POST.getlist(admin.ACTION_CHECKBOX_NAME)
@@ -141,14 +144,19 @@ class TransmissionQItemAdmin(admin.ModelAdmin):
 
     actions = ['schedule', 'ignore', 'make_pending']
 
+    def update_action(self, queryset, action):
+        # the admin queryset comes from TransmissionQItem.items, update_action()
+        # keeps the daily counts in sync where update() does not
+        TransmissionQItem.objects.filter(pk__in=queryset.values('pk')).update_action(action)
+
     def schedule(modeladmin, request, queryset):
-        queryset.update(action='S')
+        modeladmin.update_action(queryset, 'S')
 
     def ignore(modeladmin, request, queryset):
-        queryset.update(action='I')
+        modeladmin.update_action(queryset, 'I')
 
     def make_pending(modeladmin, request, queryset):
-        queryset.update(action='P')
+        modeladmin.update_action(queryset, 'P')
 
 
 admin.site.register(TransmissionQItem, TransmissionQItemAdmin)
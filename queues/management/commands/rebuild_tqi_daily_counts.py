@@ -0,0 +1,40 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the TransmissionQItem daily counts of a date range from the TransmissionQItems, ' \
+           'use it to backfill the counts or to repair them after updates done outside update_action().'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help='first day, YYYY-MM-DD, defaults to the first TransmissionQItem')
+        parser.add_argument('--end', help='last day, YYYY-MM-DD, defaults to today')
+        parser.add_argument('--days', type=int, default=30,
+                            help='number of days rebuilt per transaction')
+
+    def parse_day(self, value):
+        try:
+            return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError('Invalid date %s, expected YYYY-MM-DD' % value)
+
+    def handle(self, *args, **options):
+        from queues.models import TransmissionQItem, TransmissionQItemDailyCount
+
+        end = self.parse_day(options['end']) if options['end'] else datetime.date.today()
+        if options['start']:
+            start = self.parse_day(options['start'])
+        else:
+            first = TransmissionQItem.objects.order_by('created_on').values_list('created_on', flat=True).first()
+            if first is None:
+                self.stdout.write('No TransmissionQItems')
+                return
+            start = first.date()
+
+        step = datetime.timedelta(days=options['days'])
+        while start <= end:
+            chunk_end = min(start + step - datetime.timedelta(days=1), end)
+            rows = TransmissionQItemDailyCount.objects.rebuild(start, chunk_end)
+            self.stdout.write('%s - %s: %d rows' % (start, chunk_end, rows))
+            start = chunk_end + datetime.timedelta(days=1)
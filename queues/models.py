@@ -1,9 +1,13 @@
 import datetime
+from collections import Counter
+from itertools import islice
 
 # django
 from django.conf import settings
 from django.db import models
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, signals
+from django.db.models.functions import TruncDate
 from django.contrib.auth.models import User
 
 # external apps
@@ -14,6 +18,8 @@ from accounts.models import Account
 from content_management.models import Entry
 from cutils.models import CronSettings
 from publications.models import Publication
+from queues.routing import transmission_routes
+from queues.tagrules import get_entry_tags, split_tags, tag_rule_index
 
 TX_Q_ACTION = (
     ('P', 'Pending'),
@@ -53,6 +59,15 @@ UPLOAD_LOCATION_TYPE = (
     ('O', "Others")
 )
 
+# number of TransmissionQItems inserted per INSERT statement during a refresh
+TX_Q_ITEM_BATCH_SIZE = 500
+
+# number of QItem - Q links written / deleted per statement
+Q_ITEM_BATCH_SIZE = 1000
+
+# TransmissionQItem fields the daily counts are keyed on
+TX_Q_ITEM_COUNT_FIELDS = ('created_on', 'tx_q_id', 'publication_id', 'action')
+
 
 # Create your models here.
 
@@ -87,17 +102,55 @@ class Q(models.Model):
             return items_age
         return self.published_no_later_than
 
+    def is_valid(self, tags):
+        """
+        returns True if the tags satisfy the TagRules of this Q
+        """
+        if isinstance(tags, basestring):
+            tags = split_tags(tags)
+        return self.id in tag_rule_index.get().match(tags)
+
     def save(self):
         super(Q, self).save()
         # update all entries updated in last x days
-        for e in Entry.objects.live().filter(pub_date__gte=self.get_published_no_later_than()):
-            qi, created = QItem.objects.get_or_create(entry=e)
-            qi.update_qs()
+        QItem.objects.refresh_q(
+            self, Entry.objects.live().filter(pub_date__gte=self.get_published_no_later_than()))
+
+
+class QItemManager(models.Manager):
+    def refresh_q(self, q, entries):
+        """
+        update the membership of q for the given entries, the missing QItems
+        are created and the QItem - Q links are written in bulk, only the
+        difference with the existing links is written
+        """
+        entries = entries.order_by()
+        self.bulk_create([
+            QItem(entry_id=entry_id) for entry_id in
+            entries.exclude(id__in=self.values('entry')).values_list('id', flat=True)
+        ], batch_size=Q_ITEM_BATCH_SIZE)
+
+        index = tag_rule_index.get()
+        matched = set([e.id for e in entries.iterator() if q.id in index.match(get_entry_tags(e))])
+        qitem_ids = dict(self.filter(entry__in=entries.values('id')).values_list('entry', 'id'))
+        wanted = set([qitem_ids[entry_id] for entry_id in matched])
+
+        through = QItem.qs.through
+        current = set(through.objects.filter(
+            q=q, qitem__in=qitem_ids.values()).values_list('qitem', flat=True))
+
+        stale = list(current - wanted)
+        for start in range(0, len(stale), Q_ITEM_BATCH_SIZE):
+            through.objects.filter(q=q, qitem__in=stale[start:start + Q_ITEM_BATCH_SIZE]).delete()
+        through.objects.bulk_create(
+            [through(q=q, qitem_id=qitem_id) for qitem_id in wanted - current],
+            batch_size=Q_ITEM_BATCH_SIZE)
 
 
 class QItem(models.Model):
     entry = models.ForeignKey(Entry)
     qs = models.ManyToManyField(Q, null=True, blank=True)
+    objects = QItemManager()
 
     class Meta:
         unique_together = ('entry',)
@@ -107,13 +160,16 @@ class QItem(models.Model):
         return u'%s' % (self.entry)
 
     def update_qs(self):
-        for i in self.qs.all():
-            self.qs.remove(i)
-
-        # traverse all valid Qs and check if our entry is valid
-        for q in Q.objects.all():
-            if q.is_valid(self.entry.tags):
-                self.qs.add(q)
+        """
+        sync the Qs of this item with the compiled TagRule index, the cost
+        does not depend on the number of Qs
+        """
+        matched = tag_rule_index.get().match(get_entry_tags(self.entry))
+        current = set(self.qs.values_list('id', flat=True))
+        if current - matched:
+            self.qs.remove(*(current - matched))
+        if matched - current:
+            self.qs.add(*(matched - current))
 
 
 class TagRulesManager(models.Manager):
@@ -291,7 +347,7 @@ class TransmissionQ(models.Model):
             if self.pk == 3:
                 eqs = eqs.filter(send_to_factiva=True)
             return eqs
-        return []
+        return Entry.objects.none()
 
     def add_items(self, qs, action=None):
         """
@@ -338,36 +394,66 @@ class TransmissionQ(models.Model):
                 pass
         return True
 
+    def _existing_entries(self):
+        """
+        entry ids that already have a TransmissionQItem in this queue,
+        used as the anti-join subquery while refreshing
+        """
+        return TransmissionQItem.objects.filter(tx_q=self).values('entry')
+
+    def _bulk_create_items(self, rows, action):
+        """
+        inserts TransmissionQItems for the given (entry id, publication id, q id)
+        rows in batches of TX_Q_ITEM_BATCH_SIZE, returns the number of items inserted
+        """
+        return TransmissionQItem.objects.bulk_add(
+            TransmissionQItem(tx_q=self, entry_id=entry_id, publication_id=publication_id,
+                              q_id=q_id, action=action)
+            for entry_id, publication_id, q_id in rows
+        )
+
     def refresh(self):
         """
         Refresh the TransmissionQItems, fetch data from subscribed publications and queues
+
+        the entries missing from this queue are computed with a single anti-join query
+        and inserted in batches, returns a dict with the number of items inserted,
+        skipped (already present in the queue) and scheduled
         """
+        counts = {'inserted': 0, 'skipped': 0, 'scheduled': 0}
+
         # if a publication is selected - pull all the items that belong to that publication
         # in this queue and set the action to "Schedule" by default
-        for e in self.sub_pub_items().iterator():
-            try:
-                tx_q_item, created = TransmissionQItem._default_manager.get_or_create(tx_q=self, entry=e)
-            except IntegrityError, e:
-                # do nothing entry exists
-                pass
-            if created:
-                tx_q_item.action = 'S'
-                tx_q_item.save()
-            # else already exists, do nothing ...
+        eqs = self.sub_pub_items().order_by()
+        total = eqs.values('id').distinct().count()
+        if total:
+            rows = [
+                (entry_id, publication_id, None) for entry_id, publication_id in
+                eqs.exclude(id__in=self._existing_entries()).values_list('id', 'publication').distinct()
+            ]
+            inserted = self._bulk_create_items(rows, 'S')
+            counts['inserted'] += inserted
+            counts['scheduled'] += inserted
+            counts['skipped'] += total - inserted
 
         # for each q that belongs to this buyer, add the corresponding entries to the
         # respective TransmissionQItem, keep default action ie Pending for now
-        for qi in list(set(self.fetch_q_items())):
-            e = qi.entry
-            q = qi.qs.all()[:1][0]
-            try:
-                tx_q_item, created = TransmissionQItem._default_manager.get_or_create(tx_q=self, q=q, entry=e)
-                if created and self.auto_schedule:
-                    tx_q_item.action = 'S'
-                    tx_q_item.save()
-            except IntegrityError, e:
-                # do nothing, pass
-                pass
+        qitems = self.fetch_q_items().order_by()
+        total = qitems.values('entry').distinct().count()
+        if total:
+            # an entry can belong to more than one q, the first one is picked
+            q_by_entry = {}
+            for entry_id, publication_id, q_id in qitems.exclude(
+                    entry__in=self._existing_entries()).values_list(
+                    'entry', 'entry__publication', 'qs').order_by('entry', 'qs'):
+                q_by_entry.setdefault(entry_id, (entry_id, publication_id, q_id))
+
+            action = 'S' if self.auto_schedule else 'P'
+            inserted = self._bulk_create_items(q_by_entry.values(), action)
+            counts['inserted'] += inserted
+            if action == 'S':
+                counts['scheduled'] += inserted
+            counts['skipped'] += total - inserted
 
         # update the last updated_on time to today
         # this will ensure next time when the queue is refreshed, existing data is excluded
@@ -375,6 +461,7 @@ class TransmissionQ(models.Model):
         today = datetime.datetime.today()
         self.updated_on = datetime.datetime(year=today.year, month=today.month, day=today.day)
         self.save()
+        return counts
 
     def refresh_old(self):
         """
@@ -424,12 +511,15 @@ class TransmissionQ(models.Model):
         date range filter is by default applied on the created_on date of TransmissionQItem
         if by_pub_date is True, date range filter is applied on Entry pub_date
         """
-        qs = TransmissionQItem.objects.filter(tx_q=self)
-
         if by_pub_date:
+            qs = TransmissionQItem.objects.filter(tx_q=self)
             qs = qs.filter(entry__pub_date__range=(start_date, end_date))
+            count = models.Count('action')
         else:
-            qs = qs.filter(created_on__range=(start_date, end_date))
+            # read from the daily counts, the range covers whole days
+            qs = TransmissionQItemDailyCount.objects.filter(tx_q=self)
+            qs = qs.filter(day__range=(start_date, end_date))
+            count = models.Sum('count')
 
         # apply the action filter, if present
         if action:
@@ -437,34 +527,33 @@ class TransmissionQ(models.Model):
 
         return qs.values('action', 'publication__account__title',
                          'publication__title', 'publication__slug'). \
-            annotate(c=models.Count('action')). \
+            annotate(c=count). \
             order_by('action', 'publication__account__title', 'publication__title')
 
     def transmit(self, notify=False):
         """
         transmit scheduled objects, if ftp location is present
         """
-        try:
-            uid_list_T = []
-            uid_list_F = []
+        from queues.transmit import TransmitEngine, get_pool, update_actions
 
+        try:
             up_loc = UploadLocation.objects.get(tx_q=self)
+            pool = get_pool(up_loc)
 
-            tq_items = TransmissionQItem.scheduled_objects.filter(tx_q=self)
-            for tqi in tq_items:
-                try:
-                    uid, xml = tqi.xml()
-                    ftp.upload_content(uid + ".xml", xml)
-                    tqi.action = "T"
-                    uid_list_T.append(tqi.entry.title + " [ " + tqi.entry.title + " ]")
-                except Exception, e:
-                    tqi.action = "F"
-                    uid_list_F.append(tqi.entry.title + " [ " + tqi.entry.title + " ]")
+            tq_items = TransmissionQItem.scheduled_objects.filter(tx_q=self).select_related('entry')
+            results = TransmitEngine(pool).run(tq_items)
+            update_actions(results)
 
-                tqi.save()
+            uid_list_T = [r.tqi.entry.title + " [ " + r.tqi.entry.title + " ]"
+                          for r in results if r.action == 'T']
+            uid_list_F = [r.tqi.entry.title + " [ " + r.tqi.entry.title + " ]"
+                          for r in results if r.action == 'F']
 
-            rdir, rfiles = ftp.listdir("/")
-            ftp.disconnect()
+            conn = pool.get()
+            try:
+                rdir, rfiles = conn.listdir("/")
+            finally:
+                pool.put(conn)
 
             # send a confirmation email if all looks good!
             if notify:
@@ -490,23 +579,75 @@ class TransmissionQ(models.Model):
 
 
 class ScheduledItemsManager(models.Manager):
-    def get_query_set(self):
-        return super(ScheduledItemsManager, self).get_query_set().filter(action='S')
+    def get_queryset(self):
+        return super(ScheduledItemsManager, self).get_queryset().filter(action='S')
 
 
 class TransmittedItemsManager(models.Manager):
-    def get_query_set(self):
-        return super(TransmittedItemsManager, self).get_query_set().filter(action='T')
+    def get_queryset(self):
+        return super(TransmittedItemsManager, self).get_queryset().filter(action='T')
 
 
 class PendingItemsManager(models.Manager):
-    def get_query_set(self):
-        return super(PendingItemsManager, self).get_query_set().filter(action='P')
+    def get_queryset(self):
+        return super(PendingItemsManager, self).get_queryset().filter(action='P')
+
+
+class TransmissionQItemQuerySet(models.QuerySet):
+    def bulk_add(self, items, batch_size=TX_Q_ITEM_BATCH_SIZE):
+        """
+        inserts the TransmissionQItems, a list or an iterator, in batches of
+        batch_size, keeps the daily counts in sync, returns the number of items
+        inserted
+        """
+        inserted = 0
+        items = iter(items)
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                break
+            try:
+                with transaction.atomic():
+                    self.bulk_create(batch)
+                    # bulk_create does not send post_save
+                    TransmissionQItemDailyCount.objects.add(
+                        Counter([tx_q_item.count_key() for tx_q_item in batch]))
+                inserted += len(batch)
+            except IntegrityError:
+                # some of the entries were added by someone else since we computed
+                # the missing items, unique_together ('tx_q', 'entry') will reject them
+                # insert this batch one at a time and skip the duplicates
+                for tx_q_item in batch:
+                    try:
+                        with transaction.atomic():
+                            self.bulk_create([tx_q_item])
+                            TransmissionQItemDailyCount.objects.add({tx_q_item.count_key(): 1})
+                        inserted += 1
+                    except IntegrityError:
+                        pass
+        return inserted
+
+    def update_action(self, action):
+        """
+        update() the action of the items, keeps the daily counts in sync,
+        returns the number of items updated
+        """
+        counts = Counter()
+        changed = self.exclude(action=action).annotate(day=TruncDate('created_on')). \
+            values('day', 'tx_q', 'publication', 'action').annotate(c=Count('id')).order_by()
+        for row in changed:
+            counts[(row['day'], row['tx_q'], row['publication'], row['action'])] -= row['c']
+            counts[(row['day'], row['tx_q'], row['publication'], action)] += row['c']
+
+        with transaction.atomic():
+            updated = self.update(action=action)
+            TransmissionQItemDailyCount.objects.add(counts)
+        return updated
 
 
 class TransmissionQItem(models.Model):
     items = models.Manager()
-    objects = models.Manager()
+    objects = TransmissionQItemQuerySet.as_manager()
     scheduled_objects = ScheduledItemsManager()
     transmitted_objects = TransmittedItemsManager()
     pending_objects = PendingItemsManager()
@@ -553,6 +694,20 @@ class TransmissionQItem(models.Model):
             self.tx_q.slug.upper(), self.publication.slug.upper(), self.entry.title, self.entry.id)
         return tx_id
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(TransmissionQItem, cls).from_db(db, field_names, values)
+        # remember where the item is counted, see TransmissionQItemDailyCount
+        if set(TX_Q_ITEM_COUNT_FIELDS).issubset(field_names):
+            instance._counted_as = instance.count_key()
+        return instance
+
+    def count_key(self):
+        """
+        returns the (day, tx_q id, publication id, action) the item is counted under
+        """
+        return self.created_on.date(), self.tx_q_id, self.publication_id, self.action
+
     def save(self, *args, **kwargs):
         """
         update the publication
@@ -576,6 +731,85 @@ class TransmissionQItem(models.Model):
             return default(self.entry, self.transmission_id())
 
 
+class TransmissionQItemDailyCountManager(models.Manager):
+    def add(self, counts):
+        """
+        adds the counts, a {(day, tx_q id, publication id, action): count} dict,
+        missing rows are created
+        """
+        for (day, tx_q_id, publication_id, action), count in counts.items():
+            if not count:
+                continue
+            key = {'day': day, 'tx_q_id': tx_q_id, 'publication_id': publication_id, 'action': action}
+            if self.filter(**key).update(count=F('count') + count):
+                continue
+            try:
+                with transaction.atomic():
+                    self.create(count=count, **key)
+            except IntegrityError:
+                # created by someone else in the meantime
+                self.filter(**key).update(count=F('count') + count)
+
+    def rebuild(self, start_day, end_day):
+        """
+        recomputes the counts of the days in the range from the TransmissionQItems,
+        returns the number of rows written
+        """
+        start = datetime.datetime.combine(start_day, datetime.time.min)
+        end = datetime.datetime.combine(end_day, datetime.time.max)
+        rows = TransmissionQItem.objects.filter(created_on__range=(start, end)). \
+            annotate(day=TruncDate('created_on')). \
+            values('day', 'tx_q', 'publication', 'action').annotate(c=Count('id')).order_by()
+
+        with transaction.atomic():
+            self.filter(day__range=(start_day, end_day)).delete()
+            self.bulk_create([
+                TransmissionQItemDailyCount(day=row['day'], tx_q_id=row['tx_q'],
+                                            publication_id=row['publication'],
+                                            action=row['action'], count=row['c'])
+                for row in rows
+            ], batch_size=TX_Q_ITEM_BATCH_SIZE)
+        return self.filter(day__range=(start_day, end_day)).count()
+
+
+class TransmissionQItemDailyCount(models.Model):
+    """
+    number of TransmissionQItems per creation day, TransmissionQ, Publication
+    and action, kept up to date as the items are created, updated and deleted,
+    the dashboards read from here instead of grouping the TransmissionQItems.
+    QuerySet.update() bypasses the signals, use update_action() to change the
+    action of many items. rebuild_tqi_daily_counts repairs a date range
+    """
+    day = models.DateField()
+    tx_q = models.ForeignKey(TransmissionQ)
+    publication = models.ForeignKey(Publication, null=True)
+    action = models.CharField(max_length=1, choices=TX_Q_ACTION)
+    count = models.IntegerField(default=0)
+
+    objects = TransmissionQItemDailyCountManager()
+
+    class Meta:
+        unique_together = ('day', 'tx_q', 'publication', 'action')
+
+    def __unicode__(self):
+        return u'%s %s %s %s: %d' % (self.day, self.tx_q_id, self.publication_id, self.action, self.count)
+
+
+def tx_q_item_postsave_handler(sender, instance, created, **kwargs):
+    key = instance.count_key()
+    counted_as = getattr(instance, '_counted_as', None)
+    if created:
+        TransmissionQItemDailyCount.objects.add({key: 1})
+    elif counted_as and counted_as != key:
+        TransmissionQItemDailyCount.objects.add({counted_as: -1, key: 1})
+    instance._counted_as = key
+
+
+def tx_q_item_postdelete_handler(sender, instance, **kwargs):
+    key = getattr(instance, '_counted_as', None) or instance.count_key()
+    TransmissionQItemDailyCount.objects.add({key: -1})
+
+
 class UploadLocation(models.Model):
     type = models.CharField(max_length=1, choices=UPLOAD_LOCATION_TYPE, default='F')
     tx_q = models.ForeignKey(TransmissionQ)
@@ -597,5 +831,16 @@ class KeywordTransmissionQ(TransmissionQ):
         verbose_name_plural = 'Transmission Qs (Keyword Based)'
 
 
+# rebuild the compiled TagRule index only when a Q or one of its rules change
+for model in (Q, TagRule):
+    signals.post_save.connect(tag_rule_index.invalidate, sender=model)
+    signals.post_delete.connect(tag_rule_index.invalidate, sender=model)
 
+# rebuild the routing table only when a TransmissionQ or its subscriptions change
+for model in (TransmissionQ, KeywordTransmissionQ):
+    signals.post_save.connect(transmission_routes.invalidate, sender=model)
+    signals.post_delete.connect(transmission_routes.invalidate, sender=model)
+signals.m2m_changed.connect(transmission_routes.invalidate, sender=TransmissionQ.sub_publications.through)
 
+signals.post_save.connect(tx_q_item_postsave_handler, sender=TransmissionQItem)
+signals.post_delete.connect(tx_q_item_postdelete_handler, sender=TransmissionQItem)
@@ -1,6 +1,6 @@
 from reporting import reports, site
-from django.db.models import Count
-from queues.models import TransmissionQItem
+from django.db.models import Count, Sum
+from queues.models import TransmissionQItem, TransmissionQItemDailyCount
 
 class TransmissionQItemStatus(reports.DateBaseReport):
     title = 'TransmissionQ Item Status Report (creation date)'
@@ -24,4 +24,29 @@ class TransmissionQItemStatus(reports.DateBaseReport):
     date_field = 'created_on'
     date_dimension = ''
 
-site.register('tqi-status', TransmissionQItemStatus)
\ No newline at end of file
+site.register('tqi-status', TransmissionQItemStatus)
+
+
+class TransmissionQItemDailyStatus(reports.DateBaseReport):
+    title = 'TransmissionQ Item Status Report (creation date, daily counts)'
+    description = 'Same as the TransmissionQ Item Status Report, read from the daily counts of TransmissionQ Items'
+    model = TransmissionQItemDailyCount
+
+    dimensions = [
+        'tx_q__title',
+        'publication__account__title',
+        'publication__title',
+        'publication__source__title',
+        'publication__load_frequency']
+
+    group_by = 'action'
+    metrics = (('count', Sum, 'Total'),)
+
+    filter_fields = ['publication__account', 'publication', 'publication__source', 'tx_q']
+    filters = []
+    order_by = []
+
+    date_field = 'day'
+    date_dimension = ''
+
+site.register('tqi-daily-status', TransmissionQItemDailyStatus)
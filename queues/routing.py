@@ -0,0 +1,88 @@
+"""
+Routing table of the TransmissionQs
+
+An entry is transmitted by the TransmissionQs subscribed to its publication.
+Instead of walking every TransmissionQ for every entry, the subscriptions are
+read once into a publication id -> TransmissionQs lookup, the table is rebuilt
+only when a TransmissionQ or its sub_publications change, see the signals
+connected at the end of queues.models
+
+The keyword based queues (KeywordTransmissionQ) are not routed here
+>>> route_entry(entry)
+2
+"""
+from collections import defaultdict
+
+from cutils.utils import VersionedCache
+
+# the TransmissionQ only adding the entries marked for factiva
+FACTIVA_TX_Q_ID = 3
+
+
+class TransmissionRoutes(object):
+    """
+    built from the TransmissionQs and their (transmissionq id, publication id)
+    subscription rows
+    """
+
+    def __init__(self, tx_qs, subscriptions):
+        self.tx_qs = dict((tx_q.id, tx_q) for tx_q in tx_qs)
+        # publication id -> list of TransmissionQs
+        self.routes = defaultdict(list)
+        for tx_q_id, publication_id in subscriptions:
+            if tx_q_id in self.tx_qs:
+                self.routes[publication_id].append(self.tx_qs[tx_q_id])
+
+    def tx_qs_for(self, publication_id):
+        return self.routes.get(publication_id, [])
+
+
+def build_transmission_routes():
+    from queues.models import KeywordTransmissionQ, TransmissionQ
+
+    tx_qs = TransmissionQ.objects.exclude(
+        id__in=KeywordTransmissionQ.objects.values('id')).only('id', 'buyer', 'auto_schedule')
+    subscriptions = TransmissionQ.sub_publications.through.objects.values_list(
+        'transmissionq', 'publication')
+    return TransmissionRoutes(tx_qs, subscriptions)
+
+
+transmission_routes = VersionedCache('queues.transmission_routes', build_transmission_routes)
+
+
+def get_action(tx_q, action=None):
+    """
+    returns the action of the new items, as TransmissionQ.add_items() does
+    """
+    if not action:
+        action = 'S' if tx_q.auto_schedule else 'P'
+    if action not in ['P', 'S']:
+        action = 'P'
+    return action
+
+
+def route_entry(entry, action=None, is_valid=None):
+    """
+    adds the entry to the TransmissionQs subscribed to its publication, the
+    missing TransmissionQItems are inserted together, returns the number of
+    items inserted.
+    is_valid(entry, tx_q) can reject some of the queues
+    """
+    from queues.models import TransmissionQItem
+
+    tx_qs = transmission_routes.get().tx_qs_for(entry.publication_id)
+    if entry.id is None or not tx_qs:
+        return 0
+    if not getattr(entry, 'send_to_factiva', False):
+        tx_qs = [tx_q for tx_q in tx_qs if tx_q.id != FACTIVA_TX_Q_ID]
+    if is_valid is not None:
+        tx_qs = [tx_q for tx_q in tx_qs if is_valid(entry, tx_q)]
+
+    existing = set(TransmissionQItem.objects.filter(
+        entry=entry, tx_q__in=[tx_q.id for tx_q in tx_qs]).values_list('tx_q', flat=True))
+    items = [
+        TransmissionQItem(tx_q_id=tx_q.id, entry_id=entry.id, publication_id=entry.publication_id,
+                          action=get_action(tx_q, action))
+        for tx_q in tx_qs if tx_q.id not in existing
+    ]
+    return TransmissionQItem.objects.bulk_add(items)
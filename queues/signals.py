@@ -1,16 +1,28 @@
 import datetime
 import django.dispatch
 
+from content_management.duplicates import NEAR_DUPLICATE_TITLES, get_recent_titles, title_fingerprint
 from content_management.models import Entry
 from content_management.signals import refresh_entry_qs, refresh_entry_txqs
-from cutils.utils import unicode_to_ascii
 
 
-def is_duplicate_title(new_title, stored_titles):
-    stored_titles = [unicode(unicode_to_ascii(t)) for t in stored_titles]
-    new_title = unicode(unicode_to_ascii(new_title))
-    if new_title in stored_titles:
+def is_duplicate_title(entry, publication_ids, days):
+    """
+    True if an entry of the publications created since midnight `days` ago
+    has the same normalized title, or a near duplicate title when
+    ENTRY_NEAR_DUPLICATE_TITLES is set
+    """
+    today = datetime.datetime.now().replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    created_since = today - datetime.timedelta(days=days)
+    fingerprint = entry.title_fingerprint or title_fingerprint(entry.title)
+    if fingerprint and Entry.objects.filter(
+            publication__id__in=publication_ids, created_on__gte=created_since,
+            title_fingerprint=fingerprint).exists():
         return True
+    if NEAR_DUPLICATE_TITLES:
+        return bool(get_recent_titles(publication_ids, days).similar(entry.title, exclude_id=entry.id))
     return False
 
 
@@ -33,22 +45,14 @@ def _is_a_valid_entry_to_add_in_transmission_queue(entry, txq):
     _regular_pub_ids = [_fe_regular_pub_id, _ie_regular_pub_id]
     _online_pub_ids = [_ie_online_pub_id, _fe_online_pub_id]
 
-    current_buyer_id = txq.buyer.id
+    current_buyer_id = txq.buyer_id
     if current_buyer_id == _bloomberg_q_buyer_id and (
-                entry.publication.id in _online_pub_ids):
-        today = datetime.datetime.now().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        date_range = today - datetime.timedelta(days=2)
-        entry_qs = Entry.objects.filter(
-            publication__id__in=_regular_pub_ids, created_on__gte=date_range
-        )
-        title_list = entry_qs.values_list('title', flat=True)
-        if is_duplicate_title(entry.title, title_list):
+                entry.publication_id in _online_pub_ids):
+        if is_duplicate_title(entry, _regular_pub_ids, 2):
             return False
     # lets check if exclude_to_buyer is populated and
     # current_buyer_id is available in exclude_to_buyers field
-    if (entry.exclude_to_buyers and exclude_to_buyer_map.get(
+    if (getattr(entry, 'exclude_to_buyers', None) and exclude_to_buyer_map.get(
             current_buyer_id)) and (
                 exclude_to_buyer_map.get(
                     current_buyer_id) in entry.exclude_to_buyers):
@@ -80,19 +84,14 @@ def update_entry_txq_handler(sender, **kwargs):
     entry = kwargs['entry']
     action = kwargs['action']
     
-    # make sure a valid 'entry' exists
-    from queues.models import TransmissionQ, KeywordTransmissionQ
-    
-    # only add items that belong to TransmissionQ,
-    # but not to KeywordTransmissionQ
-    tq = TransmissionQ.objects.all().values_list('id', flat=True)
-    ktq = KeywordTransmissionQ.objects.all().values_list('id', flat=True)
-    valid_q = [a for a in tq if a not in ktq]
-    for txq in TransmissionQ.objects.filter(id__in=valid_q):
-        if _is_a_valid_entry_to_add_in_transmission_queue(entry, txq):
-            eqs = Entry.objects.filter(id=entry.id)
-            txq.add_items(eqs, action=action)
-    
+    # only the TransmissionQs subscribed to the entry's publication, but
+    # not the KeywordTransmissionQs, see queues.routing
+    from queues.routing import route_entry
+
+    route_entry(entry, action=action,
+                is_valid=_is_a_valid_entry_to_add_in_transmission_queue)
+
+
 # listen to the refresh entry qs signal!!
 refresh_entry_qs.connect(update_entry_qs_handler) #, sender=Entry, weak=True, dispatch_uid=None)
 refresh_entry_txqs.connect(update_entry_txq_handler)
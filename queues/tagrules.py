@@ -0,0 +1,122 @@
+"""
+Compiled index over the TagRules of all the Qs
+
+Instead of asking every Q if an entry is valid, the rules are compiled once
+into a tag -> Qs lookup, the Qs an entry belongs to are then found in a single
+pass over its tags. The index is rebuilt only when a Q or a TagRule changes,
+see the signals connected at the end of queues.models
+
+A Q matches an entry when:
+* it has at least one Filter by all / Filter by any / Search by any rule
+* all the tags of its Filter by all rules are present
+* at least one tag of its Filter by any rules is present
+* at least one of its Search by any values is found within the tags
+* none of the tags of its Exclude any rules is present
+"""
+from collections import defaultdict
+
+from cutils.utils import VersionedCache
+
+
+def split_tags(value):
+    """
+    returns the set of normalized tags in the comma separated value
+    """
+    return set([t.strip().lower() for t in value.split(',') if t.strip()])
+
+
+def get_entry_tags(entry):
+    """
+    returns the normalized set of tags for the entry, Entry.tags if available
+    else the comma separated keywords and sites_tag
+    """
+    tags = getattr(entry, 'tags', None)
+    if tags is None:
+        tags = u'%s,%s' % (entry.keywords or u'', entry.sites_tag or u'')
+    if isinstance(tags, basestring):
+        return split_tags(tags)
+    return set([unicode(t).strip().lower() for t in tags if unicode(t).strip()])
+
+
+class TagRuleIndex(object):
+    """
+    built from (q id, key, value) rows, see TAG_RULE_KEYS for the keys
+    """
+
+    def __init__(self, rules):
+        # tag -> list of (q id, key) for the tag based rules
+        self.postings = defaultdict(list)
+        # q id -> number of tags required by the Filter by all rules
+        self.required_count = defaultdict(int)
+        # search value -> set of q ids
+        self.search_terms = defaultdict(set)
+
+        self.filter_any_qs = set()
+        self.search_qs = set()
+
+        required = defaultdict(set)
+        for q_id, key, value in rules:
+            tags = split_tags(value)
+            if key == 'A':
+                required[q_id].update(tags)
+            elif key == 'F':
+                self.filter_any_qs.add(q_id)
+                for tag in tags:
+                    self.postings[tag].append((q_id, 'F'))
+            elif key == 'E':
+                for tag in tags:
+                    self.postings[tag].append((q_id, 'E'))
+            elif key == 'S':
+                self.search_qs.add(q_id)
+                for tag in tags:
+                    self.search_terms[tag].add(q_id)
+
+        for q_id, tags in required.items():
+            self.required_count[q_id] = len(tags)
+            for tag in tags:
+                self.postings[tag].append((q_id, 'A'))
+
+    def match(self, tags):
+        """
+        returns the set of Q ids matched by the normalized tags
+        """
+        all_hits = defaultdict(int)
+        any_hits = set()
+        excluded = set()
+        for tag in tags:
+            for q_id, key in self.postings.get(tag, ()):
+                if key == 'A':
+                    all_hits[q_id] += 1
+                elif key == 'F':
+                    any_hits.add(q_id)
+                else:
+                    excluded.add(q_id)
+
+        search_hits = set()
+        if self.search_terms:
+            text = u'\n'.join(tags)
+            for term, q_ids in self.search_terms.items():
+                if term in text:
+                    search_hits.update(q_ids)
+
+        # every positive rule needs at least one hit, only the Qs hit
+        # by the tags need to be checked
+        matched = set()
+        for q_id in (set(all_hits) | any_hits | search_hits) - excluded:
+            if all_hits[q_id] < self.required_count[q_id]:
+                continue
+            if q_id in self.filter_any_qs and q_id not in any_hits:
+                continue
+            if q_id in self.search_qs and q_id not in search_hits:
+                continue
+            matched.add(q_id)
+        return matched
+
+
+def build_tag_rule_index():
+    from queues.models import TagRule
+
+    return TagRuleIndex(TagRule.fetch.values_list('q', 'key', 'value'))
+
+
+tag_rule_index = VersionedCache('queues.tag_rule_index', build_tag_rule_index)
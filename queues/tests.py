@@ -1,6 +1,163 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from django.test import TestCase
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from queues import transmit
+
+
+class StubItem(object):
+    """
+    a TransmissionQItem, its xml is built without the entry
+    """
+    def __init__(self, pk):
+        self.pk = pk
+
+    def xml(self):
+        if self.pk == 'broken':
+            raise ValueError('no xml')
+        return 'item-%s' % self.pk, '<item>%s</item>' % self.pk
+
+
+class StubConnection(transmit.FileSystemConnection):
+    """
+    the local directory stand-in of an upload location, the uploads of the
+    files listed in `failures` fail that many times
+    """
+    lock = threading.Lock()
+    opened = 0
+    running = 0
+    most_running = 0
+    failures = {}
+
+    def __init__(self, location):
+        super(StubConnection, self).__init__(location)
+        with self.lock:
+            StubConnection.opened += 1
+
+    def upload_content(self, filename, content):
+        with self.lock:
+            StubConnection.running += 1
+            StubConnection.most_running = max(StubConnection.most_running, StubConnection.running)
+            failures = self.failures.get(filename, 0)
+            self.failures[filename] = failures - 1
+        try:
+            time.sleep(0.01)
+            if failures > 0:
+                raise IOError('upload failed')
+            super(StubConnection, self).upload_content(filename, content)
+        finally:
+            with self.lock:
+                StubConnection.running -= 1
+
+
+class TransmitEngineTest(SimpleTestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        StubConnection.opened = StubConnection.running = StubConnection.most_running = 0
+        StubConnection.failures = {}
+        transmit.CONNECTION_TYPES['S'] = StubConnection
+
+    def tearDown(self):
+        for key in [key for key in transmit._pools if key[1] == 'S']:
+            transmit._pools.pop(key).close()
+        del transmit.CONNECTION_TYPES['S']
+        shutil.rmtree(self.location)
+
+    def run_engine(self, items, workers=4):
+        pool = transmit.ConnectionPool('S', self.location, size=workers)
+        engine = transmit.TransmitEngine(pool, workers=workers, retries=3, backoff=0)
+        return dict((r.tqi.pk, r) for r in engine.run(items))
+
+    def test_transmit(self):
+        results = self.run_engine([StubItem(i) for i in range(20)])
+        self.assertEqual(set(r.action for r in results.values()), set(['T']))
+        self.assertEqual(sorted(os.listdir(self.location)), sorted('item-%d.xml' % i for i in range(20)))
+        with open(os.path.join(self.location, 'item-3.xml')) as f:
+            self.assertEqual(f.read(), '<item>3</item>')
+        # the connections are reused by the workers, at most one per worker
+        self.assertEqual(StubConnection.most_running, 4)
+        self.assertTrue(StubConnection.opened <= 4)
+
+    def test_retries(self):
+        StubConnection.failures = {'item-1.xml': 2, 'item-2.xml': 3}
+        results = self.run_engine([StubItem(i) for i in range(4)] + [StubItem('broken')])
+        self.assertEqual(dict((pk, (r.action, r.attempts)) for pk, r in results.items()),
+                         {0: ('T', 1), 1: ('T', 3), 2: ('F', 3), 3: ('T', 1), 'broken': ('F', 0)})
+        self.assertTrue(isinstance(results[2].error, IOError))
+        self.assertEqual(sorted(os.listdir(self.location)), ['item-0.xml', 'item-1.xml', 'item-3.xml'])
+        # the connections of the failed uploads are discarded
+        self.assertTrue(StubConnection.opened >= 5)
+
+    def test_get_pool(self):
+        class Location(object):
+            def __init__(self, pk, location):
+                self.pk, self.type, self.location = pk, 'S', location
+
+        pool = transmit.get_pool(Location(1, self.location))
+        self.assertTrue(transmit.get_pool(Location(1, self.location)) is pool)
+        self.assertFalse(transmit.get_pool(Location(2, self.location)) is pool)
+        # the location changed, a new pool replaces the old one
+        moved = transmit.get_pool(Location(1, os.path.join(self.location, 'moved')))
+        self.assertFalse(moved is pool)
+        self.assertEqual(moved.location, os.path.join(self.location, 'moved'))
+
+
+class TransmitTest(TestCase):
+    def setUp(self):
+        from accounts.models import Account
+        from content_management.models import Entry
+        from cutils.models import CronSettings
+        from publications.models import Publication
+        from queues.models import TransmissionQ, TransmissionQItem, UploadLocation
+
+        self.location = tempfile.mkdtemp()
+        # the xml of the entries is built by the cms, not here
+        self.xml = TransmissionQItem.xml
+        TransmissionQItem.xml = lambda tqi: ('item-%d' % tqi.entry_id, '<item>%d</item>' % tqi.entry_id)
+
+        User.objects.create(id=1, username='admin')
+        publisher = Account.objects.create(title='publisher', slug='publisher', type='P')
+        buyer = Account.objects.create(title='buyer', slug='buyer', type='B')
+        publication = Publication.objects.create(title='publication', slug='publication', account=publisher)
+        self.tx_q = TransmissionQ.objects.create(title='tq', slug='tq', buyer=buyer,
+                                                 load_frequency=CronSettings.objects.create(title='daily'))
+        UploadLocation.objects.create(tx_q=self.tx_q, type='O', location=self.location)
+        self.items = {}
+        for i, action in enumerate('SSSTIPF'):
+            entry = Entry.objects.create(title='title %d' % i, slug='title-%d' % i, body_html='body',
+                                         pub_date=datetime.now(), publication=publication)
+            self.items[entry.pk] = TransmissionQItem.objects.create(tx_q=self.tx_q, entry=entry, action=action)
+
+    def tearDown(self):
+        from queues.models import TransmissionQItem
+
+        TransmissionQItem.xml = self.xml
+        for key in [key for key in transmit._pools if key[2] == self.location]:
+            transmit._pools.pop(key).close()
+        shutil.rmtree(self.location)
+
+    def actions(self):
+        from queues.models import TransmissionQItem
+
+        return dict(TransmissionQItem.objects.values_list('entry', 'action'))
+
+    def test_only_scheduled_items_are_transmitted(self):
+        scheduled = sorted(pk for pk, tqi in self.items.items() if tqi.action == 'S')
+        files, transmitted, failed = self.tx_q.transmit()
+        self.assertEqual(sorted(files), sorted('item-%d.xml' % pk for pk in scheduled))
+        self.assertEqual((len(transmitted), failed), (3, []))
+        expected = dict((pk, 'T' if tqi.action == 'S' else tqi.action) for pk, tqi in self.items.items())
+        self.assertEqual(self.actions(), expected)
+
+        # nothing is left to transmit
+        self.assertEqual(self.tx_q.transmit()[1:], ([], []))
+        self.assertEqual(self.actions(), expected)
@@ -11,8 +11,8 @@ from django.conf import settings
 from django.views.generic.simple import direct_to_template
 from django.contrib.auth.decorators import login_required
 from django.core.urlresolvers import reverse
-from django.db.models import Count
-from django.http import HttpResponse
+from django.db.models import Count, Sum
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import simplejson
 from django.views.generic.list_detail import object_list
@@ -23,7 +23,9 @@ from django.views.decorators.cache import cache_control
 
 from cutils.utils import ContifyDateUtil
 from publications.models import Publication
-from queues.models import Q, QItem, TransmissionQ, TransmissionQItem, IndustryFeed
+from queues.models import (
+    Q, QItem, TransmissionQ, TransmissionQItem, TransmissionQItemDailyCount, IndustryFeed
+)
 from queues.forms import TransmissionQStatusReportForm, SchedulerForm
 from penseive_entity.models import Industry as PenseiveIndustry
 from reporting.forms import DateBaseReportForm
@@ -366,18 +368,18 @@ def tx_q_status_json(request, year, month, action):
     # let us prepare the query!
     if request.user.id == 247:
         start_date = start_date - timedelta(days=764)
-        qs = TransmissionQItem.objects.filter(
-            created_on__range=(start_date, end_date),
+        qs = TransmissionQItemDailyCount.objects.filter(
+            day__range=(start_date.date(), end_date.date()),
             action=action,
             publication__in=publications)
     else:
-        qs = TransmissionQItem.objects.filter(
-            created_on__range=(start_date, end_date),
+        qs = TransmissionQItemDailyCount.objects.filter(
+            day__range=(start_date.date(), end_date.date()),
             action=action,
             publication__in=publications)
 
     qs = qs.values('tx_q', 'publication', 'publication__title', 'publication__slug'). \
-        annotate(c=Count('action')).order_by('publication')
+        annotate(c=Sum('count')).order_by('publication')
 
     # lets re-group results by publications
     pub_list = []
@@ -496,7 +498,7 @@ def scheduler(request):
             if industryfeed_id:
                 qs = qs.filter(tx_q__industry_feeds__id=industryfeed_id)
             qs = qs.filter(entry__pub_date__gte=startDate, entry__pub_date__lte=endDate)
-            updated_count = qs.update(action='S')
+            updated_count = qs.update_action('S')
 
             return object_list(
                 request,
@@ -532,50 +534,56 @@ def scheduler(request):
         )
 
 
+class Echo(object):
+    """
+    file like object for csv.writer, returns the row instead of storing it
+    """
+    def write(self, value):
+        return value
+
+
 def transmitted_count_per_publication(request):
+    """
+    csv with the number of items transmitted per day for each active
+    sub publication of the TransmissionQ, the counts of the whole range are
+    read in one query from the daily counts and the csv is streamed a row at a time
+    """
     form = DateBaseReportForm(request.GET)
     if form.is_valid():
         tx_q = form.cleaned_data['transmissionq_choice']
     d = datetime.datetime.now()
-    start_date = datetime.datetime.strptime(
-        request.GET['start'], "%Y-%m-%d").replace(
-        hour=0, minute=0, second=0, microsecond=0
-    )
-    end_date = datetime.datetime.strptime(
-        request.GET['end'], "%Y-%m-%d").replace(
-        hour=23, minute=59, second=59
-    )
-    if not (start_date and end_date):
-        end_date = d
-        start_date = (d - datetime.timedelta(days=30)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+    if request.GET.get('start') and request.GET.get('end'):
+        start_date = datetime.datetime.strptime(request.GET['start'], "%Y-%m-%d").date()
+        end_date = datetime.datetime.strptime(request.GET['end'], "%Y-%m-%d").date()
+    else:
+        end_date = d.date()
+        start_date = end_date - datetime.timedelta(days=30)
     totalDays = (end_date - start_date).days + 1
-    created_on_start_range = d - datetime.timedelta(days=90)
     t = TransmissionQ.objects.get(id=tx_q)
     tq = t.sub_publications.values_list('id', flat=True)
     pqs = Publication.objects.filter(id__in=tq, active=True)
     dayList = [
         (start_date + datetime.timedelta(days=day)) for day in range(totalDays)
     ]
-    dataList = []
-    headerRow = ["Publication Title"]
-    headerRow.extend([item.strftime("%d-%m-%Y") for item in dayList])
-    dataList.append(headerRow)
-    currentDate = start_date
-    for p in pqs:
-        rowList = []
-        rowList.append(p)
-        for currentDate in dayList:
-            q = TransmissionQItem.objects.filter(
-                publication__id=p.id, tx_q__id=t.id, created_on__year=currentDate.year,
-                created_on__month=currentDate.month, created_on__day=currentDate.day, action__exact='T'
-            ).count()
-            rowList.append(q)
-        dataList.append(rowList)
-
-    response = HttpResponse(content_type='text/csv')
+
+    # (publication id, day) -> count
+    counts = dict(
+        ((row['publication'], row['day']), row['c']) for row in
+        TransmissionQItemDailyCount.objects.filter(
+            tx_q=t, action='T', day__range=(start_date, end_date), publication__in=pqs
+        ).values('publication', 'day').annotate(c=Sum('count')).order_by()
+    )
+
+    def rows():
+        headerRow = ["Publication Title"]
+        headerRow.extend([item.strftime("%d-%m-%Y") for item in dayList])
+        yield headerRow
+        for p in pqs.iterator():
+            rowList = [unicode(p).encode('utf-8')]
+            rowList.extend([counts.get((p.id, currentDate), 0) for currentDate in dayList])
+            yield rowList
+
+    c = csv.writer(Echo())
+    response = StreamingHttpResponse((c.writerow(row) for row in rows()), content_type='text/csv')
     response['Content-Disposition'] = 'attachment; filename="transmittedcountperpublication.csv"'
-    c = csv.writer(response)
-    c.writerows(dataList)
-    return response
\ No newline at end of file
+    return response
@@ -6,14 +6,15 @@ import urllib
 import simplejson
 
 # django imports
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
 from django.template import RequestContext
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import (
     render, get_object_or_404, render_to_response, HttpResponse
 )
 from django.contrib.admin.views.decorators import staff_member_required
-from django.db.models import Count
+from django.db.models import Count, Q
+from django.template.loader import get_template
 
 # project imports
 from story.models import Story, Buyer
@@ -25,6 +26,12 @@ from story.forms import UserMonitorForm
 
 logger = logging.getLogger(__name__)
 
+# number of stories fetched per query by the streaming xml feed
+XML_FEED_CHUNK_SIZE = 100
+
+# the only Story columns the xml feed needs
+XML_FEED_FIELDS = ('id', 'title', 'url', 'pub_date', 'approved_on', 'body_text')
+
 
 def prepare_query_filter(form_data):
     """
@@ -70,8 +77,39 @@ def prepare_query_filter(form_data):
     return filter_dict
 
 
+def iter_stories_by_keyset(storyQs, chunk_size=XML_FEED_CHUNK_SIZE):
+    """
+    yields the stories, latest approved first, fetched chunk_size at a time,
+    every chunk starts after the (approved_on, id) of the last story seen,
+    only one chunk is held in memory
+    """
+    storyQs = storyQs.only(*XML_FEED_FIELDS).order_by('-approved_on', '-id')
+    chunk = list(storyQs[:chunk_size])
+    while chunk:
+        for story in chunk:
+            yield story
+        last = chunk[-1]
+        chunk = list(storyQs.filter(
+            Q(approved_on__lt=last.approved_on) |
+            Q(approved_on=last.approved_on, id__lt=last.id))[:chunk_size])
+
+
+def stream_xml_feed(storyQs, context):
+    """
+    yields the xml feed, the header, one story at a time, the footer
+    """
+    yield get_template('story/xml_feed/stories_header.xml').render(context)
+    story_template = get_template('story/xml_feed/story.xml')
+    for story in iter_stories_by_keyset(storyQs):
+        yield story_template.render({'story': story})
+    yield get_template('story/xml_feed/stories_footer.xml').render(context)
+
+
 def get_xml_feed(request, domain_id):
     """
+    xml feed of the stories of the domain approved in the last h hours
+    (default 2), with ?stream=1 the feed is streamed, the stories are
+    fetched in chunks and written as they are rendered
     """
     if not domain_id.isdigit:
         raise Http404
@@ -82,8 +120,20 @@ def get_xml_feed(request, domain_id):
     else:
         hours_limit = 2
     startDate = endDate - datetime.timedelta(hours=hours_limit)
-    storyQs = Story.objects.select_related()
     domain = get_object_or_404(Source, id=domain_id)
+    if request.GET.get('stream'):
+        # the window is closed at endDate, stories approved while the
+        # feed is being streamed are left for the next request
+        storyQs = Story.objects.filter(
+            alternate_domain=domain, approved_on__gte=startDate,
+            approved_on__lte=endDate, status=2)
+        context = {'currentDay': endDate, 'domain': domain,
+                   'story_count': storyQs.count(), 'hours_limit': hours_limit}
+        return StreamingHttpResponse(
+            stream_xml_feed(storyQs, context), content_type="application/xhtml+xml"
+        )
+
+    storyQs = Story.objects.select_related()
     storyQs = storyQs.filter(alternate_domain=domain, approved_on__gte=startDate, status=2)
     story_count = storyQs.count()
     # results = storyQs.values()
@@ -97,6 +97,17 @@ DATABASES = {
    }
 }
 
+# shared by the web, cron and worker processes, the versions of the
+# VersionedCache indexes and the cached classifications live there, create the
+# table with ./manage.py createcachetable
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'syndication_cache',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    }
+}
+
 STRIP_TAGS = "span font div class html sup hr small"
 # Password validation
 # https://docs.djangoproject.com/en/1.11/ref/settings/#auth-password-validators
@@ -197,6 +197,10 @@ class SourceAdmin(admin.ModelAdmin):
                           """ % (rows_updated))
         return HttpResponseRedirect(request.get_full_path())
 
+    def get_queryset(self, request):
+        # the SourceUrl counters of the list are computed by the list query
+        return super(SourceAdmin, self).get_queryset(request).with_url_counts()
+
     def queryset(self, request):
         """
         just to categorize contify and tns sources
@@ -220,7 +224,7 @@ class SourceUrlAdmin(admin.ModelAdmin):
     }
     template = "admin/websource/sourceurl/change_form.html"
     list_display = ('source', 'status', 'published_count', 'is_checked', 'need_triage',
-                    'last_doc_found_on', 'is_updated', 'last_triaged', 'is_working')
+                    'last_doc_found_on', 'is_updated', 'snapshot_changed_lines', 'last_triaged', 'is_working')
 
     fieldsets = ((None, {'fields':
                              (('uid', 'url', 'is_active', 'is_checked',), ('name',),
@@ -229,6 +233,7 @@ class SourceUrlAdmin(admin.ModelAdmin):
                               ('status', 'response_code', 'response_msg', 'doc_counter', 'nodoc_counter',),
                               ('specific_rule',), ('scraping_rules',),
                               ('old_snapshot', 'new_snapshot',),
+                              ('snapshot_changes',),
                               )
                          }
                   ),
@@ -241,7 +246,7 @@ class SourceUrlAdmin(admin.ModelAdmin):
                    )
     list_editable = ('is_checked',)
     filter_horizontal = ('scraping_rules',)
-    readonly_fields = ('old_snapshot', 'new_snapshot', 'last_triaged',
+    readonly_fields = ('old_snapshot', 'new_snapshot', 'snapshot_changes', 'last_triaged',
                        'need_triage', 'response_code', 'response_msg', 'doc_counter', 'nodoc_counter',
                        'status',
                        )
@@ -284,7 +289,7 @@ class SourceUrlAdmin(admin.ModelAdmin):
         if not request.user.is_superuser:
             list_display = ('source', 'status', 'last_checked',
                             'published_count', 'last_doc_found_on', 'is_checked',
-                            'is_updated', 'last_triaged')
+                            'is_updated', 'snapshot_changed_lines', 'last_triaged')
         return list_display
 
     def fetch_patent_urls(self, request, queryset):
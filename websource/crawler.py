@@ -0,0 +1,264 @@
+"""
+Concurrent snapshot crawler for the SourceUrls
+
+The due SourceUrls are fetched by a bounded pool of worker threads, every
+worker keeps its own requests session so the connections to a host are
+reused. Requests to the same host are spaced by at least CRAWL_HOST_DELAY
+seconds whatever the number of workers. The workers only fetch and extract
+the text, the snapshots are written by the calling thread, a few UPDATE
+statements in one transaction per batch of SourceUrls.
+
+The text is extracted with the area pattern of the SourceUrl, its tag_*
+fields or its archived pattern, see websource.selectors.
+
+The pages are read with conditional requests, a page the server reports as
+not modified, or whose hash did not change, is not parsed and its snapshots
+are not rewritten.
+
+A SourceUrl is due when its last_triaged is older than the frequency of its
+Source, see FREQUENCY_INTERVALS.
+"""
+import logging
+import re
+import threading
+import time
+import urlparse
+from datetime import datetime, timedelta
+from Queue import Queue, Empty
+
+import requests
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+
+from websource.models import SourceUrl, snapshot_hash
+from websource.extractor import ContentExtractor, get_text
+from websource.selectors import get_selector
+from websource.spider import Spider, page_hash
+
+logger = logging.getLogger(__name__)
+
+CRAWL_WORKERS = getattr(settings, 'WEBSOURCE_CRAWL_WORKERS', 8)
+# seconds between two requests to the same host
+CRAWL_HOST_DELAY = getattr(settings, 'WEBSOURCE_CRAWL_HOST_DELAY', 2.0)
+CRAWL_TIMEOUT = getattr(settings, 'WEBSOURCE_CRAWL_TIMEOUT', 30)
+CRAWL_PROXIES = getattr(settings, 'WEBSOURCE_CRAWL_PROXIES', None)
+# number of SourceUrls written per transaction
+CRAWL_BATCH_SIZE = 100
+
+FREQUENCY_INTERVALS = {
+    'YEARLY': timedelta(days=365),
+    'MONTHLY': timedelta(days=30),
+    'WEEKLY': timedelta(days=7),
+    'DAILY': timedelta(days=1),
+    'HOURLY': timedelta(hours=1),
+    'MINUTELY': timedelta(minutes=1),
+    'SECONDLY': timedelta(seconds=1),
+}
+
+# the SourceUrl fields written when the snapshot changes, see SourceUrl.update_snapshot
+SNAPSHOT_FIELDS = ('old_snapshot', 'new_snapshot', 'content_hash', 'overwrite', 'is_updated',
+                   'doc_counter', 'nodoc_counter', 'last_doc_found_on')
+# the SourceUrl fields the crawler reads
+CRAWL_FIELDS = ('url', 'tag_name', 'tag_attr', 'tag_attr_value', 'new_snapshot', 'doc_counter',
+                'nodoc_counter', 'last_doc_found_on', 'etag', 'last_modified', 'page_hash',
+                'content_hash')
+
+
+def get_due_urls(now=None):
+    """
+    returns the active SourceUrls due for a crawl
+    """
+    now = now or datetime.now()
+    due = Q()
+    for frequency, interval in FREQUENCY_INTERVALS.items():
+        due |= Q(source__frequency=frequency, last_triaged__lt=now - interval)
+    return SourceUrl.objects.filter(due, is_active=True, source__is_active=True)
+
+
+def response_message(status, reason):
+    """
+    returns the response_msg of a SourceUrl, as the SourceUrl admin does
+    """
+    if status == 200:
+        return 'OK'
+    msg = (reason or '').upper()
+    if msg == "NOT FOUND":
+        msg = "PAGE NOT FOUND"
+    if re.search("NAME OR SERVICE NOT KNOWN", msg):
+        msg = "INTERNAL SERVER ERROR"
+    return msg
+
+
+class HostThrottle(object):
+    """
+    hands out the request slots of every host, CRAWL_HOST_DELAY apart
+    """
+    def __init__(self, delay=CRAWL_HOST_DELAY):
+        self.delay = delay
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, host):
+        with self.lock:
+            now = time.time()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CrawlResult(object):
+    def __init__(self, sourceurl, text=None, status=None, msg='', page=None, page_hash='',
+                 unchanged=False):
+        self.sourceurl = sourceurl
+        self.text = text
+        self.status = status
+        self.msg = msg
+        self.page = page
+        self.page_hash = page_hash
+        self.unchanged = unchanged
+
+
+class Crawler(object):
+    def __init__(self, workers=CRAWL_WORKERS, host_delay=CRAWL_HOST_DELAY, timeout=CRAWL_TIMEOUT,
+                 proxies=CRAWL_PROXIES, batch_size=CRAWL_BATCH_SIZE):
+        self.workers = workers
+        self.throttle = HostThrottle(host_delay)
+        self.timeout = timeout
+        self.proxies = proxies
+        self.batch_size = batch_size
+        self.spider = Spider()
+
+    def crawl(self, session, sourceurl):
+        """
+        reads the SourceUrl, the page is not parsed when the server answers
+        304 or when the page did not change since the last read
+        """
+        self.throttle.wait(urlparse.urlparse(sourceurl.url).netloc.lower())
+        page = self.spider.fetch_page(sourceurl.url, sourceurl.etag, sourceurl.last_modified,
+                                      session=session, timeout=self.timeout, proxies=self.proxies)
+        msg = response_message(page.status, page.msg)
+        if page.status != 200:
+            return CrawlResult(sourceurl, None, page.status, msg)
+        if page.not_modified:
+            return CrawlResult(sourceurl, None, page.status, msg, page, sourceurl.page_hash, unchanged=True)
+
+        new_hash = page_hash(page.data, sourceurl.tag_name, sourceurl.tag_attr, sourceurl.tag_attr_value)
+        if new_hash == sourceurl.page_hash:
+            return CrawlResult(sourceurl, None, page.status, msg, page, new_hash, unchanged=True)
+
+        text = None
+        selector = get_selector(sourceurl)
+        try:
+            if selector is not None:
+                text = get_text(ContentExtractor(page.data).select(selector))
+        except Exception, e:
+            logger.warning("unable to extract the content of %s: %s" % (sourceurl.url, e))
+        unchanged = bool(text) and snapshot_hash(text) == sourceurl.content_hash
+        return CrawlResult(sourceurl, text, page.status, msg, page, new_hash, unchanged)
+
+    def worker(self, jobs, results):
+        session = requests.Session()
+        try:
+            while True:
+                sourceurl = jobs.get()
+                if sourceurl is None:
+                    break
+                try:
+                    results.put(self.crawl(session, sourceurl))
+                except Exception, e:
+                    logger.error("unable to crawl %s: %s" % (sourceurl.url, e))
+                    results.put(CrawlResult(sourceurl, None, 500, str(e)))
+        finally:
+            session.close()
+
+    def apply(self, result, now):
+        """
+        updates the SourceUrl from the crawl result, as a save with overwrite
+        set does, returns the fields to write. The snapshots of an unchanged
+        page are left as they are
+        """
+        obj = result.sourceurl
+        obj.response_code = str(result.status)
+        obj.response_msg = (result.msg or u'')[:400]
+        obj.last_triaged = now
+        fields = ['response_code', 'response_msg', 'last_triaged']
+        if result.page is None:
+            return fields
+
+        obj.etag = result.page.etag[:300]
+        obj.last_modified = result.page.last_modified[:100]
+        obj.page_hash = result.page_hash
+        fields.extend(['etag', 'last_modified', 'page_hash'])
+        if result.unchanged:
+            obj.is_updated = False
+            obj.overwrite = False
+            fields.extend(['is_updated', 'overwrite'])
+            return fields
+
+        if result.text:
+            obj.update_snapshot(result.text)
+            fields.extend(SNAPSHOT_FIELDS)
+        obj.need_triage = not (result.text or obj.new_snapshot) or get_selector(obj) is None
+        fields.append('need_triage')
+        return fields
+
+    def save(self, results):
+        """
+        writes the results, the SourceUrls with the same fields to write are
+        saved together by SourceUrl.objects.bulk_save()
+        """
+        now = datetime.now()
+        groups = {}
+        for result in results:
+            fields = tuple(self.apply(result, now))
+            groups.setdefault(fields, []).append(result.sourceurl)
+        with transaction.atomic():
+            for fields, sourceurls in groups.items():
+                SourceUrl.objects.bulk_save(sourceurls, fields)
+
+    def drain(self, results, counts):
+        """
+        writes the finished results, a batch at a time, counts them by status
+        """
+        batch = []
+        while True:
+            try:
+                result = results.get_nowait()
+            except Empty:
+                break
+            counts[result.status] = counts.get(result.status, 0) + 1
+            batch.append(result)
+            if len(batch) >= self.batch_size:
+                self.save(batch)
+                batch = []
+        if batch:
+            self.save(batch)
+
+    def run(self, sourceurls):
+        """
+        crawls the SourceUrls, returns a {status: count} dict
+        """
+        sourceurls = sourceurls.only(*CRAWL_FIELDS)
+        jobs = Queue(maxsize=self.workers * 2)
+        results = Queue()
+        threads = [threading.Thread(target=self.worker, args=(jobs, results))
+                   for i in range(self.workers)]
+        for t in threads:
+            t.daemon = True
+            t.start()
+
+        counts = {}
+        try:
+            for sourceurl in sourceurls.iterator():
+                jobs.put(sourceurl)
+                if results.qsize() >= self.batch_size:
+                    self.drain(results, counts)
+        finally:
+            for t in threads:
+                jobs.put(None)
+            for t in threads:
+                t.join()
+        self.drain(results, counts)
+        return counts
@@ -0,0 +1,165 @@
+"""
+Parse once content extraction for the SourceUrl pages
+
+A ContentExtractor parses the page with the first parser of
+EXTRACTOR_PARSERS, lxml by default, the tree is kept and reused by every
+lookup. The next parser (html5lib, slower but closer to the browsers, then
+html.parser) is only used when the page can not be parsed or when a rule is
+not found in the first tree, its tree is kept as well. The parsers that are
+not installed are skipped, html.parser always is.
+
+A rule is a (tag_name, tag_attr, tag_attr_value) tuple, as stored on the
+SourceUrl, it is compiled once into a Selector
+>>> extractor = ContentExtractor(data)
+>>> extractor.extract('div', 'id', 'content')
+>>> extractor.extract_many([('div', 'id', 'content'), ('a', 'href', '/news/')])
+"""
+import logging
+import re
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+EXTRACTOR_PARSERS = getattr(settings, 'WEBSOURCE_EXTRACTOR_PARSERS', ('lxml', 'html5lib', 'html.parser'))
+
+# tags of the feeds, looked up by name only
+FEED_ITEM_TAGS = ('item', 'entry')
+FEED_DATE_TAGS = ('pubdate',)
+
+
+def get_text(content_tag):
+    """
+    returns the text of the tag, whitespace collapsed
+    """
+    if content_tag:
+        return re.sub(r"\s+", " ", content_tag.get_text()).strip()
+
+
+class Selector(object):
+    """
+    compiled area pattern, the tag name and the attrs to match, the href
+    values are regular expressions
+    """
+    def __init__(self, tag_name, attrs=None):
+        self.tag_name = tag_name
+        self.attrs = {}
+        for attr, value in (attrs or {}).items():
+            if attr == 'href' and value:
+                value = re.compile(value)
+            self.attrs[attr] = value
+        self.feed_item = tag_name in FEED_ITEM_TAGS
+        # the feed tags are looked up by name, in the first tree only
+        self.by_name = self.feed_item or tag_name in FEED_DATE_TAGS
+
+    def find(self, tree):
+        if self.feed_item:
+            item = tree.find(self.tag_name)
+            return item.find('title') if item else None
+        if self.by_name:
+            return tree.find(self.tag_name)
+        return tree.find(self.tag_name, self.attrs)
+
+
+_selectors = {}
+
+
+def compile_selector(tag_name, attrs=None):
+    """
+    returns the Selector of the pattern, compiled once per process
+    """
+    key = (tag_name, tuple(sorted((attrs or {}).items())))
+    if key not in _selectors:
+        _selectors[key] = Selector(tag_name, attrs)
+    return _selectors[key]
+
+
+def compile_rule(tag_name, tag_attr=None, tag_attr_value=None):
+    """
+    returns the Selector of a (tag_name, tag_attr, tag_attr_value) rule
+    """
+    return compile_selector(tag_name, {tag_attr: tag_attr_value})
+
+
+_installed_parsers = {}
+
+
+def installed_parsers(parsers):
+    """
+    returns the parsers that are installed, in order, html.parser (part of
+    the standard library) when none is
+    """
+    parsers = tuple(parsers)
+    if parsers not in _installed_parsers:
+        installed = tuple(parser for parser in parsers if builder_registry.lookup(parser))
+        for parser in parsers:
+            if parser not in installed:
+                logger.warning("the %s parser is not installed" % parser)
+        _installed_parsers[parsers] = installed or ('html.parser',)
+    return _installed_parsers[parsers]
+
+
+class ContentExtractor(object):
+    def __init__(self, data, parsers=EXTRACTOR_PARSERS):
+        self.data = data
+        self.parsers = installed_parsers(parsers)
+        self._trees = {}
+
+    def tree(self, parser):
+        """
+        returns the tree built by the parser, None if the parser fails
+        """
+        if parser not in self._trees:
+            try:
+                self._trees[parser] = BeautifulSoup(self.data, parser)
+            except Exception, e:
+                # HTMLParseError
+                logger.warning("unable to parse the page with %s: %s" % (parser, e))
+                self._trees[parser] = None
+        return self._trees[parser]
+
+    def trees(self):
+        for parser in self.parsers:
+            tree = self.tree(parser)
+            if tree is not None:
+                yield tree
+
+    def select(self, selector):
+        """
+        returns the tag matched by the Selector, looked up in the trees of the
+        parsers in order, the next tree is only built on a miss
+        """
+        for tree in self.trees():
+            content_tag = selector.find(tree)
+            if content_tag or selector.by_name:
+                return content_tag
+        return None
+
+    def find(self, tag_name, tag_attr=None, tag_attr_value=None):
+        """
+        returns the tag matched by the rule
+        """
+        if not tag_name:
+            return None
+        return self.select(compile_rule(tag_name, tag_attr, tag_attr_value))
+
+    def extract(self, tag_name, tag_attr=None, tag_attr_value=None):
+        """
+        returns the text of the tag matched by the rule
+        """
+        return get_text(self.find(tag_name, tag_attr, tag_attr_value))
+
+    def find_many(self, rules):
+        """
+        returns the tags matched by the rules or Selectors, in their order
+        """
+        return [self.select(rule) if isinstance(rule, Selector) else self.find(*rule) for rule in rules]
+
+    def extract_many(self, rules):
+        """
+        returns the texts of the tags matched by the rules or Selectors, in
+        their order
+        """
+        return [get_text(tag) for tag in self.find_many(rules)]
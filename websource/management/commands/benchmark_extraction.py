@@ -0,0 +1,79 @@
+import gc
+import os
+import re
+import time
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand, CommandError
+
+
+def legacy_content_tag(data, tag_name, tag_attr, tag_attr_value):
+    """
+    the lookup done by Spider.get_content_tag before websource.extractor,
+    the page is parsed again with html5lib on a miss
+    """
+    soup = BeautifulSoup(data, "html.parser")
+    if tag_attr == 'href':
+        content_tag = soup.find(tag_name, {tag_attr: re.compile(tag_attr_value)})
+        if not content_tag:
+            soup = BeautifulSoup(data, "html5lib")
+            content_tag = soup.find(tag_name, {tag_attr: re.compile(tag_attr_value)})
+    elif tag_name in ['item', 'entry']:
+        content_tag = soup.find(tag_name).find('title') if soup.find(tag_name) else None
+    elif tag_name in ['pubdate']:
+        content_tag = soup.find(tag_name)
+    else:
+        content_tag = soup.find(tag_name, {tag_attr: tag_attr_value})
+        if not content_tag:
+            soup = BeautifulSoup(data, "html5lib")
+            content_tag = soup.find(tag_name, {tag_attr: tag_attr_value})
+    return content_tag
+
+
+class Command(BaseCommand):
+    help = 'Compares the parse once content extraction with the previous one on saved pages, ' \
+           'reports the mismatches and the time taken by both. The pages are read from <id>.html ' \
+           'files, the area pattern of the SourceUrl <id> is used.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', help='directory of the saved pages')
+        parser.add_argument('--repeat', type=int, default=1,
+                            help='number of times every page is extracted')
+        parser.add_argument('--show', type=int, default=5,
+                            help='number of mismatching pages to print')
+
+    def handle(self, *args, **options):
+        from websource.extractor import ContentExtractor, get_text
+        from websource.models import SourceUrl
+
+        if not os.path.isdir(options['directory']):
+            raise CommandError('%s is not a directory' % options['directory'])
+
+        pages = {}
+        for filename in os.listdir(options['directory']):
+            name, ext = os.path.splitext(filename)
+            if ext == '.html' and name.isdigit():
+                with open(os.path.join(options['directory'], filename)) as f:
+                    pages[int(name)] = f.read()
+        rules = dict((su['id'], (su['tag_name'], su['tag_attr'], su['tag_attr_value']))
+                     for su in SourceUrl.objects.filter(id__in=pages.keys(), tag_name__isnull=False).exclude(
+                         tag_name='').values('id', 'tag_name', 'tag_attr', 'tag_attr_value'))
+
+        gc.collect()
+        start = time.time()
+        for i in range(options['repeat']):
+            legacy = dict((id, get_text(legacy_content_tag(pages[id], *rule))) for id, rule in rules.items())
+        legacy_time = time.time() - start
+
+        gc.collect()
+        start = time.time()
+        for i in range(options['repeat']):
+            extracted = dict((id, ContentExtractor(pages[id]).extract(*rule)) for id, rule in rules.items())
+        extractor_time = time.time() - start
+
+        mismatches = sorted(id for id in rules if legacy[id] != extracted[id])
+        for id in mismatches[:options['show']]:
+            self.stdout.write('mismatch: SourceUrl %s' % id)
+
+        self.stdout.write('%d pages, %d mismatches' % (len(rules), len(mismatches)))
+        self.stdout.write('legacy: %.2fs, parse once: %.2fs' % (legacy_time, extractor_time))
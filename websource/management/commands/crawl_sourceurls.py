@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Refreshes the snapshots of the SourceUrls due for a crawl, the pages are fetched concurrently.'
+
+    def add_arguments(self, parser):
+        from websource.crawler import CRAWL_WORKERS, CRAWL_HOST_DELAY
+
+        parser.add_argument('--workers', type=int, default=CRAWL_WORKERS,
+                            help='number of pages fetched at the same time')
+        parser.add_argument('--delay', type=float, default=CRAWL_HOST_DELAY,
+                            help='seconds between two requests to the same host')
+        parser.add_argument('--source', type=int, action='append', dest='sources',
+                            help='only crawl the SourceUrls of this Source id, can be repeated')
+        parser.add_argument('--all', action='store_true',
+                            help='crawl every active SourceUrl, due or not')
+        parser.add_argument('--limit', type=int,
+                            help='maximum number of SourceUrls crawled')
+
+    def handle(self, *args, **options):
+        from websource.crawler import Crawler, get_due_urls
+        from websource.models import SourceUrl
+
+        if options['all']:
+            sourceurls = SourceUrl.objects.filter(is_active=True, source__is_active=True)
+        else:
+            sourceurls = get_due_urls()
+        if options['sources']:
+            sourceurls = sourceurls.filter(source__in=options['sources'])
+        sourceurls = sourceurls.order_by('last_triaged')
+        if options['limit']:
+            sourceurls = sourceurls[:options['limit']]
+
+        counts = Crawler(workers=options['workers'], host_delay=options['delay']).run(sourceurls)
+        for status, count in sorted(counts.items()):
+            self.stdout.write('%s: %d' % (status, count))
+        self.stdout.write('%d SourceUrls crawled' % sum(counts.values()))
@@ -2,14 +2,19 @@
 from __future__ import unicode_literals
 
 # Create your models here.
+import hashlib
 import urllib
 
-from django.db import models
+from django.db import connections, models
+from django.db.models.functions import Cast
 from django.conf import settings
 from utils.cutils import (TAG_LIST, TAG_ATTRS)
+from utils.snapshot_diff import changed_lines, diff_html, diff_snapshots
 from django.contrib.auth.models import User
 from django.utils.translation import ugettext_lazy as _
 from django.template.defaultfilters import slugify
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
 # from django.forms import ValidationError
 from datetime import datetime
 
@@ -43,6 +48,13 @@ SOURCE_STATUS = (
 )
 
 
+def snapshot_hash(snapshot):
+    """
+    returns the sha1 of the snapshot text
+    """
+    return hashlib.sha1((snapshot or '').encode('utf-8')).hexdigest()
+
+
 class SourceAccount(models.Model):
     name = models.CharField(max_length=250)
     slug = models.SlugField(max_length=300, unique=True)
@@ -62,6 +74,23 @@ class SourceAccount(models.Model):
 SOURCE_ADMIN_URL = "/admin/websource/sourceurl/"
 
 
+class SourceQuerySet(models.QuerySet):
+    def with_url_counts(self):
+        """
+        annotates the SourceUrl counters shown in the Source admin, all of
+        them are computed by the one query
+        """
+        return self.annotate(
+            url_total=models.Count('sourceurl'),
+            url_need_triage=models.Count(models.Case(models.When(sourceurl__need_triage=True, then=1))),
+            url_manual_triage=models.Count(models.Case(models.When(sourceurl__manual_triage=True, then=1))),
+            url_docs=models.Count(models.Case(models.When(sourceurl__is_updated=True, then=1))),
+            url_nodocs=models.Count(models.Case(models.When(sourceurl__is_updated=False, then=1))),
+            url_to_do=models.Count(models.Case(models.When(
+                sourceurl__is_updated=True, sourceurl__is_checked=False, then=1))),
+        )
+
+
 class Source(models.Model):
     account = models.ForeignKey(SourceAccount)
     name = models.CharField(max_length=250)
@@ -79,6 +108,8 @@ class Source(models.Model):
     exclude_tag_attr_value = models.CharField(max_length=800, null=True, blank=True)
     assigned_to = models.ForeignKey(User, default=8)
 
+    objects = SourceQuerySet.as_manager()
+
     class Meta:
         ordering = ('name',)
 
@@ -88,7 +119,7 @@ class Source(models.Model):
     def _get_params(self, filter_by, value=True):
         params = {}
         params[filter_by] = '0' if not value else '1'
-        params['source__account__id__exact'] = self.account.id
+        params['source__account__id__exact'] = self.account_id
         params['source__id__exact'] = self.id
         return urllib.urlencode(params)
 
@@ -96,11 +127,19 @@ class Source(models.Model):
         '''
         get the count of the occurence of the given entity
         across all stories
+
+        the counters read the annotations of SourceQuerySet.with_url_counts()
+        when present
         '''
+        if hasattr(self, 'url_total'):
+            return self.url_total
         return self.sourceurl_set.only('id').count()
 
     def need_triage(self):
-        count = self.sourceurl_set.filter(need_triage=True).count()
+        if hasattr(self, 'url_need_triage'):
+            count = self.url_need_triage
+        else:
+            count = self.sourceurl_set.filter(need_triage=True).count()
         params = self._get_params("need_triage")
         return '''<b><a href="%(SOURCE_ADMIN_URL)s?%(params)s">
                 %(count)s
@@ -112,6 +151,8 @@ class Source(models.Model):
         """
         returns count of manual triaged urls
         """
+        if hasattr(self, 'url_manual_triage'):
+            return self.url_manual_triage
         count_urls = self.sourceurl_set.filter(manual_triage=True).count()
         return count_urls
 
@@ -119,6 +160,8 @@ class Source(models.Model):
         """
         returns count of updated urls
         """
+        if hasattr(self, 'url_docs'):
+            return self.url_docs
         suqs = self.sourceurl_set.only('url', 'is_updated').filter(is_updated=True)
         return suqs.count()
 
@@ -126,6 +169,8 @@ class Source(models.Model):
         """
         returns count of urls not updated
         """
+        if hasattr(self, 'url_nodocs'):
+            return self.url_nodocs
         suqs = self.sourceurl_set.only('url', 'is_updated').filter(is_updated=False)
         return suqs.count()
 
@@ -133,6 +178,8 @@ class Source(models.Model):
         """
         returns count of URLs updated but not checked by user
         """
+        if hasattr(self, 'url_to_do'):
+            return self.url_to_do
         return self.sourceurl_set.only("id", "is_updated", "is_checked",
                                        ).filter(is_updated=True, is_checked=False).count()
 
@@ -197,6 +244,37 @@ class Source(models.Model):
     manual_triage.allow_tags = True
 
 
+# the area pattern of a SourceUrl, tag_updated_on is set when it changes
+SOURCE_URL_TAG_FIELDS = ('tag_name', 'tag_attr', 'tag_attr_value')
+# number of SourceUrls written per UPDATE statement by bulk_save()
+SOURCE_URL_BATCH_SIZE = 500
+
+
+class SourceUrlQuerySet(models.QuerySet):
+    def bulk_save(self, objs, fields, batch_size=SOURCE_URL_BATCH_SIZE):
+        """
+        writes the fields of the SourceUrls, one UPDATE per batch, the value
+        of every object is picked by a CASE on its id. save() is not called
+        """
+        objs = list(objs)
+        # postgresql types a CASE of untyped parameters as text, a batch of
+        # NULL datetimes would then be rejected, the values are cast there
+        cast = connections[self.db].vendor == 'postgresql'
+        for start in range(0, len(objs), batch_size):
+            batch = objs[start:start + batch_size]
+            updates = {}
+            for name in fields:
+                field = self.model._meta.get_field(name)
+                whens = []
+                for obj in batch:
+                    value = models.Value(getattr(obj, field.attname), output_field=field)
+                    if cast:
+                        value = Cast(value, output_field=field)
+                    whens.append(models.When(pk=obj.pk, then=value))
+                updates[field.attname] = models.Case(*whens, output_field=field)
+            self.filter(pk__in=[obj.pk for obj in batch]).update(**updates)
+
+
 class SourceUrl(models.Model):
     name = models.CharField(max_length=250, blank=True, null=True)
     source = models.ForeignKey(Source)
@@ -230,6 +308,23 @@ class SourceUrl(models.Model):
     published_story_count = models.IntegerField(default=0)
     manual_triage = models.BooleanField(default=False)
 
+    objects = SourceUrlQuerySet.as_manager()
+
+    """
+    validators of the last read of the url, sent back as If-None-Match /
+    If-Modified-Since, page_hash is the hash of the last page read and of the
+    area pattern, content_hash the hash of new_snapshot
+
+    ALTER TABLE websource_sourceurl ADD COLUMN "etag" varchar(300) NOT NULL DEFAULT '';
+    ALTER TABLE websource_sourceurl ADD COLUMN "last_modified" varchar(100) NOT NULL DEFAULT '';
+    ALTER TABLE websource_sourceurl ADD COLUMN "page_hash" varchar(40) NOT NULL DEFAULT '';
+    ALTER TABLE websource_sourceurl ADD COLUMN "content_hash" varchar(40) NOT NULL DEFAULT '';
+    """
+    etag = models.CharField(max_length=300, blank=True, default='', editable=False)
+    last_modified = models.CharField(max_length=100, blank=True, default='', editable=False)
+    page_hash = models.CharField(max_length=40, blank=True, default='', editable=False)
+    content_hash = models.CharField(max_length=40, blank=True, default='', editable=False)
+
     class Meta:
         ordering = ('is_checked',)
 
@@ -258,8 +353,70 @@ class SourceUrl(models.Model):
     published_count.allow_tags = True
     published_count.admin_order_field = 'published_story_count'
 
+    def update_snapshot(self, new_snapshot):
+        """
+        moves the new snapshot to the old one, the url is updated when the
+        text changed
+        """
+        self.old_snapshot = self.new_snapshot
+        self.new_snapshot = new_snapshot
+        self.content_hash = snapshot_hash(new_snapshot)
+        self.overwrite = False
+        if self.old_snapshot != self.new_snapshot:
+            self.is_updated = True
+            self.doc_counter += 1
+            self.nodoc_counter = 0
+            self.last_doc_found_on = datetime.now()
+        else:
+            self.is_updated = False
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super(SourceUrl, cls).from_db(db, field_names, values)
+        # remember the tag details as loaded, see tag_changed()
+        if set(SOURCE_URL_TAG_FIELDS).issubset(field_names):
+            instance._loaded_tags = instance.get_tags()
+        return instance
+
+    def get_tags(self):
+        return tuple(getattr(self, field) for field in SOURCE_URL_TAG_FIELDS)
+
+    def tag_changed(self):
+        """
+        returns True if the tag details changed since the url was loaded,
+        they are read from the db only when they were not loaded
+        """
+        loaded = getattr(self, '_loaded_tags', None)
+        if loaded is None:
+            loaded = self.__class__._default_manager.filter(id=self.id).values_list(
+                *SOURCE_URL_TAG_FIELDS).first()
+        return loaded != self.get_tags()
+
+    def snapshot_changes(self):
+        """
+        returns the changes between the old and the new snapshot, as html
+        """
+        return mark_safe(diff_html(diff_snapshots(self.old_snapshot, self.new_snapshot)))
+
+    snapshot_changes.short_description = 'Changes'
+
+    def snapshot_changed_lines(self, limit=3, width=100):
+        """
+        returns the first lines (or sentences) added to and removed from the
+        snapshot, as html, the cheap summary of the url list
+        """
+        added, removed = changed_lines(self.old_snapshot, self.new_snapshot)
+        shown = [u'<ins>+ %s</ins>' % escape(line[:width]) for line in added[:limit]] + \
+                [u'<del>- %s</del>' % escape(line[:width]) for line in removed[:limit]]
+        more = len(added) + len(removed) - len(shown)
+        if more > 0:
+            shown.append(u'(%d more)' % more)
+        return mark_safe(u'<br/>'.join(shown))
+
+    snapshot_changed_lines.short_description = 'Changed lines'
+
     def save(self, *args, **kwargs):
-        if self.source:
+        if self.source_id:
             self.uid = self.uid.strip()
             self.name = self.name.strip()
 
@@ -273,16 +430,7 @@ class SourceUrl(models.Model):
             new_snapshot = kwargs.get('new_snapshot', self.new_snapshot)
             if new_snapshot:
                 if self.overwrite:
-                    self.old_snapshot = self.new_snapshot
-                    self.new_snapshot = new_snapshot
-                    self.overwrite = False
-                    if self.old_snapshot != self.new_snapshot:
-                        self.is_updated = True
-                        self.doc_counter += 1
-                        self.nodoc_counter = 0
-                        self.last_doc_found_on = datetime.now()
-                    else:
-                        self.is_updated = False
+                    self.update_snapshot(new_snapshot)
                 self.need_triage = False
             else:
                 self.need_triage = True
@@ -290,25 +438,17 @@ class SourceUrl(models.Model):
             if not self.tag_name:
                 self.need_triage = True
 
-            changed = False
-            fields = ["tag_name", "tag_attr", "tag_attr_value"]
-            # check if only tag details changed
-            # for field in self._meta.get_all_field_names():
-            for field in fields:
-                old_value = getattr(
-                    self.__class__._default_manager.get(id=self.id), field
-                )
-                new_value = getattr(self, field)
-                if new_value != old_value:
-                    changed = True
-                    break
+            changed = self.tag_changed()
             if changed:
                 self.tag_updated_on = datetime.now()
+                # the page has to be read and parsed again with the new pattern
+                self.etag = self.last_modified = self.page_hash = ''
             if self.is_checked is True:
                 self.last_checked = datetime.now()
         self.last_triaged = datetime.now()
 
         super(SourceUrl, self).save()
+        self._loaded_tags = self.get_tags()
 
 
 class SourceUrlStatus(models.Model):
@@ -0,0 +1,59 @@
+"""
+Selector registry of the SourceUrls
+
+The area pattern of a SourceUrl is read from its tag_* fields, the archived
+pattern (websource.utils.tag_archive) is used when they are empty. Every
+pattern is compiled once per process, whatever the number of SourceUrls
+sharing it, see websource.extractor.compile_selector
+
+>>> extract_for_urls(SourceUrl.objects.filter(source=source), pages)
+{sourceurl id: text, ...}
+"""
+from websource.extractor import ContentExtractor, compile_rule, compile_selector, get_text
+from websource.utils.tag_archive import get_tag_dict
+
+# the SourceUrl fields the selectors are built from
+SELECTOR_FIELDS = ('id', 'tag_name', 'tag_attr', 'tag_attr_value')
+
+
+def get_selector(sourceurl):
+    """
+    returns the Selector of the SourceUrl, None if it has no area pattern
+    """
+    if sourceurl.tag_name:
+        return compile_rule(sourceurl.tag_name, sourceurl.tag_attr, sourceurl.tag_attr_value)
+    archived = get_tag_dict().get(str(sourceurl.id))
+    if archived:
+        return compile_selector(*archived)
+    return None
+
+
+def get_selectors(sourceurls):
+    """
+    returns the {SourceUrl id: Selector} dict of the SourceUrls that have an
+    area pattern, a queryset is read with a single query
+    """
+    if hasattr(sourceurls, 'only'):
+        sourceurls = sourceurls.only(*SELECTOR_FIELDS)
+    selectors = {}
+    for sourceurl in sourceurls:
+        selector = get_selector(sourceurl)
+        if selector is not None:
+            selectors[sourceurl.id] = selector
+    return selectors
+
+
+def extract_for_urls(sourceurls, pages):
+    """
+    returns the {SourceUrl id: text} dict of the pages, pages is a
+    {SourceUrl id: html} dict, the text is None when the pattern is not found
+    or when the SourceUrl has no pattern
+    """
+    selectors = get_selectors(sourceurls)
+    texts = {}
+    for id, data in pages.items():
+        if id in selectors:
+            texts[id] = get_text(ContentExtractor(data).select(selectors[id]))
+        else:
+            texts[id] = None
+    return texts
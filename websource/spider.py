@@ -1,8 +1,9 @@
-from bs4 import BeautifulSoup as bs
-import socket, mechanize, re, time, urllib2
-from HTMLParser import HTMLParseError
+import socket, mechanize, time, urllib2
+import hashlib
 import cookielib
+import requests
 from story.service import _read_url
+from websource.extractor import ContentExtractor, EXTRACTOR_PARSERS, get_text
 
 REQUEST_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/40.0.2214.45 Safari/537.36',
@@ -10,6 +11,31 @@ REQUEST_HEADERS = {
     'accept-language': 'en-US,en;q=0.8'
 }
 
+def page_hash(data, tag_name=None, tag_attr=None, tag_attr_value=None):
+    """
+    returns the sha1 of the page and of the area pattern used on it, the
+    content extracted from a page is the same as long as the hash is
+    """
+    if isinstance(data, unicode):
+        data = data.encode('utf-8')
+    rule = u'%s|%s|%s' % (tag_name or u'', tag_attr or u'', tag_attr_value or u'')
+    return hashlib.sha1(rule.encode('utf-8') + '\n' + data).hexdigest()
+
+
+class Page(object):
+    """
+    result of Spider.fetch_page, not_modified is set when the server
+    answered 304 to the conditional request, data is None then
+    """
+    def __init__(self, data, status, msg, etag='', last_modified='', not_modified=False):
+        self.data = data
+        self.status = status
+        self.msg = msg
+        self.etag = etag
+        self.last_modified = last_modified
+        self.not_modified = not_modified
+
+
 class Spider(object):
     """
     """
@@ -109,48 +135,47 @@ class Spider(object):
             msg = rootError
         return data, status, msg
 
-    def get_content_tag(self, data, tag_name=None, tag_attr=None,
-                        tag_attr_value=None, parser="html.parser"):
+    def fetch_page(self, url, etag=None, last_modified=None, session=None, **kwargs):
         """
-        Get the required content from area pattern stored in the system
+        Reads the url with a conditional GET, If-None-Match / If-Modified-Since
+        are sent when the validators of the previous read are given. Returns a
+        Page, with the validators of this read.
+        The keyword arguments are passed to requests, eg timeout or proxies
         """
+        headers = dict(REQUEST_HEADERS)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        kwargs.setdefault('timeout', 30)
         try:
-            soup = bs(data, parser)
-        except HTMLParseError:
-            data = tidy_data(data)
-            try:
-                soup = bs(data, parser)
-            except HTMLParseError:
-                soup = bs(data, "html5lib")
+            res = (session or requests).get(url, headers=headers, verify=False, **kwargs)
+        except requests.Timeout:
+            return Page("CNFD", 408, "TIMED OUT")
+        except requests.RequestException, e:
+            return Page("CNFD", 500, str(e))
+
+        if res.status_code == 304:
+            return Page(None, 200, 'OK', etag or '', last_modified or '', not_modified=True)
+        if res.status_code != 200:
+            return Page("CNFD", res.status_code, res.reason)
+        return Page(res.text, res.status_code, 'OK', res.headers.get('ETag', ''),
+                    res.headers.get('Last-Modified', ''))
 
-        content_tag = None
-        if tag_name:
-            if tag_attr == 'href':
-                content_tag = soup.find(
-                    tag_name, {tag_attr: re.compile(tag_attr_value)}
-                )
-                if not content_tag:
-                    soup = bs(data, "html5lib")
-                    content_tag = soup.find(
-                        tag_name, {tag_attr: re.compile(tag_attr_value)}
-                    )
-            elif tag_name in ['item', 'entry']:
-                content_tag = soup.find(tag_name).find(
-                    'title') if soup.find(tag_name) else None
-            elif tag_name in ['pubdate']:
-                content_tag = soup.find(tag_name)
-            else:
-                content_tag = soup.find(tag_name, {tag_attr:tag_attr_value})
-                if not content_tag:
-                    soup = bs(data, "html5lib")
-                    content_tag = soup.find(tag_name, {tag_attr:tag_attr_value})
-        return content_tag
+    def get_content_tag(self, data, tag_name=None, tag_attr=None,
+                        tag_attr_value=None, parser=None):
+        """
+        Get the required content from area pattern stored in the system,
+        see websource.extractor, use a ContentExtractor to look up several
+        patterns in the same page
+        """
+        parsers = EXTRACTOR_PARSERS
+        if parser:
+            parsers = (parser,) + tuple(p for p in EXTRACTOR_PARSERS if p != parser)
+        return ContentExtractor(data, parsers).find(tag_name, tag_attr, tag_attr_value)
 
     def get_text(self, content_tag):
         """
         Remove html elements and fetch only text
         """
-        if content_tag:
-            plain_text = content_tag.get_text()
-            plain_text = re.sub("\s+", " ", plain_text).strip()
-            return plain_text
\ No newline at end of file
+        return get_text(content_tag)
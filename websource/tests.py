@@ -1,6 +1,155 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from django.test import TestCase
+import time
+from datetime import datetime, timedelta
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from cutils.testing import StubServer
+from websource.crawler import Crawler, get_due_urls
+from websource.models import Source, SourceAccount, SourceUrl
+from websource.utils.snapshot_diff import changed_lines, diff_html, diff_snapshots
+
+
+class CrawlerTest(TestCase):
+    def setUp(self):
+        self.pages = {'/a': 'first page', '/b': 'second page', '/c': 'third page'}
+        self.times = []
+        self.server = StubServer(self.respond)
+        User.objects.create(id=8, username='crawler')
+        account = SourceAccount.objects.create(name='account')
+        self.source = Source.objects.create(account=account, name='source', frequency='DAILY')
+        for path in ['/a', '/b', '/c', '/missing', '/fresh']:
+            SourceUrl.objects.create(name=path, uid=path, source=self.source, url=self.server.url + path[1:],
+                                     tag_name='div', tag_attr='id', tag_attr_value='content')
+        self.make_due()
+        SourceUrl.objects.filter(uid='/fresh').update(last_triaged=datetime.now())
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def respond(self, method, path, body, headers):
+        self.times.append(time.time())
+        if path not in self.pages:
+            return 404, ''
+        return 200, '<html><body><p>menu</p><div id="content">%s</div></body></html>' % self.pages[path]
+
+    def make_due(self):
+        SourceUrl.objects.exclude(uid='/fresh').update(last_triaged=datetime.now() - timedelta(days=2))
+
+    def crawl(self, **kwargs):
+        kwargs.setdefault('host_delay', 0)
+        return Crawler(workers=3, timeout=5, **kwargs).run(get_due_urls())
+
+    def sourceurl(self, uid):
+        return SourceUrl.objects.get(uid=uid)
+
+    def test_crawl(self):
+        self.assertEqual(self.crawl(batch_size=2), {200: 3, 404: 1})
+        self.assertEqual(sorted(path for method, path, body in self.server.requests),
+                         ['/a', '/b', '/c', '/missing'])
+        self.assertEqual(get_due_urls().count(), 0)
+
+        a = self.sourceurl('/a')
+        self.assertEqual((a.response_code, a.response_msg), ('200', 'OK'))
+        self.assertIn('first page', a.new_snapshot)
+        self.assertNotIn('menu', a.new_snapshot)
+        self.assertEqual((a.is_updated, a.doc_counter, a.need_triage), (True, 1, False))
+        missing = self.sourceurl('/missing')
+        self.assertEqual((missing.response_code, missing.response_msg), ('404', 'PAGE NOT FOUND'))
+        self.assertEqual(missing.new_snapshot, '')
+
+    def test_changes(self):
+        self.crawl()
+        self.pages['/b'] = 'second page, changed'
+        self.make_due()
+        self.assertEqual(self.crawl(), {200: 3, 404: 1})
+
+        # the unchanged pages keep their snapshots
+        a = self.sourceurl('/a')
+        self.assertEqual((a.is_updated, a.doc_counter, a.old_snapshot), (False, 1, ''))
+        self.assertIn('first page', a.new_snapshot)
+        b = self.sourceurl('/b')
+        self.assertEqual((b.is_updated, b.doc_counter), (True, 2))
+        self.assertIn('second page', b.old_snapshot)
+        self.assertIn('changed', b.new_snapshot)
+
+    def test_archived_pattern(self):
+        from websource.utils.tag_archive import get_tag_dict
+
+        # the tag_* fields of the url are empty, its pattern is archived
+        self.assertEqual(get_tag_dict()['286'], ('p', {'style': 'color: #336600'}))
+        self.pages['/archived'] = 'menu</div><p style="color: #336600">archived text</p><div>'
+        SourceUrl.objects.create(id=286, name='archived', uid='/archived', source=self.source,
+                                 url=self.server.url + 'archived')
+        self.make_due()
+        self.crawl()
+        archived = self.sourceurl('/archived')
+        self.assertEqual((archived.new_snapshot, archived.need_triage), ('archived text', False))
+
+        # without pattern the url is left to triage
+        SourceUrl.objects.create(id=287, name='no pattern', uid='/none', source=self.source,
+                                 url=self.server.url + 'archived')
+        self.make_due()
+        self.crawl()
+        none = self.sourceurl('/none')
+        self.assertEqual((none.new_snapshot, none.need_triage), ('', True))
+
+    def test_host_delay(self):
+        self.crawl(host_delay=0.2)
+        gaps = [later - earlier for earlier, later in zip(self.times, self.times[1:])]
+        self.assertEqual(len(gaps), 3)
+        # the requests to the host are spaced whatever the number of workers,
+        # give or take the time they take to get to the server
+        self.assertTrue(min(gaps) > 0.1, gaps)
+        self.assertTrue(sum(gaps) > 0.55, gaps)
+
+
+class SelectorTest(TestCase):
+    def test_extract_for_urls(self):
+        from websource.selectors import extract_for_urls
+
+        User.objects.create(id=8, username='crawler')
+        source = Source.objects.create(account=SourceAccount.objects.create(name='account'), name='source')
+        SourceUrl.objects.create(id=1, name='tags', uid='1', source=source, url='http://example.com/1',
+                                 tag_name='div', tag_attr='id', tag_attr_value='content')
+        SourceUrl.objects.create(id=286, name='archived', uid='286', source=source, url='http://example.com/2')
+        SourceUrl.objects.create(id=287, name='none', uid='287', source=source, url='http://example.com/3')
+        page = '<div id="content">by the tags</div><p style="color: #336600">archived</p>'
+        self.assertEqual(extract_for_urls(SourceUrl.objects.all(), {1: page, 286: page, 287: page}),
+                         {1: 'by the tags', 286: 'archived', 287: None})
+
+
+class SnapshotDiffTest(SimpleTestCase):
+    def test_diff_html(self):
+        old = ' '.join('word%d' % i for i in range(200))
+        new = old.replace('word100', 'changed')
+        html = diff_html(diff_snapshots(old, new), context=20)
+        self.assertIn('<del style="background:#ffe6e6;">word100</del>', html)
+        self.assertIn('<ins style="background:#e6ffe6;">changed</ins>', html)
+        self.assertNotIn('word50 ', html)
+        self.assertEqual(html.count(' ... '), 2)
+
+    def test_unchanged(self):
+        text = ' '.join('word%d' % i for i in range(200))
+        html = diff_html(diff_snapshots(text, text), context=20)
+        self.assertIn('word0 ', html)
+        self.assertIn('word199', html)
+        self.assertNotIn(' ... ', html)
+
+    def test_changed_lines(self):
+        old = 'first line\nsecond line\nthird line\nfirst line\n'
+        new = 'first line\nthird line\nnew line\n'
+        self.assertEqual(changed_lines(old, new), (['new line'], ['second line', 'first line']))
+        # a single line snapshot is compared by sentences
+        self.assertEqual(changed_lines('One. Two! Three?', 'One. Four. Three?'), (['Four.'], ['Two!']))
+        self.assertEqual(changed_lines(None, 'One.'), (['One.'], []))
+
+    def test_snapshot_changed_lines(self):
+        sourceurl = SourceUrl(old_snapshot='kept\n<removed>\n', new_snapshot='kept\n' + ''.join(
+            'added %d\n' % i for i in range(4)))
+        self.assertEqual(sourceurl.snapshot_changed_lines(),
+                         '<ins>+ added 0</ins><br/><ins>+ added 1</ins><br/><ins>+ added 2</ins><br/>'
+                         '<del>- &lt;removed&gt;</del><br/>(1 more)')
@@ -0,0 +1,162 @@
+"""
+Diff of the SourceUrl snapshots
+
+diff_match_patch compares the snapshots character by character, which takes
+seconds on the long listing pages. Here the snapshots are cut into tokens,
+lines when the text has line breaks else words, every distinct token is
+mapped to a character and the encoded token sequences are diffed, as
+diff_match_patch does for lines. Only the replaced hunks are then compared
+character by character, while the time budget lasts, the remaining hunks are
+reported as a whole.
+
+The result is a diff_match_patch diff list, [(op, text), ...]
+>>> diffs = diff_snapshots(sourceurl.old_snapshot, sourceurl.new_snapshot)
+>>> diff_html(diffs)
+
+changed_lines() is the cheap summary, the lines (or sentences) added and
+removed, without any alignment
+"""
+import re
+import time
+from collections import Counter
+
+from django.conf import settings
+
+from websource.utils.diff_match_patch import diff_match_patch
+
+# seconds spent on the character diffs of a pair of snapshots
+DIFF_TIME_BUDGET = getattr(settings, 'WEBSOURCE_DIFF_TIME_BUDGET', 0.5)
+# replaced hunks longer than this are not compared character by character
+DIFF_REFINE_LIMIT = getattr(settings, 'WEBSOURCE_DIFF_REFINE_LIMIT', 2000)
+# the tokens are encoded as characters, stay below the surrogates
+MAX_TOKENS = 0xD800
+
+DIFF_DELETE = diff_match_patch.DIFF_DELETE
+DIFF_INSERT = diff_match_patch.DIFF_INSERT
+DIFF_EQUAL = diff_match_patch.DIFF_EQUAL
+
+WORD_RE = re.compile(r'\s*\S+\s*|\s+')
+SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def tokenize(text, by_lines):
+    """
+    returns the tokens of the text, joined back they give the text
+    """
+    if by_lines:
+        return text.splitlines(True)
+    return WORD_RE.findall(text)
+
+
+def encode_tokens(old_tokens, new_tokens):
+    """
+    maps every distinct token to a character, returns the two encoded
+    strings and the character -> token list, None when there are more
+    distinct tokens than characters
+    """
+    ids = {}
+    tokens = []
+    encoded = []
+    for token_list in (old_tokens, new_tokens):
+        chars = []
+        for token in token_list:
+            if token not in ids:
+                if len(tokens) >= MAX_TOKENS:
+                    return None
+                ids[token] = unichr(len(tokens))
+                tokens.append(token)
+            chars.append(ids[token])
+        encoded.append(u''.join(chars))
+    return encoded[0], encoded[1], tokens
+
+
+def diff_snapshots(old, new, time_budget=DIFF_TIME_BUDGET, refine_limit=DIFF_REFINE_LIMIT):
+    """
+    returns the diff_match_patch diff list of the snapshots
+    """
+    old = old or u''
+    new = new or u''
+    deadline = time.time() + time_budget
+    dmp = diff_match_patch()
+
+    by_lines = '\n' in old or '\n' in new
+    encoded = encode_tokens(tokenize(old, by_lines), tokenize(new, by_lines))
+    if encoded is None:
+        # too many distinct tokens, character diff within the budget
+        diffs = dmp.diff_main(old, new, False, deadline)
+        dmp.diff_cleanupSemantic(diffs)
+        return diffs
+
+    old_chars, new_chars, tokens = encoded
+    token_diffs = [(op, u''.join(tokens[ord(c)] for c in chars))
+                   for op, chars in dmp.diff_main(old_chars, new_chars, False, deadline)]
+
+    # the replaced hunks, a delete followed by an insert, are compared
+    # character by character while the budget lasts
+    diffs = []
+    i = 0
+    while i < len(token_diffs):
+        op, text = token_diffs[i]
+        if op == DIFF_DELETE and i + 1 < len(token_diffs) and token_diffs[i + 1][0] == DIFF_INSERT:
+            new_text = token_diffs[i + 1][1]
+            if len(text) + len(new_text) <= refine_limit and time.time() < deadline:
+                hunk = dmp.diff_main(text, new_text, False, deadline)
+                dmp.diff_cleanupSemantic(hunk)
+                diffs.extend(hunk)
+            else:
+                diffs.extend(token_diffs[i:i + 2])
+            i += 2
+            continue
+        diffs.append((op, text))
+        i += 1
+    return diffs
+
+
+def diff_html(diffs, context=200):
+    """
+    returns the diff as html, the unchanged text is cut down to `context`
+    characters around the changes, the text is shown whole when nothing
+    changed
+    """
+    if all(op == DIFF_EQUAL for op, text in diffs):
+        return diff_match_patch().diff_prettyHtml(diffs)
+    shown = []
+    last = len(diffs) - 1
+    for i, (op, text) in enumerate(diffs):
+        if op == DIFF_EQUAL and len(text) > context * 2:
+            head = text[:context] if i > 0 else u''
+            tail = text[-context:] if i < last else u''
+            text = u'%s ... %s' % (head, tail)
+        shown.append((op, text))
+    return diff_match_patch().diff_prettyHtml(shown)
+
+
+def segments(text):
+    if '\n' in text:
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    return [sentence for sentence in SENTENCE_RE.split(text.strip()) if sentence]
+
+
+def changed_lines(old, new):
+    """
+    returns the (added, removed) lists of the lines, or sentences for the
+    single line snapshots, found in only one of the snapshots
+    """
+    old_segments = segments(old or u'')
+    new_segments = segments(new or u'')
+    old_counts = Counter(old_segments)
+    new_counts = Counter(new_segments)
+
+    added = []
+    for segment in new_segments:
+        if old_counts[segment] > 0:
+            old_counts[segment] -= 1
+        else:
+            added.append(segment)
+    removed = []
+    for segment in old_segments:
+        if new_counts[segment] > 0:
+            new_counts[segment] -= 1
+        else:
+            removed.append(segment)
+    return added, removed
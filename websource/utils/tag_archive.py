@@ -1,1785 +1,28 @@
-TAG_DICT = {'19719': (u'div', {u'id': u'mainContent', u'class': u'mainContent'}), 
-                    '19718': (u'table', {u'cellpadding': u'5', u'border': u'1', u'cellspacing': u'0', u'class': u'tb_style1', u'width': u'100%'}), 
-                    '19713': (u'td', {u'colspan': u'2', u'align': u'left', u'class': u'content_text', u'valign': u'top'}), 
-                    '19712': (u'table', {u'cellpadding': u'2', u'border': u'1', u'cellspacing': u'0', u'width': u'95%'}), 
-                    '19711': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '19710': (u'td', {u'width': u'100%', u'class': u'content', u'height': u'100%'}), 
-                    '19717': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0'}), 
-                    '19715': (u'table', {u'class': u'dataTable', u'summary': u'Labour and Welfare Bureau - Press Releases and Publications'}), 
-                    '19714': (u'table', {u'cellpadding': u'5', u'width': u'95%', u'align': u'center', u'border': u'0'}), 
-                    '13736': (u'tr', {u'class': u'sectiontableentry1_pressreleases'}), 
-                    '13733': (u'div', {u'class': u'pr_right'}), 
-                    '21630': (u'td', {u'id': u'what_new'}), 
-                    '19398': (u'h1', {u'class': u'entry-title'}), 
-                    '19397': (u'div', {u'class': u'article-content'}), 
-                    '19396': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '344': (u'div', {u'id': u'body-col02-row02'}), 
-                    '7515': (u'span', {u'class': u'date'}), 
-                    '3995': (u'div', {u'class': u'views-field-created-1'}), 
-                    '19156': (u'span', {u'class': u'field-content'}), 
-                    '19402': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'style': u'font-size:11px;border:1px solid #666;margin-bottom:2px;', u'border': u'0', u'cellspacing': u'0'}), 
-                    '19401': (u'ul', {u'style': u'margin-bottom: 10px; margin-top: 10px;'}), 
-                    '19375': (u'span', {u'class': u'field-content'}), 
-                    '19374': (u'div', {u'class': u'centre_box_title1'}), 
-                    '19377': (u'h3', {u'class': u'entry-title'}), 
-                    '19376': (u'div', {u'class': u'entry'}), 
-                    '19370': (u'div', {u'id': u'content'}), 
-                    '14920': (u'div', {u'class': u'date'}), 
-                    '6150': (u'div', {u'class': u'content'}), 
-                    '6156': (u'span', {u'class': u'date'}), 
-                    '6159': (u'div', {u'class': u'releaseText'}), 
-                    '13606': (u'td', {u'valign': u'top', u'class': u's4-wpcell-plain', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '299': (u'b', {None: None}), 
-                    '294': (u'b', {None: None}), 
-                    '292': (u'b', {None: None}), 
-                    '293': (u'b', {None: None}), 
-                    '290': (u'span', {u'style':u'COLOR: #000000'}), 
-                    '291': (u'b', {None: None}), 
-                    '17651': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'10'}), 
-                    '270': (u'b', {None: None}), 
-                    '271': (u'b', {None: None}), 
-                    '273': (u'b', {None: None}), 
-                    '274': (u'b', {None: None}), 
-                    '276': (u'b', {None: None}), 
-                    '278': (u'b', {None: None}), 
-                    '279': (u'b', {None: None}), 
-                    '11769': (u'div', {u'id': u'ctl00_content_page', u'class': u'content_page'}), 
-                    '19572': (u'div', {u'class': u't068-content-inner'}), 
-                    '19571': (u'div', {u'class': u'content'}), 
-                    '16386': (u'td', {u'width': u'698', u'valign': u'top', u'bgcolor': u'#FFFFFF'}), 
-                    '19578': (u'table', {u'bordercolor': u'#01819A', u'border': u'0', u'width': u'100%', u'bordercolorlight': u'#01819A', u'cellpadding': u'2', u'cellspacing': u'0'}), 
-                    '20744': (u'span', {u'class': u'subtitle'}), 
-                    '17031': (u'div', {u'class': u'content'}), 
-                    '20746': (u'div', {u'id': u'DivContent', u'class': u'content'}), 
-                    '20747': (u'h2', {None:None}),
-                    '20748': (u'div', {u'class': u'sccgov_faq_container'}), 
-                    '2046': (u'span', {u'class': u'field-content'}), 
-                    '20804': (u'div', {u'id': u'mainContent'}), 
-                    '2043': (u'td', {u'class':u'opright'}),
-                    '2041': (u'div', {u'id': u'content'}), 
-                    '2049': (u'div', {u'class': u'dcCSScontentALTmain', u'id': u'dcCSSskipNavAnchor'}), 
-                    '5828': (u'a', {u'class': u'bodylinks', u'target': u'_new'}), 
-                    '6052': (u'div', {u'class': u'date'}), 
-                    '6374': (u'span', {u'id': u'dnn_ctr3053_ViewPressRelease_dlPressReleaseItem_ctl00_lblContent'}), 
-                    '4140': (u'span', {u'class': u'subtitle'}), 
-                    '8099': (u'div', {u'class': u'col_10 center-content content last'}), 
-                    '17727': (u'p', {u'class': u'date'}), 
-                    '17722': (u'div', {u'class': u'sys_subitem sys_first'}), 
-                    '21729': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '21728': (u'div', {u'id': u'content'}), 
-                    '21722': (u'div', {u'id': u'headlines'}), 
-                    '21725': (u'div', {u'id': u'content-2col'}), 
-                    '21724': (u'div', {u'style': u'border-bottom: 1px solid #002439; padding: 10px 5px;', u'id': u'latestNewsItem'}), 
-                    '21727': (u'div', {u'class': u'content'}), 
-                    '21726': (u'div', {u'width': u'100%', u'style': u'', u'allowdelete': u'false', u'webpartid': u'3e5647be-c416-4517-aed7-fbaf8678be77', u'haspers': u'false', u'id': u'WebPartctl00_ctl22_g_3e5647be_c416_4517_aed7_fbaf8678be77', u'allowexport': u'false', u'class': u'ms-WPBody'}), 
-                    '2688': (u'div', {u'id': u'content'}), 
-                    '2689': (u'div', {u'id': u'content'}), 
-                    '15719': (u'tr', {u'class': u'sectiontableentry1'}), 
-                    '15715': (u'div', {u'id': u'main-content'}), 
-                    '20411': (u'p', {u'class': u'date'}), 
-                    '3394': (u'b', {None: None}), 
-                    '21435': (u'div', {u'id': u'content', u'class': u'grid_8'}), 
-                    '21434': (u'div', {u'class': u'date'}), 
-                    '10090': (u'div', {u'class': u'bmw_link bma_page10636'}), 
-                    '5186': (u'td', {u'class': u'bodytext'}), 
-                    '21433': (u'p', {u'class': u'date'}), 
-                    '5188': (u'td', {u'class':u'sectionSubTitle'}),
-                    '3396': (u'span', {u'class': u'pr_text'}), 
-                    '21702': (u'div', {u'id': u'article', u'class': u'content'}), 
-                    '14245': (u'div', {u'noautoresize': u'false', u'class': u'perc-region  perc-fixed  perc-vertical    section ', u'id': u'content'}), 
-                    '17828': (u'div', {u'id': u'linkitem', u'class': u'item'}), 
-                    '20259': (u'td', {u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '7078': (u'div', {u'class': u'Billboard'}), 
-                    '20252': (u'div', {u'class': u'showcase'}), 
-                    '7076': (u'span', {u'class': u'date'}), 
-                    '3341': (u'div', {u'class': u'text'}), 
-                    '3346': (u'div', {u'id': u'content-content', u'class': u'content-content'}), 
-                    '7072': (u'p', {u'style': u'margin-top: 0;'}), 
-                    '1759': (u'ul', {u'class': u'elements'}), 
-                    '1757': (u'div', {u'class': u'middle-content-article'}), 
-                    '1751': (u'ul', {u'class': u'elements'}), 
-                    '6976': (u'div', {u'id': u'content'}), 
-                    '12497': (u'div', {u'class': u'body'}), 
-                    '1815': (u'div', {u'class': u'middle-content-article'}), 
-                    '4250': (u'table', {u'rules': u'all', u'cellspacing': u'0', u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '4252': (u'div', {u'class': u'item'}), 
-                    '4256': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'background': u'../BlueFadeHorizx566.jpg'}), 
-                    '8769': (u'div', {u'class': u'ccm-blog-post-preview press-releases'}), 
-                    '13970': (u'td', {u'class': u'title'}), 
-                    '4380': (u'table', {u'rules': u'all', u'cellspacing': u'0', u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '406': (u'b', {None: None}), 
-                    '404': (u'b', {None: None}), 
-                    '1374': (u'span', {u'class': u'field-content'}), 
-                    '401': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '3835': (u'div', {u'class': u'content'}), 
-                    '3837': (u'font', {u'color': u'#666666', u'face': u'verdana,arial,helvetica,geneva,sans-serif', u'size': u'1'}), 
-                    '3833': (u'td', {u'class': u'list-title'}), 
-                    '3838': (u'td', {u'class': u'textbold'}), 
-                    '3839': (u'p', {u'style': u'TEXT-ALIGN: justify; MARGIN: 0in 0in 0pt', u'class': u'MsoNormal'}), 
-                    '13723': (u'div', {u'id': u'subMainContent'}), 
-                    '5998': (u'div', {u'id': u'csg_content'}), 
-                    '19388': (u'td', {u'bordercolor': u'#FFFFcc', u'bgcolor': u'#FBF9FA', u'class': u'style46 style69 style60', u'height': u'35'}), 
-                    '19389': (u'a', {u'id': u'dnn_ctr2327_ArticleList_ctl00_lstArticles_ctl00_titleLink', u'class': u'Normal'}), 
-                    '11377': (u'table', {u'border': u'0', u'align': u'center', u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0', u'class': u'content'}), 
-                    '19383': (u'font', {u'class': u'TextDate'}), 
-                    '19386': (u'div', {u'id': u'level2'}), 
-                    '19387': (u'font', {u'face': u'Verdana, Arial, Helvetica, sans-serif', u'size': u'1'}), 
-                    '19419': (u'div', {u'id': u'content'}), 
-                    '19410': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'align': u'left', u'cellspacing': u'0'}), 
-                    '19147': (u'div', {u'id': u'content'}), 
-                    '19413': (u'h3', {None:None}), 
-                    '19416': (u'div', {u'style': u'border-bottom:1px black dotted; padding-top:8px;padding-bottom:8px;;font-family:Verdana;font-size:8pt;text-align:left;height:90px'}), 
-                    '19366': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'id': u'events_table'}), 
-                    '19365': (u'table', {u'cellpadding': u'0', u'border': u'0', u'cellspacing': u'0', u'class': u'siteTable', u'width': u'100%'}), 
-                    '19363': (u'div', {u'class': u'content'}), 
-                    '393': (u'b', {None: None}), 
-                    '392': (u'b', {None: None}), 
-                    '6141': (u'div', {u'id': u'main'}), 
-                    '397': (u'b', {None: None}), 
-                    '6144': (u'div', {u'class': u'sub_div_right_p'}), 
-                    '6148': (u'div', {u'id': u'currentNews'}), 
-                    '13619': (u'span', {u'id': u'ctl00_RightContentPlaceHolder_ctList_ContentList1'}), 
-                    '13611': (u'p', {u'class': u'newsDate'}), 
-                    '13612': (u'span', {u'class': u'date'}), 
-                    '19704': (u'div', {u'id': u'content'}), 
-                    '19706': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'width': u'100%'}), 
-                    '19700': (u'div', {u'id': u'content'}), 
-                    '19701': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'border': u'0', u'class': u'display_KeyTable', u'title': u"What's New"}), 
-                    '19702': (u'td', {u'width': u'150', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '19703': (u'td', {u'style': u'width: 23%', u'class': u'content'}), 
-                    '19709': (u'ul', {u'class': u'children'}), 
-                    '17620': (u'div', {u'id': u'content'}), 
-                    '17623': (u'div', {u'class':u'views-field-title'}), 
-                    '7710': (u'div', {u'class': u'clearFix', u'id': u'content_area'}), 
-                    '16487': (u'li', {u'id': u'news_article_200055', u'class': u'document-row'}), 
-                    '3745': (u'div', {u'class': u'media_item'}), 
-                    '3742': (u'p', {u'class': u'nomargin headline'}), 
-                    '5915': (u'span', {u'class': u'news_tabs'}), 
-                    '14436': (u'tr', {u'style': u'text-align:left', u'class': u'ms-rteTableOddRow-1'}), 
-                    '5914': (u'span', {u'class': u'pr_text'}), 
-                    '16240': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '11751': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'align': u'right', u'border': u'0', u'cellspacing': u'0'}), 
-                    '20886': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '20888': (u'div', {u'class': u'newsroomListTxt'}), 
-                    '17539': (u'ul', {u'class': u'sfdownloadList sfListMode'}), 
-                    '17289': (u'ul', {u'type': u'square'}), 
-                    '2050': (u'font', {u'color': u'black', u'size': u'1', u'face': u'georgia'}), 
-                    '2052': (u'td', {u'width': u'600', u'valign': u'top'}), 
-                    '2054': (u'td', {u'width': u'85', u'align': u'left', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '4829': (u'div', {u'class': u'article-content'}), 
-                    '3690': (u'table', {u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '4827': (u'div', {u'id': u'Content'}), 
-                    '3692': (u'font', {u'color': u'#9C6100', u'face': u'Arial', u'size': u'2'}), 
-                    '3693': (u'div', {u'id': u'content'}), 
-                    '3695': (u'div', {u'id': u'middle_column'}), 
-                    '11623': (u'span', {u'class': u'date'}), 
-                    '21932': (u'div', {u'class': u'newsEvent'}), 
-                    '21936': (u'div', {u'id': u'mainContent'}), 
-                    '6363': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0', u'border': u'0'}), 
-                    '6361': (u'div', {u'id': u'content'}), 
-                    '6366': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '6364': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0', u'border': u'0'}), 
-                    '20089': (u'span', {u'class': u'date'}), 
-                    '20088': (u'tr', {u'class': u'sectiontableentry1'}), 
-                    '10409': (u'div', {u'class': u'copy', u'id': u'main'}), 
-                    '10396': (u'dl', {u'class': u'AC-NewsArchive'}), 
-                    '20644': (u'h1', {u'class': u'entry-title'}), 
-                    '4655': (u'div', {u'class': u'content'}), 
-                    '21739': (u'div', {u'style': u'max-width:300px; margin-top:-105px; padding-top:3px', u'id': u'news'}), 
-                    '14899': (u'div', {u'id': u'contentPrimaryTop'}), 
-                    '21733': (u'h1', {u'class': u'entry-title'}), 
-                    '21731': (u'p', {u'class': u'MsoNormal'}), 
-                    '21737': (u'div', {u'id': u'center'}), 
-                    '21734': (u'div', {u'class': u'item intro'}), 
-                    '6212': (u'div', {u'id': u'contentstart'}), 
-                    '2698': (u'div', {u'id': u'content'}), 
-                    '16709': (u'ul', {u'class': u'pressList'}), 
-                    '2692': (u'div', {u'id': u'content'}), 
-                    '2691': (u'td', {u'colspan': u'2', u'class': u'body-in', u'valign': u'top'}), 
-                    '15870': (u'div', {u'id': u'LiveTabsContent33225', u'class': u'Normal'}), 
-                    '20468': (u'div', {u'class': u'et_pt_blogentry clearfix'}), 
-                    '20399': (u'span', {u'class': u'field-content'}), 
-                    '3232': (u'table', {u'class': u'newsTable'}), 
-                    '21425': (u'div', {u'id': u'main'}), 
-                    '3236': (u'td', {u'id': u'MSOZoneCell_WebPartWPQ1', u'valign': u'top'}), 
-                    '7321': (u'div', {u'id': u'main'}), 
-                    '3234': (u'div', {u'id': u'news'}), 
-                    '7323': (u'div', {u'id': u'mainContent', u'class': u'withSidebar'}), 
-                    '3357': (u'div', {u'style': u'', u'allowdelete': u'false', u'haspers': u'false', u'id': u'WebPartWPQ2', u'width': u'100%', u'class': u'ms-WPBody', u'webpartid': u'cf84dba9-a831-4139-be1e-ee61b56f0432'}), 
-                    '17830': (u'div', {u'class': u'contentInner'}), 
-                    '3358': (u'div', {u'style': u'height:550px;overflow:auto;', u'allowdelete': u'false', u'haspers': u'false', u'id': u'WebPartWPQ2', u'width': u'100%', u'class': u'ms-WPBody', u'webpartid': u'8cb548ad-cbf5-4451-9b97-091937b21539'}), 
-                    '20064': (u'div', {u'class': u'news-list-item'}), 
-                    '20066': (u'div', {u'class': u'field field-title'}), 
-                    '20063': (u'div', {u'class': u'contentNews contentNewsWide'}), 
-                    '7068': (u'div', {u'class': u'news-item'}), 
-                    '7067': (u'span', {u'class': u'date'}), 
-                    '7066': (u'span', {u'class': u'date'}), 
-                    '7063': (u'span', {u'class': u'date'}), 
-                    '7062': (u'div', {u'class': u'Blurb'}), 
-                    '1766': (u'div', {u'class': u'middle-content-article'}), 
-                    '8156': (u'div', {u'id': u'news'}), 
-                    '8155': (u'div', {u'id': u'mainContent'}), 
-                    '18158': (u'div', {u'id': u'divTableEvents'}), 
-                    '18155': (u'strong', {None: None}), 
-                    '1541': (u'div', {u'id': u'content'}), 
-                    '14470': (u'div', {u'class': u'posts'}), 
-                    '13843': (u'div', {u'class': u'newsItemWrpr'}), 
-                    '9984': (u'div', {u'id': u'content'}), 
-                    '9985': (u'div', {u'style': u'width:367px;float:right;', u'class': u'news-landing-main-view-col-right'}), 
-                    '5619': (u'div', {u'class': u'box_bodyRight'}), 
-                    '6569': (u'div', {u'id': u'content'}), 
-                    '5611': (u'div', {u'role': u'main', u'id': u'content'}), 
-                    '5616': (u'div', {u'style': u'', u'id': u'civicAlerts237'}), 
-                    '414': (u'b', {None: None}), 
-                    '415': (u'b', {None: None}), 
-                    '417': (u'b', {None: None}), 
-                    '410': (u'a', {u'id':True}),
-                    '411': (u'b', {None: None}), 
-                    '412': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '413': (u'b', {None: None}), 
-                    '3324': (u'p', {u'style': u'margin: 0in 0in 0pt; tab-stops: -1.0in -.5in .2in 4.0in', u'class': u'MsoNormal'}), 
-                    '418': (u'b', {None: None}), 
-                    '419': (u'div', {u'class':u'textWrappedAroundImage clearfix'}), 
-                    '3327': (u'div', {u'class': u'middle_content'}), 
-                    '2768': (u'div', {u'class': u'date'}), 
-                    '4282': (u'h3', {u'class': u'post-title entry-title'}), 
-                    '4287': (u'div', {u'id': u'main', u'class': u'content-main'}), 
-                    '11368': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '11365': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '7534': (u'ul', {u'class': u'sf_newsList'}), 
-                    '22021': (u'div', {u'class': u'content'}), 
-                    '19605': (u'div', {u'id': u'content'}), 
-                    '19359': (u'div', {u'class': u'text'}), 
-                    '19606': (u'div', {u'id': u'mainContent'}), 
-                    '16120': (u'div', {u'id': u'content'}), 
-                    '19603': (u'div', {u'style': u'display:none', u'id': u'LatestArticles'}), 
-                    '19602': (u'div', {u'class': u'c_content'}), 
-                    '384': (u'b', {None: None}), 
-                    '385': (u'b', {None: None}), 
-                    '386': (u'b', {None: None}), 
-                    '387': (u'b', {None: None}), 
-                    '388': (u'a', {u'id':True}), 
-                    '6172': (u'div', {u'id': u'content'}), 
-                    '6778': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '6774': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'align': u'left', u'border': u'0', u'cellspacing': u'0'}), 
-                    '6775': (u'table', {u'border':u'0', u'cellspacing':u'0', u'cellpadding':'2'}), 
-                    '13667': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'id': u'dnn_ctr33899_NCSLTabs_tblSplitter'}), 
-                    '5872': (u'table', {u'style': u'text-align: left; width:503px;'}), 
-                    '5873': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'border': u'0', u'class': u'menu_control ctl00_Menu2_4 ctl00_Menu2_9', u'width': u'100%'}), 
-                    '16013': (u'span', {u'class': u'field-content'}), 
-                    '21129': (u'div', {u'id': u'media_content'}), 
-                    '21127': (u'div', {u'role': u'main', u'id': u'content'}), 
-                    '21125': (u'div', {u'class': u'node node-news node-teaser clearfix', u'about': u'/topic/detail/global-editorial-cartoon-competition-winners-announced', u'typeof': u'sioc:Item foaf:Document', u'id': u'node-1349'}), 
-                    '21124': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '21120': (u'div', {u'class': u'articleHeadline'}), 
-                    '16239': (u'font', {u'size': u'3', u'face': u'Arial, Helvetica, sans-serif'}), 
-                    '16728': (u'div', {u'class': u'date'}), 
-                    '17617': (u'td', {u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '16727': (u'div', {u'style': u'margin-top: 10px;', u'id': u'response', u'class': u'app'}), 
-                    '16237': (u'table', {u'cellpadding': u'4', u'width': u'97%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '11742': (u'p', {u'class': u'news'}), 
-                    '11743': (u'div', {u'id': u'main'}), 
-                    '19595': (u'div', {u'class':u'views-field-title'}), 
-                    '19591': (u'div', {u'style': u'margin: 0px;', u'id': u'mainContent'}), 
-                    '19590': (u'div', {u'class': u'divIndented'}), 
-                    '20891': (u'div', {u'class': u'date'}), 
-                    '21389': (u'td', {u'width': u'85', u'align': u'left', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '20895': (u'div', {u'class': u'news2'}), 
-                    '16503': (u'p', {u'class': u'newsitem'}), 
-                    '21386': (u'ul', {u'id': u'newsArticles'}), 
-                    '21384': (u'li', {u'class':u'newsItem'}),
-                    '19825': (u'span', {u'class': u'date'}), 
-                    '19827': (u'div', {u'class': u'catItemHeader'}), 
-                    '21638': (u'div', {u'id': u'main'}), 
-                    '19820': (u'div', {u'id': u'webRssFeed'}), 
-                    '19823': (u'div', {u'id': u'content', u'class': u'content '}), 
-                    '16342': (u'li', {u'class': u'txt'}), 
-                    '17294': (u'table', {u'border': u'0', u'summary': u"This table displays the Organisation's logo, top utility navigation and banner image", u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0', u'class': u'headertable'}), 
-                    '21631': (u'div', {u'id': u'content'}), 
-                    '19732': (u'div', {u'id': u'main-content'}), 
-                    '21637': (u'table', {u'cellpadding': u'3', u'width': u'94%', u'align': u'center', u'border': u'1', u'cellspacing': u'0'}), 
-                    '17520': (u'tr', {u'bgcolor':u'f3f3f3'}), 
-                    '21634': (u'div', {u'id': u'content', u'class': u'clearfix hfeed'}), 
-                    '12106': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'width': u'100%'}), 
-                    '3689': (u'td', {u'valign': u'top', u'class': u's4-wpcell-plain', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '3688': (u'span', {u'id': u'MainContentPlaceHolder_C004_rptPressReleases_lblTitle_0'}), 
-                    '4832': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'bgcolor': u'#5868c8'}), 
-                    '6191': (u'div', {u'id': u'content'}), 
-                    '6193': (u'div', {u'class': u'body'}), 
-                    '6198': (u'td', {u'class': u'content'}), 
-                    '11632': (u'div', {u'id': u'maincontent'}), 
-                    '9344': (u'h3', {u'class': u'title hover-container'}), 
-                    '20093': (u'span', {u'class': u'date'}), 
-                    '20097': (u'b', {None: None}), 
-                    '21705': (u'a', {u'class': u'Normal', u'target': u'_blank', u'id': u'dnn_ctr6990_ArticleList_ctl00_rptArticles_ctl00_titleLink'}), 
-                    '21703': (u'font', {u'size': u'2', u'face': u'Arial'}), 
-                    '10368': (u'div', {u'id': u'content'}), 
-                    '20659': (u'div', {u'class': u'news-item'}), 
-                    '20655': (u'td', {u'align': u'right', u'nowrap': u'nowrap', u'class': u'date', u'valign': u'top'}), 
-                    '21709': (u'div', {u'id': u'main'}), 
-                    '10362': (u'div', {u'id': u'content'}), 
-                    '16903': ('p', {'class':'style82'}),
-                    '16902': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '1817': (u'div', {u'class': u'middle-content-article'}), 
-                    '1810': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '1812': (u'div', {u'class': u'middle-content-article'}), 
-                    '16904': (u'tr', {u'class':u'ms-itmhover'}), 
-                    '7201': (u'li', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '14883': (u'div', {u'id': u'content'}), 
-                    '1818': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '6221': (u'div', {u'id': u'ctl00_ctl00_cphAASAContent_cphMainContent_cbMainContent'}), 
-                    '14644': (u'div', {u'class': u'news-list-item'}), 
-                    '15841': (u'div', {u'class':u'item link-item'}), 
-                    '20472': (u'ul', {u'class': u'newsroom'}), 
-                    '7333': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '18947': (u'div', {u'id': u'main', u'class': u'wide'}), 
-                    '18948': (u'div', {u'class': u'news_title'}), 
-                    '21418': (u'div', {u'class': u'date'}), 
-                    '3220': (u'span', {u'class': u'date'}), 
-                    '2849': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '2846': (u'div', {u'id': u'awt-content-area'}), 
-                    '18096': (u'div', {u'id': u'tab1'}), 
-                    '20274': (u'div', {u'id': u'content'}), 
-                    '3326': (u'span', {u'style': u'font-size: medium'}), 
-                    '10212': (u'div', {u'class': u'text'}), 
-                    '3328': (u'font', {u'size': u'1', u'face': u'Arial'}), 
-                    '20279': (u'div', {u'class': u'newsdate'}), 
-                    '10219': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'border': u'0', u'summary': u'layout'}), 
-                    '7058': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '7059': (u'span', {u'class': u'date'}), 
-                    '10183': (u'div', {u'id': u'news'}), 
-                    '7052': (u'span', {u'class': u'date'}), 
-                    '7056': (u'span', {u'class': u'date'}), 
-                    '7057': (u'span', {u'class': u'date'}), 
-                    '7054': (u'span', {u'class': u'date'}), 
-                    '19422': (u'div', {u'id': u'content'}), 
-                    '8148': (u'ul', {u'class': u'news-releases-list nobullet'}), 
-                    '15938': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0'}), 
-                    '18168': (u'table', {u'width': u'100%', u'border': u'0', u'align': u'center', u'bgcolor': u'#666666', u'cellpadding': u'3', u'cellspacing': u'1'}), 
-                    '3979': (u'li', {u'style': u'padding-bottom:5px;padding-top:5px'}), 
-                    '20957': (u'ul', {u'id': u'spotstory'}), 
-                    '537': (u'b', {None: None}), 
-                    '535': (u'b', {None: None}), 
-                    '533': (u'b', {None: None}), 
-                    '19257': (u'div', {u'class': u'content'}), 
-                    '9999': (u'h3', {u'class': u'post-title entry-title'}), 
-                    '9998': (u'div', {u'id': u'content'}), 
-                    '9997': (u'div', {u'id': u'main'}), 
-                    '14515': (u'ul', {u'class': u'presslist'}), 
-                    '3291': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '21017': (u'p', {u'style': u'font-family: Verdana; font-size: 11px; background-color: rgb(249, 251, 222); margin-bottom: 0.0001pt; ', u'class': u'MsoNormal'}), 
-                    '421': (u'b', {None: None}), 
-                    '423': (u'b', {None: None}), 
-                    '424': (u'b', {None: None}), 
-                    '3814': (u'table', {u'width': u'50%', u'cellspacing': u'0', u'id': u'June'}), 
-                    '8455': (u'div', {u'class': u'item intro'}), 
-                    '11359': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '4299': (u'div', {u'class': u'content'}), 
-                    '19618': (u'div', {u'style': u'clear: both;'}), 
-                    '16134': (u'ul', {u'class': u'list'}), 
-                    '19347': (u'td', {u'class': u'childContent'}), 
-                    '19342': (u'div', {u'class': u'stories'}), 
-                    '19343': (u'div', {u'class': u'entry-content'}), 
-                    '6161': (u'div', {u'id': u'content'}), 
-                    '6166': (u'div', {u'id': u'content'}), 
-                    '19295': (u'div', {u'class': u'cont'}), 
-                    '13675': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '19762': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'class': u'footer'}), 
-                    '19763': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'class': u'homeSpecialIssue'}), 
-                    '19760': (u'div', {u'class': u'iCol w710 mR20'}), 
-                    '19769': (u'li', {u'class': u'latestnews'}), 
-                    '5861': (u'div', {u'id': u'content'}), 
-                    '17358': (u'div', {u'class': u'sys_subitem sys_first'}), 
-                    '17609': (u'div', {u'class': u'span-13 append-bottom'}), 
-                    '17355': (u'ul', {u'class': u'news-listing-item'}), 
-                    '17605': (u'div', {u'id': u'interior_main_container'}), 
-                    '17603': (u'article', {u'class': u'archivelist listscrolling'}), 
-                    '17350': (u'div', {u'id': u'contentstart'}), 
-                    '17601': (u'table', {u'cellspacing':u'1', u'cellpadding':u'1', u'border':u'0'}), 
-                    '17352': (u'div', {u'id': u'news'}), 
-                    '2214': (u'div', {u'role': u'main', u'id': u'main'}), 
-                    '11417': (u'div', {u'class': u'content'}), 
-                    '14002': (u'div', {u'id': u'main_content'}), 
-                    '6691': (u'table', {u'class': u'monthlyIndex'}), 
-                    '19580': (u'div', {u'id': u'main'}), 
-                    '19581': (u'table', {u'bordercolor': u'#66B246', u'rules': u'all', u'cellspacing': u'2', u'bgcolor': u'#66B246', u'cellpadding': u'3', u'border': u'1', u'id': u'ctl00_ContentPlaceHolder1_GridView2'}), 
-                    '21626': (u'div', {u'class': u'text'}), 
-                    '21627': (u'span', {u'class': u'field-content'}), 
-                    '20868': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '21628': (u'div', {u'class': u'container_16', u'id': u'body-container'}), 
-                    '21629': (u'a', {u'class': u'normal', u'target': u'_'}), 
-                    '19834': (u'span', {u'class': u'newsdate'}), 
-                    '19835': (u'span', {u'class': u'newsdate'}), 
-                    '19833': (u'table', {u'cellpadding': u'0', u'border': u'0', u'cellspacing': u'0', u'class': u'tbl-si', u'summary': u'Press Releases'}), 
-                    '16350': (u'table', {u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '19838': (u'div', {u'id': u'main'}), 
-                    '19839': (u'div', {u'class': u'listrow tiedote'}), 
-                    '6343': (u'div', {u'id': u'centercol'}), 
-                    '13468': (u'td', {u'colspan': u'2', u'style': u'text-align:left', u'valign': u'top'}), 
-                    '4516': (u'div', {u'role': u'main', u'class': u'col col12 introduction'}), 
-                    '6182': (u'div', {u'role': u'main', u'id': u'content'}), 
-                    '17191': (u'span', {u'class': u'newsdate'}), 
-                    '9352': (u'div', {u'style': u'margin-left: 15px;', u'id': u'home_news_item'}), 
-                    '9350': (u'div', {u'class': u'content'}), 
-                    '5280': (u'a', {u'id': u'headerLink', u'name': u'headerLink'}), 
-                    '16113': (u'div', {u'class': u'TabbedPanelsContent'}), 
-                    '21710': (u'li', {u'class': u'alter_row'}), 
-                    '7237': (u'article', {u'class': u'publication_spotlight'}), 
-                    '17171': (u'div', {u'class': u'posts'}), 
-                    '21715': (u'div', {u'class': u'texts news'}), 
-                    '21716': (u'div', {u'class': u'epoTeaser'}), 
-                    '21717': (u'div', {u'class': u'item intro'}), 
-                    '20661': (u'table', {u'cellpadding': u'0', u'align': u'center', u'cellspacing': u'0', u'class': u'body'}), 
-                    '20660': (u'div', {u'class': u'standartBlock stBlockBlue'}), 
-                    '10372': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '3781': (u'div', {u'id': u'content', u'class': u'two_column'}), 
-                    '16918': (u'span', {u'id': u'ctl00_PlaceHolderMain_LabelMessage'}), 
-                    '16919': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_ctl00_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_ctl00__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '3789': (u'ul', {u'type': u'square'}), 
-                    '16119': (u'table', {u'cellpadding': u'0', u'width': u'525', u'border': u'0', u'cellspacing': u'2'}), 
-                    '21395': (u'ol', {u'class': u'illustrated results'}), 
-                    '21391': (u'li', {u'style': u'padding-bottom:5px;padding-top:5px'}), 
-                    '6230': (u'div', {u'class': u'content'}), 
-                    '20915': (u'div', {u'style': u'font-size: 11px;', u'id': u'middle_content_three'}), 
-                    '20912': (u'div', {u'id': u'content'}), 
-                    '21640': (u'div', {u'id': u'main'}), 
-                    '1949': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '1946': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '3332': (u'div', {u'class': u'posts'}), 
-                    '21436': (u'span', {u'class': u'field-content'}), 
-                    '10202': (u'div', {u'class': u'content'}), 
-                    '3338': (u'div', {u'class':'newsItem'}), 
-                    '20281': (u'div', {u'class': u'arrow-block arrow-block-first'}), 
-                    '20280': (u'div', {u'class': u'blog'}), 
-                    '10209': (u'div', {u'class': u'result'}), 
-                    '10197': (u'h2', {u'class': u'archiveTitle'}), 
-                    '1705': (u'div', {u'class': u'middle-content-article'}), 
-                    '20045': (u'div', {u'class': u'content'}), 
-                    '10199': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'class': u'listNavBar', u'width': u'100%'}), 
-                    '18398': (u'div', {u'class': u'news_item'}), 
-                    '15850': (u'tr', {u'class': u'ms-itmhover'}), 
-                    '15851': (u'div', {u'id': u'content'}), 
-                    '19818': (u'div', {u'id': u'main', u'class': u'main-subpages'}), 
-                    '18172': (u'div', {u'id': u'middle_column'}), 
-                    '18178': (u'div', {u'class': u'content'}), 
-                    '13360': (u'span', {u'class': u'field-content'}), 
-                    '11132': (u'div', {u'class': u'icontent'}), 
-                    '19815': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'border': u'0', u'class': u'archiveList'}), 
-                    '15106': (u'div', {u'id': u'content'}), 
-                    '19810': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'border': u'0', u'class': u'archiveList'}), 
-                    '3023': (u'table', {u'rules': u'all', u'cellspacing': u'1', u'align': u'Center', u'width': u'92%', u'border': u'1', u'id': u'ctl00_ContentPlaceHolder1_GV'}), 
-                    '3022': (u'div', {u'id': u'content'}), 
-                    '3021': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_PageContent_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_PageContent__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '526': (u'b', {None: None}), 
-                    '520': (u'b', {None: None}), 
-                    '521': (u'div', {u'class':u'textWrappedAroundImage clearfix'}), 
-                    '523': (u'b', {None: None}), 
-                    '528': (u'b', {None: None}), 
-                    '4198': (u'td', {u'colspan': u'2', u'style': u'WIDTH: 100%; BACKGROUND: url(/cs/groups/public/documents/digitalmedia/000056.png) #875600 repeat-x; HEIGHT: 41px; -moz-border-radius-topright: 10px; border-top-right-radius: 10px; -moz-border-radius-topleft: 10px; border-top-left-radius: 10px', u'align': u'middle', u'valign': u'top'}), 
-                    '4199': (u'div', {u'id': u'center'}), 
-                    '4193': (u'h1', {u'class': u'post-title'}), 
-                    '4190': (u'div', {u'style': u'margin-top: 20px; margin-bottom: 20px;'}), 
-                    '305': (u'b', {None: None}), 
-                    '4358': (u'div', {u'id': u'body-text'}), 
-                    '4359': (u'table', {u'cellspacing': u'0', u'class': u'stdtable'}), 
-                    '4357': (u'div', {u'class': u'content'}), 
-                    '11007': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'width': u'100%', u'bgcolor': u'#FFFFFF'}), 
-                    '11006': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'id': u'table77', u'width': u'100%'}), 
-                    '6503': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_htmlContent_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_htmlContent__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '16346': (u'p', {u'style': u'margin-top: 0; margin-bottom: 0; word-spacing:-1px text-align:justify', u'class': u'MsoNormal'}), 
-                    '11008': (u'div', {u'id': u'mainContent'}), 
-                    '6431': (u'table', {u'class': u'maincontent'}), 
-                    '19339': (u'div', {u'id': u'content', u'class': u'left'}), 
-                    '19338': (u'div', {u'id': u'main', u'class': u'grid-block'}), 
-                    '19333': (u'div', {u'id': u'content'}), 
-                    '19332': (u'div', {u'class': u'news_article_container_two_column'}), 
-                    '19334': (u'div', {u'class':u'articleLister'}), 
-                    '19337': (u'div', {u'id': u'content'}), 
-                    '13645': (u'div', {u'id': u'content'}), 
-                    '4779': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '4175': (u'div', {u'id': u'mainBody'}), 
-                    '4176': (u'div', {u'id': u'main'}), 
-                    '4179': (u'div', {u'class': u'content'}), 
-                    '16039': (u'div', {u'id': u'ctl00_ContentPlaceHolder1_prPanel'}), 
-                    '19758': (u'div', {u'class': u'teaser-with-thumbnail-image'}), 
-                    '19756': (u'div', {u'class': u'threecol', u'id': u'content'}), 
-                    '16034': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0', u'border': u'0'}), 
-                    '19021': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '19245': (u'div', {u'class': u'content'}), 
-                    '17619': (u'h1', {u'class': u'entry-title'}), 
-                    '16743': (u'h3', {u'class': u'news-release-title'}), 
-                    '16747': (u'div', {u'id': u'middle_column'}), 
-                    '17349': (u'li', {u'class': u'row-2 hentry clearfix'}), 
-                    '17610': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '17344': (u'span', {u'class': u'field-content'}), 
-                    '17613': (u'div', {u'class': u'frontpage-list'}), 
-                    '17614': (u'div', {u'id': u'copyText'}), 
-                    '17615': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first clearfix'}), 
-                    '17340': (u'a', {u'rel':u'nofollow'}), 
-                    '16218': (u'div', {u'id': u'content'}), 
-                    '5924': (u'ul', {u'class': u'sfdownloadList sfListMode'}), 
-                    '5929': (u'td', {u'width': u'80%', u'height': u'280', u'bgcolor': u'#FFFFFF', u'valign': u'top'}), 
-                    '21651': (u'div', {u'class': u'catItemHeader'}), 
-                    '21653': (u'div', {u'id': u'content-content', u'class': u'content-content'}), 
-                    '21652': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '21655': (u'div', {u'class': u'printcontainer-noimg', u'id': u'printcontainer'}), 
-                    '21656': (u'span', {u'class': u'field-content'}), 
-                    '20876': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '20701': (u'div', {u'id': u'column3'}), 
-                    '20874': (u'p', {u'style': u'MARGIN: 0in 0in 0pt', u'class': u'MsoNormal'}), 
-                    '20875': (u'table', {u'width': u'100%', u'cellpadding': u'1', u'cellspacing': u'0', u'border': u'0', u'class': u'ms-listviewtable', u'dir': u'none', u'summary': u'Press Releases '}), 
-                    '20872': (u'div', {u'class': u'view-content result-list'}), 
-                    '20873': (u'div', {u'style': u'padding-left: 2px; padding-right: 2px; ', u'class': u'listItemOneBg'}), 
-                    '20870': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '19803': (u'td', {u'class': u'listItem'}), 
-                    '19807': (u'p', {u'style': u'margin: 0cm 0cm 0pt;', u'class': u'MsoNormal'}), 
-                    '19809': (u'div', {u'class': u'ArticleContent'}), 
-                    '19808': (u'div', {u'class': u'ArticleContent'}), 
-                    '11653': (u'td', {u'width': u'725', u'class': u'content', u'valign': u'top'}), 
-                    '17185': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'class': u'listNavBar', u'width': u'100%'}), 
-                    '17186': (u'li', {None:None}), 
-                    '2713': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'3'}), 
-                    '1195': (u'div', {u'id': u'mainContent'}), 
-                    '20167': (u'div', {u'style': u'display: inline;', u'id': u'templatelist-380883133'}), 
-                    '16962': (u'div', {u'id': u'container-center2-inner'}), 
-                    '16964': (u'div', {u'class': u'content'}), 
-                    '16967': (u'tr', {u'style': u'color:Black;background-color:#EEEEEE;height:24px;width:150px;', u'valign': u'middle'}), 
-                    '19346': (u'div', {u'class': u'text'}), 
-                    '10521': (u'td', {u'colspan': u'2', u'class': u'ContentPageTitle', u'valign': u'top'}), 
-                    '1951': (u'div', {u'class': u'middle-content-article'}), 
-                    '3249': (u'div', {u'id': u'awt-content-area'}), 
-                    '3240': (u'div', {u'id': u'mainContent', u'class': u'clearfix'}), 
-                    '18962': (u'div', {u'class': u'news-item'}), 
-                    '7312': (u'div', {u'class': u'sec_main_content'}), 
-                    '18410': (u'div', {u'class': u'view-field view-data-title'}), 
-                    '13948': (u'p', {None: None}), 
-                    '15623': (u'ul', {u'class': u'link-list press-releases'}), 
-                    '18988': (u'font', {u'size': u'1'}), 
-                    '10231': (u'div', {u'id': u'content'}), 
-                    '3308': (u'div', {u'id': u'dnn_ctr11992_ModuleContent', u'class': u'DNNModuleContent ModAdvancedArticlesC'}), 
-                    '20299': (u'span', {u'class': u'date'}), 
-                    '20297': (u'article', {u'class': u'article-min v-list plain has-document'}), 
-                    '20294': (u'div', {u'class': u'channel'}), 
-                    '3305': (u'div', {u'id': u'content'}), 
-                    '5492': (u'div', {u'id': u'main-content'}), 
-                    '1712': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '5250': (u'div', {u'class': u'content'}), 
-                    '15821': (u'table', {u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '15820': (u'div', {u'id': u'news_releases_for_year_2013'}), 
-                    '4061': (u'div', {u'id': u'content'}), 
-                    '4067': (u'tr', {u'class': u'newsItem1'}), 
-                    '511': (u'strong', {None:None}), 
-                    '514': (u'b', {None: None}), 
-                    '517': (u'b', {None: None}), 
-                    '4183': (u'div', {u'class': u'content'}), 
-                    '4182': (u'table', {u'class': u'newsTable'}), 
-                    '6536': (u'div', {u'class': u'cms_editor_content'}), 
-                    '4343': (u'span', {u'class': u'date'}), 
-                    '4341': (u'h1', {u'class': u'post-title'}), 
-                    '8610': (u'font', {u'size': u'1', u'face': u'Arial, Verdana, Sans-Serif'}), 
-                    '17880': (u'span', {u'class': u'news_tabs'}), 
-                    '3879': (u'div', {u'id': u'main', u'class': u'container_14'}), 
-                    '3877': (u'span', {u'class': u'style34'}), 
-                    '19328': (u'ul', {u'class': u'nobull item_block_container'}), 
-                    '19320': (u'div', {u'class': u'text'}), 
-                    '19321': (u'a', {u'class': u'greenlink'}), 
-                    '19326': (u'div', {u'id': u'content', u'class': u'scGridDesignerArea'}), 
-                    '19327': (u'div', {u'class': u'post-item post-item-publication'}), 
-                    '19324': (u'ul', {u'class': u'structured-list'}), 
-                    '13652': (u'tr', {u'class':u'row', u'valign':u'top'}), 
-                    '13655': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '13658': (u'span', {u'class': u'field-content'}), 
-                    '4162': (u'span', {u'class':u'small'}), 
-                    '10124': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '16026': (u'table', {u'bordercolor': u'#373367', u'style': u'border: thin; border-left-width: thin; border-right: none;', u'cellspacing': u'1', u'align': u'center', u'width': u'100%', u'cellpadding': u'2', u'border': u'0'}), 
-                    '19747': (u'tr', {u'class': u'ms-rteTableOddRow-1'}), 
-                    '19921': (u'div', {u'id': u'tier2content'}), 
-                    '16750': (u'h3', {u'class': u'post-title entry-title'}), 
-                    '19253': (u'div', {u'class': u'Item_Content'}), 
-                    '16754': (u'div', {u'class': u'main_content'}), 
-                    '19251': (u'div', {u'id': u'ctl00_UtilityControl_Panel1', u'class': u'body'}), 
-                    '17371': (u'div', {u'id': u'content'}), 
-                    '19258': (u'div', {u'class': u'blog'}), 
-                    '17374': (u'p', {u'class': u'articleTitle'}), 
-                    '21136': (u'div', {u'class': u'list-item'}), 
-                    '7242': (u'li', {u'id': u'news_article_16883', u'class': u'document-row'}), 
-                    '7241': (u'table', {u'class': u'tble maxwidth'}), 
-                    '21884': (u'div', {u'id': u'content'}), 
-                    '19636': (u'div', {u'id': u'content'}), 
-                    '19633': (u'div', {u'id': u'content'}), 
-                    '16118': (u'div', {u'id': u'mainContent', u'class': u'mainContent'}), 
-                    '19639': (u'li', {u'class': u'normal'}), 
-                    '21642': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_ctl00_ctl01_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_ctl00_ctl01__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '21643': (u'div', {u'id': u'content'}), 
-                    '7814': (u'span', {u'class': u'bluelinks'}), 
-                    '21641': (u'td', {u'align': u'left', u'class': u'content', u'valign': u'top'}), 
-                    '7812': (u'div', {u'class': u'post-head'}), 
-                    '7813': (u'div', {u'class': u'mainColumn'}), 
-                    '21644': (u'div', {u'class': u'content_left_column'}), 
-                    '7811': (u'div', {u'id': u'content'}), 
-                    '21648': (u'div', {u'id': u'recent-posts', u'class': u'widget widget_recent_entries'}), 
-                    '21868': (u'div', {u'class': u'content'}), 
-                    '21080': (u'div', {u'id': u'content'}), 
-                    '21082': (u'div', {u'style': u'padding-left:4px;', u'id': u'quicklinks_part2', u'class': u'content'}), 
-                    '16378': (u'div', {u'id': u'content'}), 
-                    '4575': (u'div', {u'style': u'background-color: #CCBAA5; position: relative; left: 0px; top: -5px; width: 791px; padding-top: 0px; padding-left: 10px; padding-right: 10px; margin: 0px;', u'align': u'left'}), 
-                    '4577': (u'div', {u'id': u'block_first'}), 
-                    '19814': (u'div', {u'class': u'grid_1 abstract-with-image'}), 
-                    '16375': (u'div', {u'class': u'content'}), 
-                    '19816': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'border': u'0', u'class': u'archiveList'}), 
-                    '16370': (u'p', {u'class': u'news'}), 
-                    '3651': (u'p', {u'class': u'MsoNormal'}), 
-                    '16373': (u'td', {u'width': u'100%', u'class': u'contentheading'}), 
-                    '11665': (u'span', {u'class': u'date'}), 
-                    '11664': (u'td', {u'width': u'700', u'align': u'left', u'class': u'content', u'valign': u'top'}), 
-                    '11661': (u'td', {u'width': u'619', u'align': u'left', u'class': u'text', u'valign': u'top'}), 
-                    '2529': (u'table', {u'class': u'newsRecord'}), 
-                    '5064': (u'td', {u'class': u'content'}), 
-                    '20607': (u'p', {u'class': u'date'}), 
-                    '20608': (u'table', {u'cellpadding': u'0', u'border': u'0', u'cellspacing': u'0', u'class': u'tablol', u'width': u'100%'}), 
-                    '5069': (u'div', {u'class': u'body'}), 
-                    '1820': (u'div', {u'class': u'middle-content-article'}), 
-                    '4975': (u'div', {u'class': u'entry-content'}), 
-                    '4972': (u'span', {u'class': u'scrollArea'}), 
-                    '20936': (u'table', {u'cellpadding': u'10', u'border': u'0', u'cellspacing': u'0', u'width': u'390'}), 
-                    '1926': (u'ul', {u'class': u'elements'}), 
-                    '14053': (u'div', {u'class': u'item link-item bullet'}), 
-                    '17175': (u'div', {u'class': u'entry-content'}), 
-                    '18972': (u'p', {u'class': u'title no_pbreak'}), 
-                    '18974': (u'font', {u'color':u'#999999'}), 
-                    '20592': (u'div', {u'id': u'content-middle'}), 
-                    '493': (u'strong', {None:None}), 
-                    '18992': (u'a', {u'id': u'dnn_ctr874_viewNukeNews_ctl00_dlArchive_ctl00_hypShowArchiveMonth', u'class': u'archivedisplaymonthlink'}), 
-                    '7021': (u'span', {u'style': u'font-size:10pt; padding-left:3px;', u'class': u'normlink'}), 
-                    '15369': (u'div', {u'class': u'content'}), 
-                    '10228': (u'div', {u'id': u'content'}), 
-                    '7026': (u'div', {u'id': u'ctl00_ContentPlaceHolder1_ContentBlock1'}), 
-                    '7025': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '7024': (u'span', {u'class': u'eoe'}), 
-                    '3311': (u'span', {u'class': u'rsHeadline'}), 
-                    '3310': (u'div', {u'class': u'CollapsiblePanelContent'}), 
-                    '7029': (u'div', {u'class': u'SideNav_Content_Section'}), 
-                    '5484': (u'div', {u'class': u'date'}), 
-                    '5247': (u'div', {u'role': u'main', u'class': u'content'}), 
-                    '7020': (u'div', {u'style': u'width: 70%; padding-right: 20px; float: left; border-right: #a0c3df 1px solid'}), 
-                    '15836': (u'div', {u'id': u'content'}), 
-                    '15838': (u'div', {u'id': u'mainContent'}), 
-                    '15124': (u'div', {u'id': u'maincontent'}), 
-                    '18196': (u'td', {u'class': u'articleContentCell'}), 
-                    '18192': (u'div', {u'id': u'content'}), 
-                    '18190': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '6476': (u'div', {u'style': u'padding-top:60px;', u'id': u'content'}), 
-                    '20335': (u'div', {u'id': u'node-830', u'class': u'node node-press-release node-promoted node-teaser clearfix'}), 
-                    '20334': (u'div', {u'class': u'jamod module', u'id': u'Mod33'}), 
-                    '7028': (u'div', {u'class': u'blog_body'}), 
-                    '21965': (u'li', {u'id': u'news_article_201414', u'class': u'document-row'}), 
-                    '21964': (u'li', {u'id': u'news_article_201168', u'class': u'document-row'}), 
-                    '2619': (u'div', {u'id': u'main'}), 
-                    '508': (u'b', {None: None}), 
-                    '506': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '504': (u'a', {u'id':True}), 
-                    '505': (u'b', {None: None}), 
-                    '502': (u'div', {u'class':u'textWrappedAroundImage clearfix'}), 
-                    '500': (u'b', {None: None}), 
-                    '501': (u'b', {None: None}), 
-                    '633': (u'div', {u'class': u'recordsContainer'}), 
-                    '637': (u'div', {u'id': u'content'}), 
-                    '15011': (u'div', {u'id': u'content'}), 
-                    '4376': (u'div', {u'id': u'center'}), 
-                    '6595': (u'div', {u'role': u'main', u'class': u'col col12 introduction'}), 
-                    '2891': (u'div', {u'id': u'awt-content-area'}), 
-                    '14546': (u'div', {u'id': u'content'}), 
-                    '16355': (u'td', {u'width': u'100%', u'class': u'contentheading'}), 
-                    '17897': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '4081': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'2'}), 
-                    '3869': (u'body', {u'bgcolor': u'#FFFFFF', u'vlink': u'#663366', u'link': u'#003399', u'marginwidth': u'0', u'topmargin': u'0', u'alink': u'#666633', u'text': u'#000000', u'marginheight': u'0', u'leftmargin': u'0'}), 
-                    '13344': (u'div', {u'id': u'content'}), 
-                    '4086': (u'div', {u'id': u'mainContent'}), 
-                    '4088': (u'div', {u'id': u'content', u'class': u'clear'}), 
-                    '4089': (u'div', {u'class': u'PT1Column'}), 
-                    '3867': (u'ul', {None: None}), 
-                    '3864': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'border': u'0', u'summary': u'Design Table'}), 
-                    '13349': (u'div', {u'class': u'date'}), 
-                    '19139': (u'li', {u'class': u'latestnews'}), 
-                    '15305': (u'li', {u'style': u'background: none; padding-top: 5px; padding-left: 0px;'}), 
-                    '15307': (u'div', {u'class': u'content'}), 
-                    '16456': (u'p', {u'class': u'MsoNormal'}), 
-                    '21970': (u'li', {u'id': u'news_article_199757', u'class': u'document-row'}), 
-                    '3917': (u'td', {u'colspan': u'2', u'align': u'left', u'valign': u'top', u'width': u'769'}), 
-                    '19485': (u'div', {u'id': u'content'}), 
-                    '8084': (u'div', {u'id': u'column3'}), 
-                    '4151': (u'span', {u'class': u'date'}), 
-                    '4155': (u'p', {u'align': u'center', u'style': u'TEXT-ALIGN: center', u'class': u'MsoNormal'}), 
-                    '4159': (u'div', {u'id': u'content'}), 
-                    '5996': (u'div', {u'class': u'middle_content'}), 
-                    '19262': (u'ul', {u'class': u'contentItemList'}), 
-                    '19261': (u'span', {u'class': u'date'}), 
-                    '19266': (u'span', {u'class': u'subtitle'}), 
-                    '19268': (u'div', {u'id': u'content'}), 
-                    '19796': (u'div', {u'id': u'content'}), 
-                    '19794': (u'div', {u'id': u'main'}), 
-                    '19798': (u'div', {u'id': u'content'}), 
-                    '21816': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'2', u'id': u'Table5'}), 
-                    '19641': (u'a', {u'class': u'normal'}), 
-                    '19640': (u'p', {u'class': u'MsoNormal'}), 
-                    '19315': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'width': u'100%'}), 
-                    '19642': (u'li', {u'id': u'news_article_202132', u'class': u'document-row'}), 
-                    '19312': (u'div', {u'id': u'cmsbody'}), 
-                    '19310': (u'strong', {None:None}), 
-                    '19649': (u'li', {u'id': u'news_article_202305', u'class': u'document-row'}), 
-                    '21679': (u'div', {u'class': u'body_right_mid_inner_but'}), 
-                    '21678': (u'p', {u'style': u'MARGIN: 0in 0in 0pt; mso-layout-grid-align: none', u'class': u'MsoNormal'}), 
-                    '21677': (u'div', {u'id': u'mainContent'}), 
-                    '21676': (u'div', {u'class': u'content'}), 
-                    '21673': (u'h1', {u'class': u'post-title'}), 
-                    '21670': (u'div', {u'class': u'AnnouncementHeadline'}), 
-                    '6685': (u'table', {u'class': u'monthlyIndex'}), 
-                    '6050': (u'p', {u'style': u'margin-top: 0;'}), 
-                    '19861': (u'div', {u'class': u'post-details'}), 
-                    '19860': (u'td', {u'colspan': u'2', u'class': u'search', u'valign': u'top'}), 
-                    '19863': (u'h1', {u'class': u'entry-title'}), 
-                    '3644': (u'div', {u'id': u'content'}), 
-                    '6022': (u'td', {u'valign': u'top', u'class': u's4-wpcell-plain', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '21989': (u'p', {u'class': u'date'}), 
-                    '12789': (u'div', {u'class': u'svSyndLocal svFeed svIndex clearfix ', u'id': u'sysLatestNews'}), 
-                    '12788': (u'div', {u'class': u'goingon-content'}), 
-                    '17369': (u'div', {u'class': u'left w-doublenarrow'}), 
-                    '20612': (u'div', {u'style': u'padding-bottom:20px; padding-top:10px'}), 
-                    '20611': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'0', u'border': u'0'}), 
-                    '20618': (u'p', {u'class': u'MsoNormal'}), 
-                    '21219': (u'div', {u'class': u'views-field-created-1'}), 
-                    '17809': (u'p', {u'class': u'MsoNormal'}), 
-                    '9149': (u'div', {u'class': u'style5'}), 
-                    '17148': (u'div', {u'id': u'mainContent', u'class': u'left'}), 
-                    '17145': (u'p', {u'class': u'MsoNormal', u'normal': u'normal'}), 
-                    '21212': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '17413': (u'div', {u'class': u'event', u'id': u'content_div_16225'}), 
-                    '17410': (u'div', {u'class': u'articleSummary'}), 
-                    '17143': (u'tr', {u'class': u'exsmalltext'}), 
-                    '21188': (u'td', {u'width': u'100%', u'class': u'contentheading'}), 
-                    '16780': (u'div', {u'id': u'content-container-site'}), 
-                    '4082': (u'div', {u'id': u'content'}), 
-                    '6065': (u'div', {u'id': u'fragment-1A', u'class': u'ui-tabs-panel'}), 
-                    '6066': (u'div', {u'id': u'content', u'class': u'grid_8  content'}), 
-                    '6068': (u'ul', {u'class': u'spotlight'}), 
-                    '6069': (u'table', {u'class': u'local_table', u'summary': u'Listing of all business meetings for 2013 with one row for each meeting with links for agenda, minutes, transcript and backup materials for that meeting when each of those items is available.'}), 
-                    '14048': (u'div', {u'style': u'margin-right:10px;', u'id': u'printContent'}), 
-                    '13356': (u'div', {u'class': u'content-holder'}), 
-                    '3265': (u'div', {u'class': u'item i0 a0'}), 
-                    '1935': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '3268': (u'div', {u'class': u'customappText', u'id': u'pt-portlet-content-113392'}), 
-                    '20239': (u'span', {u'class': u'date'}), 
-                    '21694': (u'div', {u'id': u'content'}), 
-                    '21691': (u'div', {u'id': u'main-content'}), 
-                    '21690': (u'a', {u'class': u'newstitle'}), 
-                    '21693': (u'div', {u'id': u'content'}), 
-                    '21692': (u'table', {u'border': u'0', u'align': u'center', u'width': u'100%', u'background': u'/includes/images/layout/bannerbar-deep-blue-bg.gif', u'cellpadding': u'0', u'cellspacing': u'0'}), 
-                    '9195': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '18219': (u'div', {u'class': u'article_preview'}), 
-                    '17173': (u'td', {u'class': u'content', u'valign': u'top'}), 
-                    '18217': (u'table', {u'id': u'dataTable'}), 
-                    '17172': (u'td', {u'colspan': u'2', u'id': u'contentCell', u'valign': u'top'}), 
-                    '10252': (u'div', {u'id': u'main-content'}), 
-                    '10257': (u'div', {u'class': u'content'}), 
-                    '18690': (u'div', {u'id': u'mainContent2'}), 
-                    '18692': (u'a', {u'style': u'text-decoration: none; color: #000099;', u'onmouseover': u"this.style.color='#990000'", u'onmouseout': u"this.style.color='#000099'", u'class': u'BigLink'}), 
-                    '18695': (u'div', {u'class': u'newscontent'}), 
-                    '18698': (u'div', {u'id': u'pr-list'}), 
-                    '1737': (u'ul', {u'class': u'elements'}), 
-                    '15800': (u'table', {u'cellpadding': u'0', u'border': u'0', u'cellspacing': u'0', u'width': u'100%'}), 
-                    '2958': (u'b', {None: None}), 
-                    '15791': (u'div', {u'id': u'dnn_ctr8560_HtmlModule_lblContent', u'class': u'Normal'}), 
-                    '2955': (u'b', {None: None}), 
-                    '20326': (u'div', {u'id': u'recent-posts-3', u'class': u'widget widget_recent_entries'}), 
-                    '6143': (u'div', {u'id': u'mainBody'}), 
-                    '20322': (u'td', {u'width': u'443', u'height': u'260', u'bgcolor': u'#FFFFFF', u'valign': u'top'}), 
-                    '20323': (u'div', {u'class': u'entry-content'}), 
-                    '20321': (u'div', {u'class': u'news-list-item'}), 
-                    '391': (u'b', {None: None}), 
-                    '20329': (u'p', {u'class': u'maintext'}), 
-                    '21033': (u'td', {u'style': u'line-height:14px;padding:9px 9px 9px 9px;font-size:12px;font-family:arial;color:#333333', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '4369': (u'div', {u'class': u'item intro'}), 
-                    '13967': (u'article', {u'class': u'post'}), 
-                    '3108': (u'tr', {u'sizcache': u'47', u'align': u'left', u'sizset': u'81', u'valign': u'top'}), 
-                    '3104': (u'div', {u'id': u'tcontent1', u'class': u'tabcontent'}), 
-                    '3106': (u'div', {u'class': u'main_content'}), 
-                    '3100': (u'div', {u'class': u'content_left_column'}), 
-                    '3101': (u'table', {u'style': u'width: 100%', u'class': u'underline', u'summary': u'Statewide press releases by topic and date of release.'}), 
-                    '4090': (u'div', {u'class': u'item intro'}), 
-                    '488': (u'item', {None:None}), 
-                    '486': (u'b', {None: None}), 
-                    '485': (u'b', {None: None}), 
-                    '484': (u'b', {None: None}), 
-                    '481': (u'b', {None: None}), 
-                    '13750': (u'div', {u'class': u'press_item'}), 
-                    '15371': (u'td', {u'width': u'616', u'align': u'left', u'valign': u'top', u'colspan': u'2'}), 
-                    '15370': (u'td', {u'id': u'MSOZoneCell_WebPartWPQ1', u'valign': u'top'}), 
-                    '15373': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'2', u'width': u'100%'}), 
-                    '15375': (u'table', {u'cellpadding': u'0', u'border': u'0', u'style': u'table-layout:fixed;width:430px', u'cellspacing': u'0'}), 
-                    '15374': (u'font', {u'size': u'1'}), 
-                    '1803': (u'div', {u'class': u'middle-content-article'}), 
-                    '19491': (u'div', {u'id': u'mainContent'}), 
-                    '19496': (u'div', {u'id': u'main-content', u'class': u's-c-x'}), 
-                    '3925': (u'div', {u'id': u'mainContent'}), 
-                    '19499': (u'tr', {u'class': u'cat-list-row0'}), 
-                    '9860': (u'a', {u'class': u'PressReleaseTitle'}), 
-                    '11269': (u'div', {u'id': u'content'}), 
-                    '11268': (u'a', {u'class': u'shl1'}), 
-                    '5826': (u'a', {u'class': u'bodylinks', u'target': u'_new'}), 
-                    '4144': (u'p', {u'class': u'readMoreLink'}), 
-                    '11267': (u'ul', {u'class': u'commonListing'}), 
-                    '11266': (u'ul', {u'class': u'releasesAll'}), 
-                    '4143': (u'td', {u'class':u'promotedTitle'}),
-                    '3859': (u'p', {u'style': u'WIDTH: 421px;PADDING-RIGHT:5px; MARGIN-TOP: 1px; PADDING-LEFT: 2px; FLOAT: left; PADDING-BOTTOM: 10px; TEXT-ALIGN: left; WORD-WRAP: break-word', u'class': u'text10pt'}), 
-                    '19278': (u'p', {u'class': u'series'}), 
-                    '16772': (u'div', {u'style': u'margin: 1em 1em 3em 1em;', u'id': u'jelly'}), 
-                    '16773': (u'div', {u'id': u'content', u'class': u'column'}), 
-                    '19270': (u'div', {u'class': u'content'}), 
-                    '19271': (u'div', {u'class': u'content'}), 
-                    '19273': (u'p', {u'class': u'date'}), 
-                    '19788': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '19789': (u'span', {u'class': u'small_title'}), 
-                    '19785': (u'div', {u'class': u'TitleDateBriefLink'}), 
-                    '19786': (u'ul', {u'class': u'pressRelease'}), 
-                    '6658': (u'table', {u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '6654': (u'td', {u'style': u'width:100%; vertical-align:top'}), 
-                    '6652': (u'ul', {u'id': u'documentList'}), 
-                    '19301': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '19650': (u'div', {u'id': u'contentContainer', u'class': u'column3'}), 
-                    '19305': (u'div', {u'class': u'date'}), 
-                    '19306': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first clearfix'}), 
-                    '19308': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '19309': (u'ul', {u'class': u'sf_newsList'}), 
-                    '5917': (u'div', {u'id': u'WebWrapper'}), 
-                    '5912': (u'h2', {u'class':u'storyspacer'}), 
-                    '21668': (u'div', {u'id': u'dnn_ctr393_ModuleContent', u'class': u'DNNModuleContent ModAdvancedArticlesC'}), 
-                    '21660': (u'div', {u'id': u'contNews100'}), 
-                    '21661': (u'div', {u'id': u'center'}), 
-                    '21662': (u'div', {u'id': u'main_renditje'}), 
-                    '17554': (u'div', {u'class': u'text'}), 
-                    '21664': (u'b', {None:None}),
-                    '4556': (u'div', {u'id': u'pageHeader', u'class': u'mainColumn'}), 
-                    '3670': (u'div', {u'style': u'', u'allowdelete': u'false', u'haspers': u'false', u'id': u'WebPartWPQ2', u'width': u'100%', u'class': u'ms-WPBody', u'webpartid': u'2a9c1b1a-1350-4426-a639-df3aaff4216f'}), 
-                    '3675': (u'div', {u'class': u'middle-content-article'}), 
-                    '19841': (u'div', {u'class': u'linkkilaatikko big vasen-clear'}), 
-                    '17239': (u'div', {u'id': u'levelcontentmain'}), 
-                    '17314': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '12792': (u'div', {u'style': u'display:none', u'class': u'accordion_body'}), 
-                    '12791': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_htmlContent_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_htmlContent__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '10331': (u'span', {u'class': u'field-content'}), 
-                    '10335': (u'p', {u'class': u'date'}), 
-                    '20623': (u'div', {u'class': u'darkbox'}), 
-                    '20622': (u'div', {u'class': u'postContentWrap  fullWidthPosts'}), 
-                    '16950': (u'div', {u'id': u'mmhideSjdcContent'}), 
-                    '16404': (u'div', {u'id': u'centercolumn'}), 
-                    '16953': (u'div', {u'class':u'itemWrapper clearfix'}), 
-                    '21200': (u'div', {u'class': u'feature-entry'}), 
-                    '19848': (u'div', {u'class': u'news_item'}), 
-                    '7905': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'border': u'0', u'class': u'nosortable', u'id': u'ctl00_MainBody_NewsView'}), 
-                    '21204': (u'p', {u'id': u'radETempNode'}), 
-                    '6271': (u'div', {u'class': u'TabbedPanelsContent'}), 
-                    '21192': (u'article', {u'class': u'newsArticle'}), 
-                    '21196': (u'div', {u'id': u'centercol'}), 
-                    '6077': (u'td', {u'align': u'LEFT', u'class': u'ucopstyle'}), 
-                    '4958': (u'p', {u'class': u'issue'}), 
-                    '6072': (u'div', {u'id': u'middle_column'}), 
-                    '6070': (u'table', {u'class': u'local_table', u'summary': u'Listing of all business meetings for 2013 with one row for each meeting with links for agenda, minutes, transcript and backup materials for that meeting when each of those items is available.'}), 
-                    '6079': (u'div', {u'style': u'margin-bottom:25px;', u'class': u'margintop10'}), 
-                    '2617': (u'div', {u'class': u'body'}), 
-                    '20489': (u'span', {u'class': u'field-content'}), 
-                    '2614': (u'div', {u'class': u'entry-content'}), 
-                    '2613': (u'td', {u'class': u'lefttabcontent'}), 
-                    '2612': (u'div', {u'id': u'content'}), 
-                    '20487': (u'div', {u'id': u'content', u'class': u'section col '}), 
-                    '20486': (u'div', {u'id': u'content'}), 
-                    '20485': (u'b', {None:None}), 
-                    '3294': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'1', u'id': u'homefeaturestable', u'height': u'100%'}), 
-                    '3296': (u'div', {u'id': u'dnn_ctr2667_ModuleContent', u'class': u'DNNModuleContent ModAdvancedArticlesSatelliteC'}), 
-                    '1905': (u'div', {u'class': u'middle-content-article'}), 
-                    '17049': (u'p', {u'align': u'left', u'class': u'pad'}), 
-                    '1903': (u'ul', {u'class': u'elements'}), 
-                    '7348': (u'h3', {u'class': u'article-title contentheading '}), 
-                    '21687': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '21684': (u'font', {u'color': u'0073aa', u'face': u'verdana', u'size': u'1'}), 
-                    '21683': (u'font', {u'face': u'Arial,Helvetica,sans-serif', u'class': u'f9', u'size': u'2'}), 
-                    '21680': (u'td', {None:None}), 
-                    '19728': (u'div', {u'class': u'contentArea'}), 
-                    '19960': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'3'}), 
-                    '21688': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'summary': u'Table for layout purposes', u'border': u'0', u'width': u'100%'}), 
-                    '3863': (u'div', {u'id': u'main'}), 
-                    '14964': (u'td', {u'width': u'619', u'align': u'left', u'class': u'text', u'valign': u'top'}), 
-                    '14149': (u'div', {u'class': u'sfnewsListItem'}), 
-                    '10242': (u'div', {u'id': u'main-content'}), 
-                    '10245': (u'div', {u'id': u'mainContent'}), 
-                    '18687': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'1'}), 
-                    '18689': (u'span', {u'class': u'newsdate'}), 
-                    '15818': (u'div', {u'class': u'content'}), 
-                    '15812': (u'span', {u'class': u'field-content'}), 
-                    '15814': (u'div', {u'style': u'border-bottom: #000000 1px dotted; padding-bottom: 10px;'}), 
-                    '15815': (u'div', {u'class': u'news-list-item'}), 
-                    '15816': (u'div', {u'id': u'mainContent'}), 
-                    '15817': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'class': u'center_align_content'}), 
-                    '15143': (u'div', {u'class': u'newsdate'}), 
-                    '15141': (u'ul', {u'id': u'newsHome'}), 
-                    '15780': (u'div', {u'id': u'content'}), 
-                    '15783': (u'a', {u'id': u'GridView1_link_0'}), 
-                    '3067': (u'ul', {u'class': u'get_posts_class'}), 
-                    '2948': (u'b', {None: None}), 
-                    '2947': (u'strong', {None:None}), 
-                    '2946': (u'b', {None: None}), 
-                    '2945': (u'b', {None: None}), 
-                    '17948': (u'div', {u'role': u'main', u'class': u'clearfloat otpp-cws-layout-col-3-main otpp-cws-content', u'id': u'main-content'}), 
-                    '2940': (u'b', {None: None}), 
-                    '1695': (u'div', {u'class': u'middle-content-article'}), 
-                    '1698': (u'div', {u'class': u'middle-content-article'}), 
-                    '4311': (u'div', {u'id': u'content'}), 
-                    '615': (u'div', {u'class': u'recordsContainer'}), 
-                    '15562': (u'div', {u'class': u'content'}), 
-                    '15967': (u'body', {u'bgcolor': u'#FFFFFF', u'marginheight': u'0', u'link': u'#448122', u'marginwidth': u'0', u'topmargin': u'0', u'alink': u'#999933', u'text': u'#000000', u'vlink': u'#999933', u'leftmargin': u'0'}), 
-                    '8427': (u'div', {u'id': u'news-title1', u'style': u'width: 100%;'}), 
-                    '21944': (u'div', {u'id': u'content'}), 
-                    '498': (u'b', {None: None}), 
-                    '13938': (u'div', {u'id': u'ContentDiv'}), 
-                    '6142': (u'div', {u'id': u'mainBody'}), 
-                    '490': (u'b', {None: None}), 
-                    '4223': (u'div', {u'id': u'content'}), 
-                    '6478': (u'div', {u'id': u'mainContent'}), 
-                    '5580': (u'div', {u'id': u'mainBody'}), 
-                    '15362': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '6472': (u'div', {u'id': u'awt-content-area'}), 
-                    '6471': (u'div', {u'id': u'awt-content-area'}), 
-                    '15367': (u'table', {u'border': u'0', u'align': u'center', u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0', u'class': u'TableBodyBG'}), 
-                    '6474': (u'div', {u'class': u'news-summary'}), 
-                    '20634': (u'div', {u'class': u'article-excerpt'}), 
-                    '19461': (u'div', {u'class': u'pressRelease'}), 
-                    '19460': (u'div', {u'id': u'content', u'class': u'column'}), 
-                    '20635': (u'td', {u'width': u'10%', u'align': u'right', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '13689': (u'div', {u'style': u'vertical-align: top', u'id': u'main'}), 
-                    '11270': (u'div', {u'id': u'listdiv'}), 
-                    '13683': (u'div', {u'id': u'content', u'class': u'normalWidth center'}), 
-                    '6714': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'cellspacing': u'2'}), 
-                    '13680': (u'div', {u'class': u'newsHeadline'}), 
-                    '4138': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_ctl00_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_ctl00__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '4139': (u'table', {u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '19856': (u'table', {u'class': u'inc_show_article_index'}), 
-                    '12530': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'class': u'mainnav'}), 
-                    '4130': (u'li', {None:None}),
-                    '4131': (u'div', {u'class': u'PRlist'}), 
-                    '4134': (u'div', {u'id': u'content'}), 
-                    '4136': (u'div', {u'id': u'news', u'class': u'tabdiv'}), 
-                    '4137': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'border': u'0', u'id': u'PageHeader', u'width': u'100%'}), 
-                    '3840': (u'div', {u'class': u'view-content'}), 
-                    '3843': (u'div', {u'class': u'content'}), 
-                    '7918': (u'article', {u'role': u'article'}), 
-                    '3845': (u'div', {u'class': u'c_content'}), 
-                    '3847': (u'td', {u'valign': u'top', u'class': u'ms-bodyareaframe', u'height': u'100%'}), 
-                    '3849': (u'span', {u'class': u'date'}), 
-                    '3915': (u'td', {u'width': u'390', u'align': u'left', u'valign': u'top', u'bgcolor': u'#FFFFFF'}), 
-                    '16090': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '16544': (u'p', {u'style': u'margin-top: 0;'}), 
-                    '4044': (u'table', {u'bordercolor': u'#111111', u'width': u'100%', u'border': u'0', u'cellpadding': u'2', u'id': u'FeatureTable'}), 
-                    '6668': (u'div', {u'class': u'item intro'}), 
-                    '4041': (u'div', {u'id': u'ctl00_ctl00_PlaceHolderMain_PlaceHolderMain_ctl01_ctl01__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '6661': (u'td', {u'width': u'100%', u'valign': u'top', u'bgcolor': u'#FFFFFF'}), 
-                    '4049': (u'div', {u'id': u'content'}), 
-                    '5585': (u'font', {u'size': u'2', u'face': u'Arial'}), 
-                    '19668': (u'tr', {u'class': u'sectiontableentry1'}), 
-                    '19667': (u'div', {u'class': u'content'}), 
-                    '19665': (u'div', {u'align': u'center', u'class': u'content'}), 
-                    '19662': (u'table', {u'class': u'detailTable detailTable_full'}), 
-                    '19846': (u'div', {u'id': u'mainContent'}), 
-                    '19845': (u'span', {u'class': u'field-content'}), 
-                    '16321': (u'div', {u'class':u'news_teaser'}), 
-                    '19840': (u'div', {u'id': u'content-press'}), 
-                    '3668': (u'a', {u'class': u'contenttype-news-item state-published url'}), 
-                    '19849': (u'h2', {u'class': u'newsHeadline'}), 
-                    '17231': (u'div', {u'id': u'nsubleftrightin'}), 
-                    '19685': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'border': u'0', u'width': u'100%'}), 
-                    '19687': (u'div', {u'style': u'text-align:center; '}), 
-                    '19681': (u'div', {u'class': u'content'}), 
-                    '19680': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '21053': (u'div', {u'id': u'mainContent'}), 
-                    '21052': (u'div', {u'id': u'main-content'}), 
-                    '21051': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'class': u'media-news'}), 
-                    '21050': (u'td', {u'width': u'520', u'align': u'left', u'height': u'230', u'class': u'background_white', u'valign': u'top'}), 
-                    '19689': (u'body', {u'onload': u"MM_preloadImages('/website/ws_en/images/bottom01_.gif','/website/ws_en/images/bottom02_.gif','/website/ws_en/images/bottom03_.gif','/website/ws_en/images/bottom04_.gif','/website/ws_en/images/bottom05_.gif','/website/ws_en/images/bottom06_.gif','/website/ws_en/images/go_.gif','/website/ws_en/images/but01_.gif','/website/ws_en/images/but02_.gif','/website/ws_en/images/but03_.gif','/website/ws_en/images/but04_.gif','/website/ws_en/images/but05_.gif','/website/ws_en/images/but06_.gif','/website/ws_en/images/but07_.gif','/website/ws_en/images/but08_.gif','/website/ws_en/images/but09_.gif','/website/ws_en/images/but10_.gif','/website/ws_en/images/but_sim_.gif','/website/ws_en/images/but_trad_text_.gif','/website/ws_en/images/but_eng_.gif','/website/ws_en/images/but_print_.gif')", u'topmargin': u'0', u'text': u'#000000', u'bgcolor': u'#FFFFFF', u'marginwidth': u'0', u'marginheight': u'0', u'leftmargin': u'0'}), 
-                    '21056': (u'td', {u'colspan': u'2', u'valign': u'top'}), 
-                    '21055': (u'table', {u'cellpadding': u'5', u'border': u'0', u'cellspacing': u'1', u'width': u'100%'}), 
-                    '17304': (u'section', {u'data-ga-module': u'featuredContentItemDetail', u'class': u'featured-content-detail'}), 
-                    '11455': (u'font', {u'color': u'#003300', u'size': u'2', u'face': u'verdana, arial, geneva, helvetica, san serif'}), 
-                    '21945': (u'span', {u'class': u'field-content'}), 
-                    '17435': (u'div', {u'class': u'post-content media-release'}), 
-                    '17436': (u'div', {u'class': u'wmt_col_layout'}), 
-                    '10307': (u'a', {u'class': u'lnkHmNewsSecondary'}), 
-                    '17438': (u'div', {u'id': u'main'}), 
-                    '17439': (u'div', {u'class': u'content'}), 
-                    '4436': (u'table', {u'bordercolor': u'#333399', u'width': u'100%', u'border': u'1', u'id': u'table15'}), 
-                    '7912': (u'tr', {u'class': u'first'}), 
-                    '17125': (u'div', {u'id': u'content'}), 
-                    '2118': (u'ul', {u'id': u'documentList'}), 
-                    '2119': (u'ul', {u'id': u'documentList'}), 
-                    '6047': (u'div', {u'id': u'ctl01_mainContent_ctl00_divContent'}), 
-                    '2111': (u'ul', {u'id': u'documentList'}), 
-                    '2112': (u'ul', {u'id': u'documentList'}), 
-                    '6049': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '2115': (u'ul', {u'id': u'documentList'}), 
-                    '2117': (u'ul', {u'id': u'documentList'}), 
-                    '20124': (u'span', {u'class':u'itemname'}), 
-                    '4152': (u'span', {u'class': u'date'}), 
-                    '2620': (u'div', {u'id': u'mainTabs'}), 
-                    '20949': (u'div', {u'class': u'sub_left_blog'}), 
-                    '2626': (u'td', {u'width': u'94%', u'align': u'center', u'valign': u'top'}), 
-                    '2627': (u'div', {u'id': u'main', u'class': u'grid_16'}), 
-                    '20123': (u'span', {u'class': u'date'}), 
-                    '20942': (u'div', {u'id': u'content', u'class': u'col-full'}), 
-                    '20941': (u'div', {u'id': u'content'}), 
-                    '20944': (u'div', {u'id': u'content'}), 
-                    '20945': (u'span', {u'style':u'font-size:10;color:000000'}),
-                    '3288': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'class': u'fileListing', u'width': u'100%'}), 
-                    '10013': (u'div', {u'class': u'date'}), 
-                    '1913': (u'div', {u'class': u'middle-content-article'}), 
-                    '6048': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '6483': (u'td', {u'style': u'width:467px;height:10px', u'class': u'std_pop_box_sub_td '}), 
-                    '13218': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '2755': (u'table', {u'cellpadding': u'3', u'border': u'0', u'cellspacing': u'0', u'bgcolor': u'#E0E0E0'}), 
-                    '4012': (u'table', {u'cellspacing': u'0', u'id': u'dgReleases'}), 
-                    '2758': (u'div', {u'class': u'body'}), 
-                    '10271': (u'div', {u'id': u'content'}), 
-                    '2621': (u'div', {u'class': u'newsArticle'}), 
-                    '14152': (u'div', {u'id': u'content', u'class': u'left'}), 
-                    '14150': (u'ul', {u'class': u'stripwp'}), 
-                    '20490': (u'div', {u'id': u'hpcontentboxmid'}), 
-                    '20493': (u'span', {u'class': u'field-content'}), 
-                    '773': (u'div', {u'align': u'left', u'id': u'int-left'}), 
-                    '15174': (u'div', {u'class': u'text'}), 
-                    '15170': (u'div', {u'class': u'newsHeader'}), 
-                    '20215': (u'div', {u'id': u'content'}), 
-                    '7104': (u'div', {u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_ctl00__ControlWrapper_RichHtmlField'}), 
-                    '17936': (u'div', {u'class': u'item intro'}), 
-                    '2971': (u'item', {None:None}), 
-                    '1681': (u'div', {u'class': u'middle-content-article'}), 
-                    '1687': (u'div', {u'class': u'middle-content-article'}), 
-                    '4305': (u'td', {u'id': u'SectionContent', u'valign': u'top'}), 
-                    '4304': (u'div', {u'class': u'newsBody clearfix'}), 
-                    '4308': (u'td', {u'valign': u'top', u'class': u's4-wpcell-plain', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '19737': (u'td', {u'class': u'content'}), 
-                    '9234': (u'div', {u'class': u'asset-header'}), 
-                    '17849': (u'div', {u'style': u'font-size:115%', u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '17848': (u'item', {None:None}), 
-                    '17844': (u'div', {u'id': u'mainContentWrapper'}), 
-                    '17847': (u'div', {u'style': u'font-size:115%', u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '17846': (u'div', {u'style': u'font-size:115%', u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '17843': (u'td', {u'colspan': u'3', u'align': u'left', u'valign': u'top', u'bgcolor': u'#EFF0EF', u'height': u'74'}), 
-                    '17842': (u'div', {u'style': u'font-size:115%', u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '8431': (u'table', {u'cellpadding': u'5', u'cellspacing': u'0', u'border': u'0', u'id': u'ctl00_ContentCenter_grdNews'}), 
-                    '4239': (u'div', {u'id': u'content'}), 
-                    '5597': (u'table', {u'cellpadding': u'4', u'width': u'645', u'border': u'0', u'cellspacing': u'0'}), 
-                    '13366': (u'div', {u'class': u'body'}), 
-                    '18841': (u'span', {u'class': u'pr_text'}), 
-                    '7720': (u'a', {u'id': u'pageContent_rptSearchResults_hypTitleLink_0'}), 
-                    '7722': (u'div', {u'role': u'main', u'id': u'content', u'class': u'container clearfix'}), 
-                    '13696': (u'td', {u'width': u'615', u'height': u'400', u'class': u'textstyle1', u'bgcolor': u'#FFFFFF', u'valign': u'top'}), 
-                    '13697': (u'table', {u'border': u'0', u'align': u'center', u'width': u'100%', u'cellpadding': u'2', u'cellspacing': u'0', u'class': u'netsubmenu'}), 
-                    '13690': (u'div', {u'id': u'content'}), 
-                    '13691': (u'table', {u'bordercolor': u'Gainsboro', u'id': u'ReleaseListTable'}), 
-                    '13692': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'border': u'0', u'class': u'MenuStatic ctl00_ctl00_horizMenu_4', u'width': u'100%'}), 
-                    '19479': (u'div', {u'class': u'content'}), 
-                    '313': (u'b', {None: None}), 
-                    '312': (u'b', {None: None}), 
-                    '19474': (u'table', {u'cellpadding': u'4', u'border': u'0', u'cellspacing': u'1', u'class': u'body', u'width': u'100%'}), 
-                    '19472': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '19473': (u'div', {u'class': u'item link-item'}), 
-                    '315': (u'b', {None: None}), 
-                    '314': (u'b', {None: None}), 
-                    '11203': (u'div', {u'id': u'content'}), 
-                    '6703': (u'div', {u'id': u'current'}), 
-                    '4129': (u'span', {u'class': u'date'}), 
-                    '4128': (u'ul', {u'style': u'width: 590px'}), 
-                    '4120': (u'p', {u'class': u'date'}), 
-                    '2751': (u'span', {u'class': u'date'}), 
-                    '16087': (u'table', {u'cellpadding': u'0', u'border': u'0', u'cellspacing': u'0', u'width': u'882'}), 
-                    '13746': (u'td', {u'width': u'515', u'align': u'left', u'class': u'Body1Col', u'valign': u'top'}), 
-                    '13744': (u'td', {u'style': u'padding-top:10px; padding-bottom:10px;'}), 
-                    '13745': (u'ul', {u'class': u'sf_newsList'}), 
-                    '4052': (u'div', {u'class': u'item intro'}), 
-                    '18106': (u'p', {u'class': u'MsoNormal'}), 
-                    '16151': (u'td', {u'align': u'right', u'nowrap': u'nowrap', u'id': u'cphBody_gvPressReleases_emptyCell', u'valign': u'top'}), 
-                    '19674': (u'td', {u'class': u'content'}), 
-                    '19676': (u'select', {u'id': u'list_2013', u'class': u'select-pdf'}), 
-                    '19677': (u'table', {u'cellpadding': u'2', u'border': u'0', u'cellspacing': u'0', u'width': u'100%'}), 
-                    '7070': (u'div', {u'id': u'content'}), 
-                    '19504': (u'span', {u'class': u'date'}), 
-                    '19505': (u'div', {u'id': u'main-content', u'class': u's-c-x'}), 
-                    '19854': (u'div', {u'id': u'mainContent'}), 
-                    '19503': (u'span', {u'class': u'subtitle'}), 
-                    '19500': (u'p', {u'style': u'MARGIN: 0cm 0cm 0pt', u'class': u'MsoNormal'}), 
-                    '19501': (u'div', {u'class': u'clearfix', u'id': u'content'}), 
-                    '16338': (u'li', {u'class': u'smal'}), 
-                    '17207': (u'div', {u'id': u'main'}), 
-                    '21049': (u'span', {u'class': u'field-content'}), 
-                    '19509': (u'div', {u'id': u'main'}), 
-                    '19696': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '19697': (u'div', {u'id': u'mainContent', u'class': u'mainContent'}), 
-                    '19694': (u'div', {u'id': u'main'}), 
-                    '19695': (u'table', {u'cellpadding': u'2', u'width': u'90%', u'border': u'0', u'cellspacing': u'2'}), 
-                    '19693': (u'td', {u'class':u'newslink', u'width':u'78%'}),
-                    '19690': (u'table', {u'cellpadding': u'0', u'cellspacing': u'0', u'class': u'altbg table_width_2', u'summary': u'Hong Kong Customs and Excise Department - Press Releases'}), 
-                    '13639': (u'div', {u'id': u'content'}), 
-                    '19699': (u'div', {u'class': u'date'}), 
-                    '19643': (u'li', {u'id': u'news_article_201265', u'class': u'document-row'}), 
-                    '11421': (u'div', {u'id': u'mainContent'}), 
-                    '11420': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'2', u'summary': u'This table holds the footer for floridadisaster.org'}), 
-                    '17335': (u'div', {u'id': u'content'}), 
-                    '17442': (u'p', {u'style': u'line-height: 150%', u'class': u'MsoNormal'}), 
-                    '7295': (u'td', {u'width': u'100%', u'height': u'300', u'colspan': u'2', u'valign': u'top'}), 
-                    '5021': (u'tr', {u'class': u'cat-list-row0'}), 
-                    '19646': (u'li', {u'id': u'news_article_201043', u'class': u'document-row'}), 
-                    '21958': (u'li', {u'id': u'news_article_201152', u'class': u'document-row'}), 
-                    '17118': (u'span', {u'class': u'date'}), 
-                    '1860': (u'div', {u'class': u'postExcerpt firstPost'}), 
-                    '13353': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '16429': (u'h4', {u'class': u'contentheading'}), 
-                    '17680': (u'div', {u'role': u'main', u'class': u'contentArea'}), 
-                    '13359': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '17688': (u'span', {u'class': u'field-content'}), 
-                    '2109': (u'ul', {u'id': u'documentList'}), 
-                    '6059': (u'div', {u'id': u'dnn_ctr6042_ModuleContent', u'class': u'DNNModuleContent ModDNNHTMLC'}), 
-                    '6056': (u'div', {u'id': u'middle_column'}), 
-                    '6501': (u'td', {u'class': u'left_links'}), 
-                    '20800': (u'a', {u'target': u'_blank'}), 
-                    '6500': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_htmlContent_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_htmlContent__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '10000': (u'div', {u'class': u'content'}), 
-                    '20797': (u'h1', {u'class': u'post-title'}), 
-                    '20790': (u'tr', {u'class': u'row-1 row-first'}), 
-                    '17593': (u'div', {u'id': u'main'}), 
-                    '17592': (u'div', {u'id': u'uc-content', u'class': u'uc-section content'}), 
-                    '17591': (u'b', {None:None}),
-                    '17590': (u'div', {u'class': u'story_achieve'}), 
-                    '17595': (u'div', {u'id': u'content'}), 
-                    '17594': (u'div', {u'class': u'content', u'id': u'col_right'}), 
-                    '17599': (u'div', {u'id': u'content'}), 
-                    '5218': (u'ul', {u'id': u'Navigation'}), 
-                    '2039': (u'table', {u'width': u'100%', u'id': u'ctl00_contentMain_tblNewsArchive'}), 
-                    '2038': (u'div', {u'id': u'content'}), 
-                    '3231': (u'div', {u'style': u'display:block;overflow:hidden', u'class': u'view'}), 
-                    '3237': (u'ul', {u'class': u'hoverlinks'}), 
-                    '21558': (u'ul', {u'id': u'documentList'}), 
-                    '21559': (u'ul', {u'id': u'documentList'}), 
-                    '3235': (u'table', {u'bordercolor': u'White', u'bgcolor': u'White', u'rules': u'all', u'cellspacing': u'0', u'width': u'100%', u'border': u'0', u'id': u'ctl00_ContentPlaceHolder1_dgPRList'}), 
-                    '20974': (u'span', {u'class': u'field-content'}), 
-                    '20973': (u'li', {u'class': u'margin-t-0 clearfix'}), 
-                    '20972': (u'td', {u'style': u'padding-right: 13px; padding-left: 13px; padding-top: 5px', u'class': u'blueMainTitle'}), 
-                    '2965': (u'b', {None: None}), 
-                    '1789': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '2966': (u'b', {None: None}), 
-                    '11195': (u'span', {u'class': u'field-content'}), 
-                    '2960': (u'div', {u'class':u'textWrappedAroundImage clearfix'}), 
-                    '2963': (u'b', {None: None}), 
-                    '2962': (u'b', {None: None}), 
-                    '1780': (u'div', {u'class': u'middle-content-article'}), 
-                    '1783': (u'div', {u'class': u'middle-content-article'}), 
-                    '2969': (u'b', {None: None}), 
-                    '15767': (u'div', {u'id': u'ph_master_content_0_UpdatePanel1'}), 
-                    '18225': (u'p', {u'class': u'MsoNormal'}), 
-                    '1674': (u'div', {u'class': u'middle-content-article', u'id': u'middle-content-article'}), 
-                    '1671': (u'ul', {u'class': u'elements'}), 
-                    '4442': (u'div', {u'class': u'news-item'}), 
-                    '3135': (u'div', {u'class': u'newsdate'}), 
-                    '20203': (u'div', {u'id': u'ctl00_ctl00_mainContent_oneColumnContent_up1'}), 
-                    '17852': (u'div', {u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '17850': (u'div', {u'style': u'font-size:115%', u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '17851': (u'div', {u'style': u'font-size:115%', u'id': u'lreleaseID', u'class': u'leftrightdiv'}), 
-                    '6451': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'class': u'newsIndexPrimary'}), 
-                    '6450': (u'td', {u'class': u'emph'}), 
-                    '15342': (u'div', {u'class': u'content'}), 
-                    '15343': (u'div', {u'class': u'content'}), 
-                    '15344': (u'font', {u'size': u'1'}), 
-                    '6900': (u'span', {u'class': u'field-content'}), 
-                    '13911': (u'div', {u'class': u'date'}), 
-                    '5569': (u'div', {u'id': u'main-content'}), 
-                    '1522': (u'div', {u'class': u'icontent'}), 
-                    '308': (u'b', {None: None}), 
-                    '19449': (u'div', {u'id': u'news'}), 
-                    '19448': (u'div', {u'id': u'global-content'}), 
-                    '303': (u'b', {None: None}), 
-                    '19446': (u'div', {u'class': u'ArchiveEntry'}), 
-                    '306': (u'b', {None: None}), 
-                    '19444': (u'div', {u'class': u'leftGray'}), 
-                    '4118': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '6600': (u'div', {u'class': u'date'}), 
-                    '6608': (u'div', {u'id': u'content'}), 
-                    '4060': (u'div', {u'id': u'subContent'}), 
-                    '13770': (u'div', {u'class': u'content'}), 
-                    '4066': (u'td', {u'valign': u'top', u'class': u's4-wpcell-plain', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '13776': (u'tr', {u'bgcolor': u'DBE9F6'}), 
-                    '4065': (u'table', {u'cellpadding': u'0', u'border': u'0', u'summary': u'Table for layout purposes', u'cellspacing': u'0', u'width': u'100%'}), 
-                    '2772': (u'table', {u'border': u'0', u'xmlns:z': u'#RowsetSchema', u'width': u'100%', u'cellpadding': u'2', u'cellspacing': u'0', u'xmlns:ddwrt2': u'urn:frontpage:internal'}), 
-                    '21031': (u'div', {u'class': u'list_item'}), 
-                    '19532': (u'tr', {u'class': u'highlight'}), 
-                    '19531': (u'div', {u'class': u'bulletins  bulletins_main'}), 
-                    '21035': (u'td', {u'width': u'28%', u'align': u'left', u'class': u'paddingH10 paddingV8 tableContent', u'valign': u'top'}), 
-                    '21034': (u'li', {u'style': u'line-height:1.4; padding-bottom:10px; list-style:disc; list-style-position:inside'}), 
-                    '21036': (u'ul', {u'class': u'pressList'}), 
-                    '16631': (u'div', {u'id': u'mainColumnContent'}), 
-                    '7069': (u'span', {u'class': u'date'}), 
-                    '21218': (u'div', {u'id': u'content'}), 
-                    '6115': (u'td', {u'id': u'MSOZoneCell_WebPartWPQ1', u'valign': u'top'}), 
-                    '20062': (u'div', {u'id': u'content'}), 
-                    '17325': (u'div', {u'class': u'box_content_floater'}), 
-                    '11434': (u'td', {u'bgcolor': u'#FFFFFF', u'style': u'padding-top:4px;', u'valign': u'top'}), 
-                    '21963': (u'li', {u'id': u'news_article_193379', u'class': u'document-row'}), 
-                    '21962': (u'li', {u'id': u'news_article_202327', u'class': u'document-row'}), 
-                    '17450': (u'div', {u'class': u'content'}), 
-                    '21967': (u'li', {u'id': u'news_article_201934', u'class': u'document-row'}), 
-                    '21966': (u'li', {u'id': u'news_article_202196', u'class': u'document-row'}), 
-                    '17454': (u'p', {u'class': u'news'}), 
-                    '7936': (u'div', {u'class': u'page-content'}), 
-                    '21969': (u'li', {u'id': u'news_article_198415', u'class': u'document-row'}), 
-                    '21968': (u'li', {u'id': u'news_article_199809', u'class': u'document-row'}), 
-                    '10677': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '16458': (u'div', {u'id': u'content'}), 
-                    '17693': (u'div', {u'class': u'article courseRow  cat2013'}), 
-                    '13346': (u'td', {u'class': u'vertDotLft padLft20 paddTop20', u'valign': u'top'}), 
-                    '13347': (u'div', {u'style': u'clear: both;'}), 
-                    '17696': (u'table', {u'cellpadding': u'3', u'border': u'1'}), 
-                    '17697': (u'div', {u'id': u'content'}), 
-                    '3734': (u'span', {u'class': u'field-content'}), 
-                    '3733': (u'span', {u'class': u'field-content'}), 
-                    '16984': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '12292': (u'table', {u'cellpadding': u'3', u'border': u'1', u'cellspacing': u'0', u'width': u'100%', u'summary': u'Layout table for 2013 ACRS Full Committee Meetings'}), 
-                    '17215': (u'div', {u'class': u'text'}), 
-                    '21814': (u'ul', {u'class': u'sf_newsList'}), 
-                    '17210': (u'div', {u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_Html1__ControlWrapper_RichHtmlField'}), 
-                    '20812': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'class': u'welcome'}), 
-                    '17411': (u'div', {u'class': u'maincontent fullwidth nobackground'}), 
-                    '6025': (u'table', {u'cellpadding': u'0', u'width': u'596', u'border': u'0', u'cellspacing': u'0', u'align': u'left'}), 
-                    '20816': (u'div', {u'id': u'main'}), 
-                    '20142': (u'div', {u'class': u'content'}), 
-                    '5165': (u'td', {u'colspan': u'2', u'valign': u'top', u'width': u'800'}), 
-                    '10076': (u'div', {u'class': u'content'}), 
-                    '2642': (u'div', {u'class': u'c_content'}), 
-                    '14005': (u'div', {u'class': u'content'}), 
-                    '21368': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '20785': (u'div', {u'id': u'main'}), 
-                    '21361': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '21363': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '17077': (u'tr', {u'class': u'snbListContent'}), 
-                    '21366': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '17588': (u'span', {u'class': u'news-title'}), 
-                    '17585': (u'div', {u'id': u'content'}), 
-                    '17587': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '17580': (u'ul', {u'class': u'children'}), 
-                    '2006': (u'div', {u'class': u'content_blue'}), 
-                    '2007': (u'td', {u'class': u'ResolutionDescriptionWidth'}), 
-                    '4859': (u'div', {u'class': u'NPTableLine'}), 
-                    '21764': (u'span', {u'class': u'field-content'}), 
-                    '21766': (u'div', {u'class': u'page-content'}), 
-                    '21761': (u'td', {u'bgcolor': u'#FFFFFF', u'align': u'left', u'class': u'buttons', u'valign': u'top'}), 
-                    '21760': (u'div', {u'class': u'et_pt_blogentry clearfix'}), 
-                    '21762': (u'td', {u'class': u'pr_title'}), 
-                    '18673': (u'span', {u'class': u'field-content'}), 
-                    '11183': (u'div', {u'id': u'content'}), 
-                    '18670': (u'td', {u'style': u'padding:0px 60px 0px 50px;', u'class': u'title'}), 
-                    '18677': (u'div', {u'id': u'main'}), 
-                    '18676': (u'ul', {u'class': u'listnews'}), 
-                    '18675': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0', u'summary': u'News Releases'}), 
-                    '18674': (u'div', {u'id': u'pressRoomRowB'}), 
-                    '18678': (u'span', {u'class': u'copyitalic'}), 
-                    '7128': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0'}), 
-                    '15754': (u'div', {u'class': u'page-content'}), 
-                    '20859': (u'div', {u'class': u'nine phone-three columns'}), 
-                    '1662': (u'div', {u'class': u'middle-content-article'}), 
-                    '1660': (u'div', {u'class': u'middle-content-article'}), 
-                    '15532': (u'div', {u'id': u'content'}), 
-                    '4321': (u'div', {u'class': u'item intro'}), 
-                    '4322': (u'div', {u'id':u'Related Links'}), 
-                    '13761': (u'tr', {u'bgcolor': u'FAF6EF', u'valign': u'top'}), 
-                    '2820': (u'div', {u'class': u'entry-content'}), 
-                    '3386': (u'b', {None: None}), 
-                    '3384': (u'b', {None: None}), 
-                    '3385': (u'b', {None: None}), 
-                    '3382': (u'b', {None: None}), 
-                    '3383': (u'b', {None: None}), 
-                    '3389': (u'b', {None: None}), 
-                    '4217': (u'div', {u'style': u'Z-INDEX: 5;', u'id': u'content'}), 
-                    '4211': (u'p', {u'style': u'text-align: justify; margin: 0in 0in 0pt', u'class': u'MsoNormal'}), 
-                    '4218': (u'div', {u'style': u'Z-INDEX: 5;', u'id': u'content'}), 
-                    '6931': (u'span', {u'class': u'date'}), 
-                    '18102': (u'span', {u'class': u'field-content'}), 
-                    '9849': (u'span', {u'class': u'date'}), 
-                    '7704': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '19026': (u'ul', {u'class': u'newsitems'}), 
-                    '7702': (u'div', {u'class': u'content'}), 
-                    '3090': (u'div', {u'id': u'center'}), 
-                    '3091': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0', u'border': u'0', u'height': u'82%'}), 
-                    '3096': (u'div', {u'class': u'contentArea'}), 
-                    '3094': (u'div', {u'id': u'middle_column'}), 
-                    '3099': (u'div', {u'class': u'contentarea'}), 
-                    '15683': (u'div', {u'id': u'content'}), 
-                    '4103': (u'div', {u'id': u'dnn_ctr444_ModuleContent', u'class': u'DNNModuleContent ModDNNHTMLC'}), 
-                    '4109': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '4108': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'cellspacing': u'0'}), 
-                    '14779': (u'div', {u'class': u'postArchive'}), 
-                    '15246': (u'div', {u'class': u'kco-box'}), 
-                    '16749': (u'div', {u'id': u'middle_column'}), 
-                    '3893': (u'span', {u'class': u'style45'}), 
-                    '3895': (u'div', {u'class': u'homeNews', u'id': u'bodyNews'}), 
-                    '17341': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '5952': (u'tr', {u'style': u'background-color: #ffffff;'}), 
-                    '4078': (u'span', {u'class': u'field-content'}), 
-                    '4075': (u'font', {u'color': u'#FFFFFF', u'face': u'Arial', u'size': u'2'}), 
-                    '4074': (u'div', {u'class': u'tab-content'}), 
-                    '4077': (u'td', {u'height': u'591', u'valign': u'top'}), 
-                    '4070': (u'table', {u'rules': u'all', u'cellspacing': u'0', u'class': u'listcomponent', u'summary': u'Mayor Lee News Page', u'border': u'0', u'id': u'ctl00_listDataGrid'}), 
-                    '3966': (u'p', {u'class': u'date'}), 
-                    '3967': (u'div', {u'style': u'padding-top:10px;', u'id': u'primary', u'class': u'content'}), 
-                    '19456': (u'div', {u'class':u'ItemTitle'}), 
-                    '19451': (u'div', {u'id': u'content'}), 
-                    '19452': (u'div', {u'id': u'content'}), 
-                    '19453': (u'li', {None:None}), 
-                    '19458': (u'li', {u'class': u'dateTitle'}), 
-                    '19459': (u'td', {u'class': u'listTitleCell'}), 
-                    '21023': (u'span', {u'class': u'MainbodyLinks'}), 
-                    '19526': (u'tr', {u'class': u'sectiontableentry1'}), 
-                    '19520': (u'span', {u'class': u'field-content'}), 
-                    '3630': (u'div', {u'class': u'contentBox-lftNav'}), 
-                    '16624': (u'li', {u'id': u'news_article_105635', u'class': u'document-row'}), 
-                    '16191': (u'div', {u'class': u'articleAll'}), 
-                    '16621': (u'div', {u'id': u'content'}), 
-                    '11405': (u'li', {u'class': u'sfnewsListItem clearfix'}), 
-                    '11400': (u'div', {u'id': u'content', u'class': u'sidebar-right twelve columns blog blog-large'}), 
-                    '6105': (u'div', {u'class': u'accordion_content fullwidth'}), 
-                    '16623': (u'ul', {u'class': u'latest-list'}), 
-                    '19234': (u'table', {u'cellpadding': u'2', u'width': u'99%', u'style': u'clear:both;background-color:#E5E5E5;border:1px solid #3F8FDF;', u'border': u'0', u'cellspacing': u'1'}), 
-                    '17467': (u'table', {u'width': u'100%', u'border': u'0', u'summary': u'Headlines'}), 
-                    '17465': (u'div', {u'class': u'something'}), 
-                    '17464': (u'div', {u'class': u'content'}), 
-                    '16998': (u'div', {u'id': u'content'}), 
-                    '21971': (u'li', {u'id': u'news_article_201687', u'class': u'document-row'}), 
-                    '17668': (u'td', {u'bgcolor': u'#FFFFFF', u'height': u'400', u'class': u'textstyle1', u'valign': u'top'}), 
-                    '13375': (u'div', {u'id': u'content'}), 
-                    '13374': (u'div', {u'id': u'content'}), 
-                    '18845': (u'div', {u'class': u'post-title-section fix'}), 
-                    '6108': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '4660': (u'div', {u'id': u'content', u'class': u'generalList singleColumn grid_9'}), 
-                    '21801': (u'div', {u'id': u'content'}), 
-                    '21805': (u'div', {u'class': u'col_content press'}), 
-                    '21807': (u'table', {u'style': u'width: 723px;'}), 
-                    '9205': (u'div', {u'class': u'page-content', u'id': u'content'}), 
-                    '15351': (u'div', {u'id': u'mainContent', u'class': u'main column clearfix'}), 
-                    '5178': (u'table', {u'id': u'ctl00_ContentPlaceHolder1_tblPressReleases'}), 
-                    '21373': (u'body', {u'topmargin': u'0', u'text': u'#000000', u'bgcolor': u'#FFFFFF', u'marginwidth': u'0', u'background': u'../../images/menu_background.gif', u'marginheight': u'0', u'leftmargin': u'0'}), 
-                    '21371': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '21376': (u'div', {u'class': u'date'}), 
-                    '21377': (u'div', {u'id': u'content'}), 
-                    '17007': (u'p', {u'style': u'margin-bottom:0in;margin-bottom:.0001pt;line-height:\r\nnormal', u'class': u'MsoNormal'}), 
-                    '20772': (u'td', {u'class': u'contentheading'}), 
-                    '6320': (u'ul', {u'type': u'square'}), 
-                    '14106': (u'div', {u'class': u'contentColumn'}), 
-                    '17715': (u'div', {u'class': u'news_item hentry'}), 
-                    '17717': (u'dd', {u'class': u'date'}), 
-                    '17713': (u'span', {u'class': u'field-content'}), 
-                    '17712': (u'div', {u'class': u'list-post'}), 
-                    '20511': (u'p', {u'style': u'margin-top: 0;', u'class': u'pageheader'}), 
-                    '17719': (u'div', {u'id': u'main-content'}), 
-                    '17485': (u'h2', {u'data-neon-onthispage': u'false'}), 
-                    '17480': (u'div', {u'id': u'content_div_42812'}), 
-                    '18669': (u'table', {u'bordercolor': u'#FFFFFF', u'border': u'1', u'summary': u'Top navigation bar', u'width': u'100%', u'cellpadding': u'2', u'cellspacing': u'2'}), 
-                    '6859': (u'div', {u'id': u'main', u'class': u'grid-block'}), 
-                    '20425': (u'span', {u'class': u'field-content'}), 
-                    '7138': (u'div', {u'id': u'main', u'class': u'clearfix'}), 
-                    '7132': (u'div', {u'id': u'center', u'class': u'column'}), 
-                    '7136': (u'div', {u'id': u'main', u'class': u'clearfix'}), 
-                    '20193': (u'div', {u'class': u'TabbedPanelsContent'}), 
-                    '18242': (u'li', {u'style': u'padding-bottom:5px;padding-top:5px'}), 
-                    '18243': (u'td', {u'onkeyup': u'WpKeyUp(event)', u'valign': u'top', u'class': u's4-wpcell', u'onmouseup': u'WpClick(event)', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '18241': (u'div', {u'id': u'ctl00_PlaceHolderMain_ctl01__ControlWrapper_RichHtmlField'}), 
-                    '14923': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'10'}), 
-                    '18244': (u'div', {u'id': u'mainContent'}), 
-                    '20877': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '1653': (u'div', {u'class': u'middle-content-article'}), 
-                    '1650': (u'div', {u'class': u'middle-content-article'}), 
-                    '18249': (u'div', {u'class': u'content'}), 
-                    '1654': (u'ul', {u'class': u'elements'}), 
-                    '17508': (u'span', {u'class': u'date'}), 
-                    '17879': (u'div', {u'id': u'awt-content-area'}), 
-                    '3391': (u'b', {None: None}), 
-                    '3390': (u'b', {None: None}), 
-                    '3393': (u'b', {None: None}), 
-                    '3392': (u'b', {None: None}), 
-                    '3395': (u'b', {None: None}), 
-                    '20226': (u'p', {u'class': u'date'}), 
-                    '20224': (u'table', {u'style': u'width:100%; border:0px', u'border': u'0', u'cellpadding': u'0', u'cellspacing': u'0', u'dir': u'ltr'}), 
-                    '14726': (u'div', {u'class': u'post-title-section fix'}), 
-                    '4260': (u'table', {u'id': u'list'}), 
-                    '4261': (u'table', {u'id': u'list'}), 
-                    '4263': (u'h4', {u'class': u'contentheading'}), 
-                    '18114': (u'li', {u'style': u'padding-bottom:5px;padding-top:5px'}), 
-                    '15410': (u'div', {u'class': u'mainMiddle'}), 
-                    '15412': (u'div', {u'id': u'main-content', u'class': u'x-c-x'}), 
-                    '14434': (u'article', {u'class': u'node node-aiche-press-release teaser', u'id': u'node-aiche-press-release-126376'}), 
-                    '7712': (u'div', {u'class':u'bill-shorten'}), 
-                    '7714': (u'div', {u'role': u'main', u'id': u'content', u'class': u'container clearfix'}), 
-                    '14433': (u'table', {u'bordercolor': u'#111111', u'style': u'border-collapse: collapse', u'border': u'0', u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0'}), 
-                    '14432': (u'tr', {u'bgcolor': u'#EAF2FF'}), 
-                    '7719': (u'div', {u'id': u'content'}), 
-                    '7718': (u'p', {None:None}), 
-                    '14439': (u'div', {u'class': u'mainColumn'}), 
-                    '3089': (u'div', {u'class': u'contentBox-lftNav'}), 
-                    '3088': (u'div', {u'id': u'mainContent'}), 
-                    '3941': (u'div', {u'class': u'clearfix', u'id': u'content'}), 
-                    '3087': (u'li', {u'class': u'dblspace'}), 
-                    '3080': (u'table', {u'id': u'onetidDoclibViewTbl0'}), 
-                    '18191': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '5890': (u'div', {u'class': u'page-content'}), 
-                    '5891': (u'p', {u'style': u'margin: 0in 0in 0pt', u'class': u'MsoNormal'}), 
-                    '19470': (u'tr', {u'class': u'sectiontableentry1'}), 
-                    '9197': (u'table', {u'class': u'newsTable'}), 
-                    '19471': (u'div', {u'style': u'border-style:none none solid none; border-width:1px; border-color:#e5e5e5;', u'class': u'item link-item'}), 
-                    '16055': (u'div', {u'id': u'mainContent'}), 
-                    '16057': (u'p', {u'class': u'MsoNormal'}), 
-                    '19736': (u'div', {u'id': u'content'}), 
-                    '19731': (u'div', {u'id': u'psContent'}), 
-                    '19733': (u'td', {u'colspan': u'1', u'style': u'padding: 5px', u'valign': u'top'}), 
-                    '16052': (u'font', {u'size': u'1', u'face': u'Arial'}), 
-                    '20343': (u'span', {u'class': u'field-content'}), 
-                    '17260': (u'h1', {u'class': u'entry-title'}), 
-                    '13711': (u'td', {u'width': u'645', u'height': u'400', u'class': u'textstyle1', u'bgcolor': u'#FFFFFF', u'valign': u'top'}), 
-                    '4001': (u'a', {u'id': u'MainContent_ArchivedChildPages1_ChildPagesRepeater_HyperLink2_0'}), 
-                    '13713': (u'div', {u'class': u'entry-content'}), 
-                    '19421': (u'span', {u'class': u'field-content'}), 
-                    '19423': (u'div', {u'class': u'date'}), 
-                    '3972': (u'div', {u'class': u'content'}), 
-                    '19425': (u'div', {u'id': u'ctl00_MainBodyContent_PreambleContent'}), 
-                    '3974': (u'div', {u'id': u'content'}), 
-                    '19427': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '19429': (u'div', {u'class': u'listing-items-inner'}), 
-                    '19428': (u'div', {u'class': u'entry-content'}), 
-                    '19551': (u'a', {u'class':u'blue13ArialLink'}), 
-                    '21015': (u'p', {u'class': u'newsitem'}), 
-                    '21014': (u'div', {u'style': u'clear: both;'}), 
-                    '21013': (u'div', {u'id': u'content'}), 
-                    '19885': (u'ul', {u'class': u'children'}), 
-                    '16618': (u'div', {u'id': u'contentstart'}), 
-                    '22066': (u'div', {u'id': u'mainContent'}), 
-                    '16614': (u'p', {u'class': u'dateline'}), 
-                    '6138': (u'h4', {u'class': u'article_headline'}), 
-                    '13622': (u'div', {u'id': u'DateNoPadding'}), 
-                    '6133': (u'div', {u'id': u'content'}), 
-                    '10941': (u'div', {u'class': u'archa'}), 
-                    '17470': (u'div', {u'id': u'content_div_723998'}), 
-                    '17471': (u'span', {u'class': u'field-content'}), 
-                    '17473': (u'span', {u'class': u'field-content'}), 
-                    '17475': (u'dl', {u'class': u'list'}), 
-                    '17476': (u'div', {u'id': u'content'}), 
-                    '13369': (u'div', {u'class': u'item'}), 
-                    '21163': (u'div', {u'id': u'bodyContentContainer'}), 
-                    '21162': (u'h3', {u'class': u'entry-title'}), 
-                    '17670': (u'div', {u'class': u'body'}), 
-                    '6006': (u'table', {u'cellpadding': u'4', u'width': u'100%', u'border': u'0', u'id': u'NewsList'}), 
-                    '4903': (u'tr', {u'class': u'odd views-row-first'}), 
-                    '4670': (u'div', {u'align': u'center', u'id': u'main'}), 
-                    '17271': (u'div', {u'id': u'linkitem', u'class': u'item link-item'}), 
-                    '11709': (u'div', {u'id': u'main-content'}), 
-                    '21346': (u'div', {u'style': u'width:99%;', u'id': u'ctl00_m_g_aca4894c_8367_4423_8695_616b7c60e8c8_ctl00_pressGrid', u'class': u'RadGrid RadGrid_Default'}), 
-                    '21344': (u'table', {u'cellpadding': u'0', u'border': u'0', u'cellspacing': u'0', u'class': u'mc-table-stretcher data-matrix'}), 
-                    '20164': (u'div', {u'class': u'newsblock'}), 
-                    '20165': (u'td', {u'width': u'505', u'valign': u'top', u'class': u'bodycopy', u'bgcolor': u'#FFFFFF'}), 
-                    '20166': (u'div', {u'style': u'display: inline;', u'id': u'templatelist-421511365'}), 
-                    '21348': (u'table', {u'border': u'0', u'class': u'main', u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0', u'id': u'main_outer_container'}), 
-                    '3400': (u'td', {u'colspan': u'2', u'valign': u'top'}), 
-                    '3402': (u'body', {u'text': u'#000000', u'bgcolor': u'#FFFFFF'}), 
-                    '3405': (u'body', {u'text': u'#000000', u'bgcolor': u'#FFFFFF'}), 
-                    '3407': (u'body', {u'text': u'#000000', u'bgcolor': u'#FFFFFF'}), 
-                    '3406': (u'body', {u'text': u'#000000', u'bgcolor': u'#FFFFFF'}), 
-                    '3408': (u'body', {u'text': u'#000000', u'bgcolor': u'#FFFFFF'}), 
-                    '16877': (u'div', {u'id': u'content'}), 
-                    '16874': (u'tr', {u'class':u'ms-itmhover'}), 
-                    '12384': (u'div', {u'id': u'content', u'class': u'content'}), 
-                    '12386': (u'div', {u'id': u'main'}), 
-                    '2798': (u'div', {u'style': u'margin-top: 10px;'}), 
-                    '2792': (u'div', {u'id': u'main-content'}), 
-                    '2791': (u'div', {u'class': u'listItemOneBg'}), 
-                    '2796': (u'div', {u'id': u'ArticleContainer', u'class': u'ContentWidth'}), 
-                    '2797': (u'td', {u'align': u'left', u'class': u'newstext'}), 
-                    '2794': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '2795': (u'div', {u'style': u'padding-left: 2px; padding-right: 2px; border-top: 1px gray solid;'}), 
-                    '14112': (u'div', {u'id': u'leftcolumn_0_UserControlDiv'}), 
-                    '14113': (u'h2', {u'class': u'articleTitle'}), 
-                    '14114': (u'div', {u'class': u'issue'}), 
-                    '20509': (u'div', {u'class': u'catItemHeader'}), 
-                    '17700': (u'div', {u'class': u'openclose'}), 
-                    '20505': (u'ul', {u'class': u'whatsNewList'}), 
-                    '21743': (u'div', {u'id': u'content', u'class': u'narrowcolumn'}), 
-                    '21742': (u'div', {u'id': u'main', u'class': u'grid_16'}), 
-                    '21741': (u'div', {u'id': u'main', u'class': u'grid_16'}), 
-                    '19355': (u'div', {u'id': u'body-archive'}), 
-                    '21745': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '7240': (u'ul', {u'class': u'content docs'}), 
-                    '21749': (u'h1', {u'class': u'entry-title'}), 
-                    '21374': (u'table', {u'cellpadding': u'0', u'width': u'100%', u'border': u'0', u'cellspacing': u'0'}), 
-                    '20986': (u'div', {u'class': u'news'}), 
-                    '20985': (u'div', {u'class': u'ja-slidenews-item'}), 
-                    '15733': (u'font', {u'color': u'#990000', u'size': u'3', u'face': u'Arial, Helvetica, sans-serif'}), 
-                    '15735': (u'div', {u'id': u'content'}), 
-                    '2938': (u'b', {None: None}), 
-                    '2936': (u'b', {None: None}), 
-                    '2931': (u'table', {u'bordercolor': u'#ffffff', u'width': u'100%', u'cellspacing': u'0', u'bgcolor': u'#cccccc', u'background': u'', u'cellpadding': u'3', u'border': u'2'}), 
-                    '20340': (u'div', {u'class': u'page-content'}), 
-                    '20342': (u'ul', {u'class': u'archive-list'}), 
-                    '20435': (u'div', {u'class': u'page-content'}), 
-                    '20432': (u'div', {u'id': u'main-content', u'class': u'unitx8'}), 
-                    '14608': (u'div', {u'class': u'container_12', u'id': u'content'}), 
-                    '16122': (u'div', {u'id': u'content', u'class': u'bg0'}), 
-                    '1649': (u'div', {u'class': u'middle-content-article'}), 
-                    '1648': (u'ul', {u'class': u'elements'}), 
-                    '14931': (u'h1', {u'class': u'entry-title'}), 
-                    '15087': (u'div', {u'id': u'news_copy'}), 
-                    '15085': (u'div', {u'id': u'content_body'}), 
-                    '11098': (u'span', {u'class': u'field-content'}), 
-                    '8742': (u'div', {u'id': u'content'}), 
-                    '17803': (u'span', {u'class': u'smallText'}), 
-                    '15648': (u'div', {u'class': u'recent_post_desc'}), 
-                    '2802': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '2803': (u'div', {u'class': u'customappText', u'id': u'pt-portlet-content-112172'}), 
-                    '3164': (u'div', {u'id': u'content_area'}), 
-                    '6493': (u'td', {u'class': u'text_block', u'valign': u'top'}), 
-                    '20233': (u'div', {u'id': u'news'}), 
-                    '4276': (u'div', {u'id': u'main-content'}), 
-                    '1353': (u'div', {u'class': u'text'}), 
-                    '6488': (u'table', {u'style': u'width:100%;height:227px', u'class': u'vfe_table or-rteTable-ShadedRows'}), 
-                    '4054': (u'div', {u'class': u'news-item'}), 
-                    '19285': (u'div', {u'id': u'content', u'class': u'container'}), 
-                    '18128': (u'li', {u'style': u'list-style-type: disc;'}), 
-                    '5559': (u'div', {u'id': u'section_text'}), 
-                    '5558': (u'div', {u'id': u'content'}), 
-                    '11145': (u'div', {u'id': u'mainContent'}), 
-                    '21084': (u'div', {u'id': u'content', u'class': u'standard'}), 
-                    '16048': (u'div', {u'class': u'eluna_pagecomments_comment'}), 
-                    '19729': (u'table', {u'cellpadding': u'5', u'style': u'width:580px;', u'cellspacing': u'1', u'id': u'theTable'}), 
-                    '19724': (u'tr', {u'class': u'ms-rteTableOddRow-1'}), 
-                    '19722': (u'font', {u'size': u'2', u'face': u'Arial'}), 
-                    '19721': (u'table', {u'cellpadding': u'5', u'border': u'0', u'summary': u"This table consists of 2 columns. The first column is 'Subject' and the second column is 'Date'. End of Summary", u'cellspacing': u'1', u'width': u'100%'}), 
-                    '11396': (u'table', {u'cellpadding': u'18', u'width': u'95%', u'border': u'0', u'cellspacing': u'0', u'class': u'middlecolumntext'}), 
-                    '11395': (u'div', {u'class': u'pressRelease'}), 
-                    '11391': (u'div', {u'id': u'content'}), 
-                    '13703': (u'td', {u'bgcolor': u'#FFFFFF', u'align': u'left', u'width': u'166', u'valign': u'top'}), 
-                    '4011': (u'div', {u'style': u'padding-bottom:15px;', u'class': u'newsDetail'}), 
-                    '11265': (u'p', {u'align': u'justify', u'class': u'contentsize'}), 
-                    '4017': (u'td', {u'width': u'660', u'align': u'left', u'valign': u'top'}), 
-                    '4016': (u'td', {u'valign': u'top', u'class': u's4-wpcell-plain', u'id': u'MSOZoneCell_WebPartWPQ1'}), 
-                    '19432': (u'div', {u'class': u'content'}), 
-                    '19430': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '19431': (u'div', {u'id': u'main-content'}), 
-                    '19437': (u'td', {u'class': u'content'}), 
-                    '19439': (u'table', {u'bordercolor': u'#cccccc', u'width': u'100%', u'border': u'1', u'class': u'tbl', u'summary': u'This table lists the news releases for the month'}), 
-                    '21008': (u'div', {u'class': u'mn_article_short'}), 
-                    '21009': (u'div', {u'id': u'content'}), 
-                    '21007': (u'a', {u'id': u'ctl00_phMainBody_phMidCol_rptSummary_ctl01_hplMain', u'class': u'summaryTitleNews'}), 
-                    '6127': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '22079': (u'span', {u'class': u'field-content'}), 
-                    '21040': (u'table', {u'class': u'press-list'}), 
-                    '22077': (u'table', {u'border': u'0', u'summary': u'', u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0', u'class': u'clsControlBorder'}), 
-                    '16335': (u'li', {u'class': u'smal'}), 
-                    '4707': (u'table', {u'cellpadding': u'5', u'width': u'95%', u'align': u'center', u'border': u'0', u'cellspacing': u'0'}), 
-                    '4703': (u'table', {u'class': u'table_media_large'}), 
-                    '4702': (u'table', {u'cellpadding': u'2', u'width': u'95%', u'align': u'center', u'cellspacing': u'4'}), 
-                    '16337': (u'h2', {u'class': u'nyhedsoverskrift'}), 
-                    '4708': (u'table', {u'cellpadding': u'4', u'width': u'95%', u'align': u'center', u'cellspacing': u'4'}), 
-                    '289': (u'b', {None: None}), 
-                    '19858': (u'div', {u'id': u'content'}), 
-                    '283': (u'b', {None: None}), 
-                    '286': (u'p', {u'style': u'color: #336600'}), 
-                    '3752': (u'div', {u'id': u'content'}), 
-                    '21179': (u'td', {u'align': u'left', u'class': u'content', u'valign': u'top'}), 
-                    '17398': (u'div', {u'id': u'content', u'class': u'twocolumn'}), 
-                    '260': (u'b', {None: None}), 
-                    '266': (u'b', {None: None}), 
-                    '269': (u'b', {None: None}), 
-                    '19949': (u'div', {u'id': u'center'}), 
-                    '2498': (u'div', {u'id': u'maincontent'}), 
-                    '13553': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '19896': (u'div', {u'class': u'middle-content-article'}), 
-                    '19890': (u'span', {u'class': u'field-content'}), 
-                    '17248': (u'div', {u'id': u'linkitem', u'class': u'item link-item'}), 
-                    '17244': (u'div', {u'class': u'cont'}), 
-                    '17243': (u'span', {u'class': u'date'}), 
-                    '17240': (u'div', {u'id': u'content', u'class': u'relative'}), 
-                    '21351': (u'table', {u'cellpadding': u'3', u'width': u'100%', u'align': u'center', u'border': u'0', u'cellspacing': u'1'}), 
-                    '21353': (u'table', {u'border': u'0', u'align': u'center', u'width': u'100%', u'cellpadding': u'0', u'cellspacing': u'0', u'class': u'bgcolortop'}), 
-                    '17022': (u'section', {u'id': u'content'}), 
-                    '21359': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '2784': (u'div', {u'id': u'ReleasesPortlet', u'class': u'ReleasesPortlet'}), 
-                    '12396': (u'div', {u'class': u'padding10px lightbluebg'}), 
-                    '16867': (u'div', {u'class': u'NewsItemContainer'}), 
-                    '2789': (u'td', {u'width': u'521', u'valign': u'top'}), 
-                    '10130': (u'h3', {u'class': u'post-title entry-title'}), 
-                    '17731': (u'div', {u'id': u'content'}), 
-                    '21758': (u'item', {None: None}), 
-                    '21759': (u'div', {u'class': u'NewsListItemWrapper'}), 
-                    '21750': (u'div', {u'id': u'main-content', u'class': u'clearfix'}), 
-                    '18945': (u'div', {u'class': u'item intro'}), 
-                    '20403': (u'table', {u'class': u'views-table cols-0'}), 
-                    '5332': (u'span', {u'class': u'date'}), 
-                    '20407': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_Content_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_Content__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '20405': (u'ul', {u'class': u'no_bullets'}), 
-                    '10551': (u'td', {u'style': u'border-style: none', u'valign': u'top', u'class': u'ms-bodyareaframe', u'height': u'100%'}), 
-                    '5338': (u'span', {u'class':u'title_news'}), 
-                    '3215': (u'td', {u'class': u'body-text', u'valign': u'top'}), 
-                    '480': (u'b', {None: None}), 
-                    '18267': (u'div', {u'class': u'loop-entry clearfix'}), 
-                    '2816': (u'div', {u'class': u'middle-left-container'}), 
-                    '2813': (u'div', {u'id': u'awt-content-area'}), 
-                    '2819': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '15657': (u'div', {u'id': u'content'}), 
-                    '17819': (u'div', {u'id': u'content'}), 
-                    '15651': (u'div', {u'id': u'left', u'class': u'left_narrow '}), 
-                    '3379': (u'b', {None: None}), 
-                    '6684': (u'table', {u'class': u'monthlyIndex'}), 
-                    '3374': (u'b', {None: None}), 
-                    '20247': (u'table', {u'rules': u'all', u'cellspacing': u'0', u'border': u'0', u'class': u'listcomponent', u'id': u'ctl00_listDataGrid'}), 
-                    '3370': (u'b', {None: None}), 
-                    '1742': (u'div', {u'class': u'middle-content-article'}), 
-                    '6494': (u'div', {u'class':u'replicant-content'}),
-                    '15387': (u'div', {u'id': u'main', u'class': u'left'}), 
-                    '4248': (u'div', {u'id': u'mainContent'}), 
-                    '6492': (u'div', {u'id': u'ctl00_SPWebPartManager1_g_aa2ff075_273b_469b_9a20_254f2518a628'}), 
-                    '13954': (u'div', {u'class': u'CS_Textblock_Text'}), 
-                    '18135': (u'div', {u'id': u'node-3062-teaser'}), 
-                    '1560': (u'div', {u'class': u'ibody'}), 
-                    '1563': (u'span', {u'class': u'field-content'}), 
-                    '2914': (u'table', {u'style': u'border: #111111;', u'bgcolor': u'#ffffff', u'cellspacing': u'0', u'width': u'100%', u'cellpadding': u'0', u'border': u'0'}), 
-                    '8487': (u'div', {u'class': u'blog'}), 
-                    '8009': (u'span', {u'class': u'font10blackbold'}), 
-                    '8005': (u'tr', {u'class': u'row1'}), 
-                    '2915': (u'p', {u'class': u'events'}), 
-                    '5634': (u'td', {u'id': u'MSOZoneCell_WebPartWPQ1', u'valign': u'top'}), 
-                    '21639': (u'ul', {u'id': u'content_news'}), 
-                    '6549': (u'div', {u'id': u'awt-content-area'}), 
-                    '5633': (u'span', {u'class': u'field-content'}), 
-                    '3196': (u'div', {u'id': u'dnn_ctr2078_ModuleContent', u'class': u'DNNModuleContent ModDNNHTMLC'}), 
-                    '3195': (u'div', {u'style': u'padding:0 10px 10px 10px;'}), 
-                    '3194': (u'li', {u'class': u'NewsListItem'}), 
-                    '1362': (u'div', {u'class': u'text'}), 
-                    '3190': (u'div', {u'class': u'content_left_column'}), 
-                    '478': (u'b', {None: None}), 
-                    '479': (u'b', {None: None}),
-                    '19280': (u'div', {u'class':u'sys_related_feature sys_topborder'}),
-                    '17142': (u'span', {u'id':u'sitefeedtopicheader'}),
-                    '10084': (u'h2', {u'class':u'teaser-title'}),
-                    '17241': (u'div', {u'class':u'EventsCalendarFonts'}),
-                    '9148': (u'div', {u'class':u'itemDescription'}),
-                    '6728': (u'h4', {None:None}),
-                    '17329': (u'div', {u'class':u'news_content'}),
-                    '6229': (u'ul', {u'class':u'leftList'}),
-                    '10550': (u'item', {None:None}),
-                    '15868': (u'div', {u'class':u'newsListRCon'}),
-                    '21772': (u'td', {u'class':u'post_title'}),
-                    '20298': (u'div', {u'class':u'list-content list-content-fullwidth'}),
-                    '7334': (u'item', {None:None}),
-                    '17891': (u'item', {None:None}),
-                    '22024': (u'td', {u'class':u'ZLDNN_ArticleList_Cell'}),
-                    '21117': (u'strong', {None:None}),
-                    '20756': (u'tr', {u'class':u'row-1 row-first'}),
-                    '6790': (u'table', {u'class':u'Block Thumb'}),
-                    '19549': (u'div', {u'class':u'note date'}),
-                    '6397': (u'li', {u'class':u' searchResult publication report news-release report'}),
-                    '20740': (u'a', {u'style':u'text-decoration:none; color:#19355E;'}),
-                    '20822': (u'h3', {None:None}),
-                    '6963': (u'div', {u'id': u'news'}), 
-                    '17228': (u'div', {u'class': u'article_info left'}), 
-                    '20739': (u'div', {u'id': u'center'}), 
-                    '16765': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0'}), 
-                    '13342': (u'div', {u'class': u'entry-content'}), 
-                    '17128': (u'div', {u'id': u'content'}), 
-                    '20406': (u'div', {u'id': u'mainContent', u'class': u'main column'}), 
-                    '16634': (u'div', {u'class': u'content'}), 
-                    '21145': (u'tr', {u'bordercolor': u'#F6F2D6', u'bgcolor': u'#F6F2D6', u'align': u'left', u'valign': u'top'}), 
-                    '20500': (u'div', {u'class': u'listingTitle'}), 
-                    '20408': (u'div', {u'class': u'date'}), 
-                    '5416': (u'span', {u'class': u'field-content'}), 
-                    '21076': (u'div', {u'id': u'content', u'class': u'white'}), 
-                    '15680': (u'ul', {u'class': u'multilist'}), 
-                    '21187': (u'div', {u'id': u'content', u'class': u'base'}), 
-                    '7738': (u'span', {u'class': u'date'}), 
-                    '6997': (u'div', {u'id': u'content'}), 
-                    '15635': (u'p', {u'class': u'MsoNormal'}), 
-                    '6992': (u'div', {u'id': u'ctl00_cColumn_FolderListing1_repListing_ctl00_ctl00_pnlTemplate', u'class': u'item'}), 
-                    '6914': (u'td', {u'align': u'left', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '6731': (u'span', {u'class': u'field-content'}), 
-                    '6401': (u'div', {u'class': u'row news first even'}), 
-                    '19965': (u'p', {u'class': u'date'}), 
-                    '20417': (u'div', {u'class': u'newsBody clearfix'}), 
-                    '20412': (u'div', {u'id':u'ctl00_ctl00_MainContent_cpFrontBox_DropZone1_columnDisplay_ctl00_controlcolumn_ctl00_WidgetHost_updatepanel'}), 
-                    '21097': (u'td', {u'width': u'706', u'align': u'left', u'valign': u'top'}), 
-                    '6400': (u'div', {u'id': u'promo-1489', u'class': u'promo default'}), 
-                    '6399': (u'p', {u'class': u'byline'}), 
-                    '6793': (u'item', {None:None}), 
-                    '6756': (u'div', {u'class': u'IPBodyDivStyle bodycopy'}), 
-                    '20012': (u'div', {u'class': u'content'}), 
-                    '21194': (u'div', {u'class': u'current_press'}), 
-                    '20821': (u'ul', {u'class': u'newsroom'}), 
-                    '17080': (u'a', {u'class': u'title large'}), 
-                    '20822': (u'p', {u'class': u'date'}), 
-                    '20970': (u'tr', {u'class': u'row-1 row-first'}), 
-                    '15813': (u'ul', {u'class': u'jdrf-entries '}), 
-                    '20415': (u'div', {u'id': u'content', u'class': u'clearfix'}), 
-                    '20792': (u'h3', {u'class':u'post-title'}),
-                    '16649': (u'item', {None:None}), 
-                    '16745': (u'div', {u'id': u'content'}), 
-                    '21158': (u'div', {u'id': u'content'}), 
-                    '21159': (u'div', {u'id': u'mainContent'}), 
-                    '8624': (u'table', {u'xmlns:ddwrt': True}), 
-                    '19475': (u'div', {u'id': u'mainContent'}), 
-                    '21161': (u'a', {u'class': u'bold'}), 
-                    '20429': (u'div', {u'class': u'content'}), 
-                    '14328': (u'div', {u'class': u'views-row views-row-1 views-row-odd views-row-first'}), 
-                    '14329': (u'div', {u'id': u'main-content'}), 
-                    '13616': (u'table', {u'cellpadding': u'2', u'width': u'100%', u'border': u'0'}), 
-                    '20251': (u'span', {u'class': u'subtitle'}), 
-                    '13482': (u'div', {u'id': u'ctl00_MainContentPlaceHolder_ContentBlock1'}), 
-                    '20982': (u'font', {u'face': u'Arial', u'size': u'2'}), 
-                    '21228': (u'span', {u'class':u'blackTextLg'}),
-                    '13474': (u'div', {u'id': u'content', u'class': u'trainers-hr'}), 
-                    '14318': (u'item', {None:None}), 
-                    '14330': (u'span', {u'style': u'font-size: x-small;'}), 
-                    '15969': (u'div', {u'id': u'main-content'}), 
-                    '21157': (u'ul', {u'style': u'width:100%', u'class': u'dfwp-column dfwp-list'}), 
-                    '17135': (u'td', {u'id': u'primarycontent', u'valign': u'top'}), 
-                    '14312': (u'div', {u'aria-labelledby': u'ctl00_PlaceHolderMain_Content_label', u'style': u'display:inline', u'id': u'ctl00_PlaceHolderMain_Content__ControlWrapper_RichHtmlField', u'class': u'ms-rtestate-field'}), 
-                    '21072': (u'span', {u'class': u'date'}), 
-                    '9390': (u'span', {u'class': u'field-content'}), 
-                    '13700': (u'span', {u'class': u'subtitle'}), 
-                    '21439': (u'div', {u'class': u'entry-content'}), 
-                    '20807': (u'td', {u'width': u'10%', u'nowrap': u'nowrap', u'valign': u'top'}), 
-                    '20806': (u'div', {u'id': u'dnn_ctr1018_ModuleContent', u'class': u'DNNModuleContent ModDNNHTMLC'}), 
-                    '9223': (u'div', {u'id': u'main_content_body'}), 
-                    '20803': (u'table', {u'class': u'views-table cols-0'}), 
-                    '20801': (u'div', {u'id': u'linkitem', u'class': u'item'}),
-                    '19757': (u'table', {u'class':u'mediatable'}),
-                    '11261': (u'div', {u'id': u'content-centre-right'}),
-                    '19450': (u'div', {u'class':u'content-left-list'}),
-                    '19787': ('item', {None:None}),
-                    '19730': (u'tr', {u'class':u'TLevel3'}),
-                    '6302': (u'ul', {u'class':u'news-list'}),
-                    '11416': (u'span', {u'id':u'dlPressReleases_ctl01_lblTitle'}),
-                    '19855': (u'h3', {u'class':u'title'}),
-                    '21424': (u'p', {None:None}),
-                    '11398': (u'a', {u'target':u'_self'}),
-                    '3216': (u'span', {u'style':u' font-size: medium;'}),
-                    '4013': (u'td', {u'style':u' width: 63%; vertical-align: top; text-align: left;'}),
-                    '4014': (u'td', {u'style':u' text-align: left;'}),
-                    '10137': (u'span', {u'class':u'smital'}),
-                    '11399': (u'li', {u'class':u'views-row views-row-1 views-row-odd views-row-first'}),
-                    '12790': (u'div', {u'id':u'firstcolumn'}),
-                    '18143': (u'td', {u'class':u'c21'}),
-                    '18145': (u'div', {u'class':u'news_item'}),
-                    '18179': (u'td', {u'class':u'paddedbox_datagrid'}),
-                    '10366': ('tr', {'class':'sectiontableentry1'}),
-                    '17041': (u'div', {u'class':u'resultsHeader'}),
-                    '5488': (u'div', {u'class':u'link-item'}),
-                    '6365': (u'ul', {u'class':u'ajaxGrab'}),
-                    '19296': (u'div', {u'id':u'article_body'}),
-                    '6746': (u'div', {u'class':u'Featured'}),
-                    '6120': (u'h2', {u'class':u'node-title'}),
-                }
\ No newline at end of file
+"""
+Archive of the area patterns of the SourceUrls, SourceUrl id -> (tag name,
+attrs), kept for the urls whose tag_* fields are empty
+
+The patterns are stored in tag_archive.json and loaded on first use, see
+websource.selectors for the compiled lookups
+"""
+import json
+import os
+import threading
+
+TAG_ARCHIVE_PATH = os.path.join(os.path.dirname(__file__), 'tag_archive.json')
+
+_tag_dict = None
+_lock = threading.Lock()
+
+
+def get_tag_dict():
+    """
+    returns the {SourceUrl id: (tag name, attrs)} dict, the ids are strings
+    """
+    global _tag_dict
+    if _tag_dict is None:
+        with _lock:
+            if _tag_dict is None:
+                with open(TAG_ARCHIVE_PATH) as f:
+                    _tag_dict = dict((id, (name, attrs)) for id, (name, attrs) in json.load(f).items())
+    return _tag_dict